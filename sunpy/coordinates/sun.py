@@ -163,10 +163,11 @@ def true_longitude(t='now'):
         Time to use in a parse-time-compatible format
     """
     time = parse_time(t)
+    zeros = np.zeros(time.shape)
 
     # Calculate Earth's true geometric longitude and add 180 degrees for the Sun's longitude.
     # This approach is used because Astropy's GeocentricMeanEcliptic includes aberration.
-    earth = SkyCoord(0*u.deg, 0*u.deg, 0*u.AU, frame='gcrs', obstime=time)
+    earth = SkyCoord(zeros*u.deg, zeros*u.deg, zeros*u.AU, frame='gcrs', obstime=time)
     coord = earth.transform_to(HeliocentricMeanEcliptic(equinox=time))
     lon = coord.lon + 180*u.deg
 
@@ -189,7 +190,8 @@ def apparent_longitude(t='now'):
     The nutation model is IAU 2000A nutation with adjustments to match IAU 2006 precession.
     """
     time = parse_time(t)
-    sun = SkyCoord(0*u.deg, 0*u.deg, 0*u.AU, frame='hcrs', obstime=time)
+    zeros = np.zeros(time.shape)
+    sun = SkyCoord(zeros*u.deg, zeros*u.deg, zeros*u.AU, frame='hcrs', obstime=time)
     coord = sun.transform_to(GeocentricMeanEcliptic(equinox=time))
 
     # Astropy's GeocentricMeanEcliptic already includes aberration, so only add nutation
@@ -212,7 +214,8 @@ def true_latitude(t='now'):
         Time to use in a parse-time-compatible format
     """
     time = parse_time(t)
-    sun = SkyCoord(0*u.deg, 0*u.deg, 0*u.AU, frame='hcrs', obstime=time)
+    zeros = np.zeros(time.shape)
+    sun = SkyCoord(zeros*u.deg, zeros*u.deg, zeros*u.AU, frame='hcrs', obstime=time)
     coord = sun.transform_to(GeocentricMeanEcliptic(equinox=time))
 
     # Astropy's GeocentricMeanEcliptic includes aberration from Earth motion, but the contribution
@@ -234,7 +237,8 @@ def apparent_latitude(t='now'):
         Time to use in a parse-time-compatible format
     """
     time = parse_time(t)
-    sun = SkyCoord(0*u.deg, 0*u.deg, 0*u.AU, frame='hcrs', obstime=time)
+    zeros = np.zeros(time.shape)
+    sun = SkyCoord(zeros*u.deg, zeros*u.deg, zeros*u.AU, frame='hcrs', obstime=time)
     coord = sun.transform_to(GeocentricMeanEcliptic(equinox=time))
 
     # Astropy's GeocentricMeanEcliptic does not include nutation, but the contribution is negligible
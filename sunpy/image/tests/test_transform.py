@@ -3,7 +3,7 @@ import pytest
 import skimage.data as images
 from skimage import transform as tf
 
-from sunpy.image.transform import affine_transform
+from sunpy.image.transform import affine_transform, affine_transform_cube
 from sunpy.util import SunpyUserWarning
 
 # Tolerance for tests
@@ -235,3 +235,41 @@ def test_int(identity):
     with pytest.warns(SunpyUserWarning, match='Input data has been cast to float64.'):
         out_arr = affine_transform(in_arr, rmatrix=identity)
     assert np.issubdtype(out_arr.dtype, np.floating)
+
+
+@pytest.mark.parametrize("use_scipy", [False, True])
+def test_cube_per_image_matrices(original, use_scipy):
+    angles = np.radians([10.0, 45.0, -30.0])
+    rmatrices = np.array([[[np.cos(a), -np.sin(a)], [np.sin(a), np.cos(a)]] for a in angles])
+    cube = np.stack([original, original[::-1], original.T])
+    scales = [1.0, 1.5, 0.8]
+
+    result = affine_transform_cube(cube, rmatrices, scale=scales, use_scipy=use_scipy,
+                                   max_workers=2)
+    for i in range(len(cube)):
+        expected = affine_transform(cube[i], rmatrices[i], scale=scales[i], use_scipy=use_scipy)
+        np.testing.assert_array_equal(result[i], expected)
+
+
+def test_cube_shared_matrix_out(original):
+    rmatrix = np.array([[0.0, -1.0], [1.0, 0.0]])
+    cube = np.stack([original, 2 * original])
+    out = np.empty(cube.shape)
+
+    result = affine_transform_cube(cube, rmatrix, order=1, image_center=(200, 300),
+                                   missing=np.nan, out=out)
+    assert result is out
+    for i in range(len(cube)):
+        expected = affine_transform(cube[i], rmatrix, order=1, image_center=(200, 300),
+                                    missing=np.nan)
+        np.testing.assert_array_equal(out[i], expected)
+
+
+def test_cube_invalid(original):
+    with pytest.raises(ValueError):
+        affine_transform_cube(original, np.identity(2))
+    with pytest.raises(ValueError):
+        affine_transform_cube(np.stack([original] * 3), np.stack([np.identity(2)] * 2))
+    with pytest.raises(ValueError):
+        affine_transform_cube(np.stack([original] * 3), np.identity(2),
+                              out=np.empty((3, 2, 2)))
@@ -2,13 +2,15 @@
 Functions for geometrical image transformation and warping.
 """
 import warnings
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import scipy.ndimage.interpolation
 
 from sunpy.util.exceptions import SunpyUserWarning
 
-__all__ = ['affine_transform']
+__all__ = ['affine_transform', 'affine_transform_cube']
 
 
 def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
@@ -74,8 +76,130 @@ def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
     Then optionally it uses a bicubic convolution interpolation
     algorithm to map the original to target pixel values.
     """
+    rmatrix, shift = _transform_parameters(image.shape, rmatrix, scale, image_center, recenter)
+    use_scipy = _check_scipy(use_scipy)
+    tform = None if use_scipy else _skimage_transform(rmatrix, shift)
+    if not use_scipy and not np.issubdtype(image.dtype, np.float64):
+        warnings.warn("Input data has been cast to float64.", SunpyUserWarning)
+
+    return _transform_image(image, rmatrix, shift, tform, order, missing, use_scipy)
+
+
+def affine_transform_cube(images, rmatrix, order=3, scale=1.0, image_center=None,
+                          recenter=False, missing=0.0, use_scipy=False, out=None,
+                          max_workers=None):
+    """
+    Rotates, shifts and scales each image of a stack of images.
+
+    Each image is transformed in the same way as by `affine_transform`, with
+    either the same transformation for all the images or one per image. The
+    images are transformed in parallel threads.
+
+    Parameters
+    ----------
+    images : `numpy.ndarray`
+        3D array of N images of the same shape, with the images along the
+        first axis.
+    rmatrix : `numpy.ndarray`
+        Linear transformation rotation matrix, either 2x2 for all the images or
+        Nx2x2 with one matrix per image.
+    order : `int` 0-5, optional
+        Interpolation order to be used, defaults to 3. See `affine_transform`.
+    scale : `float` or `numpy.ndarray`, optional
+        A scale factor for all the images, or an array of N scale factors.
+        Defaults to no scaling.
+    image_center : array-like, optional
+        The point in the images to rotate around, either one ``(x, y)`` pair
+        for all the images or an array of N pairs. Defaults to the center of
+        the images.
+    recenter : `bool`, optional
+        Move the axis of rotation to the center of the images.
+    missing : `float`, optional
+        The value to replace any missing data after the transformation.
+    use_scipy : `bool`, optional
+        Force use of `scipy.ndimage.affine_transform`. See `affine_transform`.
+    out : `numpy.ndarray`, optional
+        A float64 array with the shape of ``images`` to write the transformed
+        images to. Defaults to a new array.
+    max_workers : `int`, optional
+        The maximum number of threads used to transform the images. Defaults
+        to the default of `concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    `numpy.ndarray`:
+        The stack of rotated, scaled and translated images, which is ``out`` if
+        given.
+
+    Notes
+    -----
+    Each image gives the same result as transforming it on its own with
+    `affine_transform`. When several images share the same transformation it
+    is only set up once, and when scikit-image interpolates with
+    `scipy.ndimage.map_coordinates` (orders 2, 4 and 5) the grid of input
+    coordinates of the output pixels is only computed once. Otherwise the
+    coordinates are computed on the fly in compiled code.
+    """
+    images = np.asanyarray(images)
+    if images.ndim != 3:
+        raise ValueError("images must be a 3D array of 2D images.")
+    nimages = images.shape[0]
+    image_shape = images.shape[1:]
+
+    rmatrix = np.asanyarray(rmatrix, dtype=float)
+    if rmatrix.shape == (2, 2):
+        rmatrix = np.broadcast_to(rmatrix, (nimages, 2, 2))
+    elif rmatrix.shape != (nimages, 2, 2):
+        raise ValueError("rmatrix must be a 2x2 matrix or one 2x2 matrix per image.")
+    scale = np.broadcast_to(scale, (nimages,))
+    if image_center is None:
+        image_center = [None] * nimages
+    else:
+        image_center = np.broadcast_to(image_center, (nimages, 2))
+
+    if out is None:
+        out = np.empty(images.shape, dtype=np.float64)
+    elif out.shape != images.shape or out.dtype != np.float64:
+        raise ValueError("out must be a float64 array with the shape of images.")
+
+    use_scipy = _check_scipy(use_scipy)
+    if not use_scipy and not np.issubdtype(images.dtype, np.float64):
+        warnings.warn("Input data has been cast to float64.", SunpyUserWarning)
+
+    # Set up each distinct transformation once
+    frame_keys = []
+    for i in range(nimages):
+        center = image_center[i]
+        frame_keys.append((rmatrix[i].tobytes(), float(scale[i]),
+                           None if center is None else np.asarray(center, dtype=float).tobytes()))
+    counts = Counter(frame_keys)
+    transforms = {}
+    for i, key in enumerate(frame_keys):
+        if key not in transforms:
+            transforms[key] = _prepare_transform(image_shape, rmatrix[i], scale[i],
+                                                 image_center[i], recenter, order, use_scipy,
+                                                 shared=counts[key] > 1)
+    frame_transforms = [transforms[key] for key in frame_keys]
+
+    def transform_frame(i):
+        matrix, shift, tform = frame_transforms[i]
+        _transform_image(images[i], matrix, shift, tform, order, missing, use_scipy,
+                         out=out[i])
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results so that any exception is raised
+        list(executor.map(transform_frame, range(nimages)))
+
+    return out
+
+
+def _transform_parameters(shape, rmatrix, scale, image_center, recenter):
+    """
+    The scaled transformation matrix and the shift of an affine transform of
+    an image of the given shape.
+    """
     rmatrix = rmatrix / scale
-    array_center = (np.array(image.shape)[::-1] - 1) / 2.0
+    array_center = (np.array(shape)[::-1] - 1) / 2.0
 
     # Make sure the image center is an array and is where it's supposed to be
     if image_center is not None:
@@ -91,40 +215,100 @@ def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
 
     displacement = np.dot(rmatrix, rot_center)
     shift = image_center - displacement
+    return rmatrix, shift
+
+
+def _prepare_transform(shape, rmatrix, scale, image_center, recenter, order, use_scipy,
+                       shared=False, output_shape=None, output_origin=None):
+    """
+    The scaled transformation matrix, the shift and the scikit-image transform
+    (`None` for scipy) of an affine transform of images of the given shape.
+
+    scikit-image computes the same grid of coordinates for each image when it
+    uses scipy for the interpolation, so for a transform ``shared`` by several
+    images the grid is computed once and returned in place of the transform.
+
+    The transform can compute only a window of ``output_shape`` pixels of the
+    transformed image, which starts at the pixel ``output_origin`` (in the
+    order of ``image_center``) of the full transformed image.
+    """
+    matrix, shift = _transform_parameters(shape, rmatrix, scale, image_center, recenter)
+    if output_origin is not None:
+        shift = shift + np.dot(matrix, output_origin)
+    if output_shape is None:
+        output_shape = shape
+    tform = None
     if not use_scipy:
-        try:
+        tform = _skimage_transform(matrix, shift)
+        if shared and order not in (0, 1, 3):
             import skimage.transform
+
+            tform = skimage.transform.warp_coords(tform, output_shape)
+    return matrix, shift, tform
+
+
+def _check_scipy(use_scipy):
+    """
+    Whether scipy has to be used, falling back to it if scikit-image can't be
+    imported.
+    """
+    if not use_scipy:
+        try:
+            import skimage.transform  # NOQA
         except ImportError:
             warnings.warn("scikit-image could not be imported. Image rotation will use scipy",
                           ImportWarning)
             use_scipy = True
+    return use_scipy
+
+
+def _skimage_transform(rmatrix, shift):
+    """
+    The scikit-image transform of a transformation matrix and shift.
+    """
+    import skimage.transform
+
+    # Make the rotation matrix 3x3 to include translation of the image
+    skmatrix = np.zeros((3, 3))
+    skmatrix[:2, :2] = rmatrix
+    skmatrix[2, 2] = 1.0
+    skmatrix[:2, 2] = shift
+    return skimage.transform.AffineTransform(skmatrix)
+
+
+def _transform_image(image, rmatrix, shift, tform, order, missing, use_scipy, out=None):
+    """
+    Transform one image, optionally writing the result into ``out``, which
+    then sets the shape of the transformed image.
+
+    For scikit-image, ``tform`` is the transform or the grid of input
+    coordinates of the output pixels.
+    """
     if use_scipy:
         if np.any(np.isnan(image)):
             warnings.warn("Setting NaNs to 0 for SciPy rotation.", SunpyUserWarning)
         # Transform the image using the scipy affine transform
         rotated_image = scipy.ndimage.interpolation.affine_transform(
             np.nan_to_num(image).T, rmatrix, offset=shift, order=order,
-            mode='constant', cval=missing).T
+            mode='constant', cval=missing, output=None if out is None else out.T)
+        if out is None:
+            return rotated_image.T
+        return out
     else:
-        # Make the rotation matrix 3x3 to include translation of the image
-        skmatrix = np.zeros((3, 3))
-        skmatrix[:2, :2] = rmatrix
-        skmatrix[2, 2] = 1.0
-        skmatrix[:2, 2] = shift
-        tform = skimage.transform.AffineTransform(skmatrix)
-
-        # Transform the image using the skimage function
-        if not np.issubdtype(image.dtype, np.float64):
-            warnings.warn("Input data has been cast to float64.", SunpyUserWarning)
-            adjusted_image = image.astype(np.float64)
-        else:
-            adjusted_image = image.copy()
+        import skimage.transform
+
+        # Transform the image using the skimage function, which does not
+        # modify its input, so float64 images are not copied
+        adjusted_image = image.astype(np.float64, copy=False)
         if np.any(np.isnan(adjusted_image)) and order >= 4:
             warnings.warn("Setting NaNs to 0 for higher-order scikit-image rotation.",
                           SunpyUserWarning)
             adjusted_image = np.nan_to_num(adjusted_image)
 
-        rotated_image = skimage.transform.warp(adjusted_image, tform, order=order,
-                                               mode='constant', cval=missing)
-
-    return rotated_image
+        rotated_image = skimage.transform.warp(adjusted_image, tform,
+                                               output_shape=None if out is None else out.shape,
+                                               order=order, mode='constant', cval=missing)
+        if out is None:
+            return rotated_image
+        out[...] = rotated_image
+        return out
@@ -2,27 +2,33 @@
 This module provides processing routines for data captured with the AIA
 instrument on SDO.
 """
+import warnings
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 import astropy.units as u
 
+from sunpy.map.mapbase import _submap_meta, _submap_slices
 from sunpy.map.sources.sdo import AIAMap, HMIMap
 from sunpy.util.decorators import deprecated
+from sunpy.util.exceptions import SunpyUserWarning
 
 __all__ = ['aiaprep']
 
 
 @deprecated("2.0", alternative="`register` in aiapy (https://aiapy.readthedocs.io) for converting \
 AIA images to level 1.5")
-def aiaprep(aiamap):
+def aiaprep(aiamap, order=4, dtype=np.float64, max_workers=None):
     """
     Processes a level 1 `~sunpy.map.sources.sdo.AIAMap` into a level 1.5
     `~sunpy.map.sources.sdo.AIAMap`.
 
     Rotates, scales and translates the image so that solar North is aligned
     with the y axis, each pixel is 0.6 arcsec across, and the center of the
-    Sun is at the center of the image. The actual transformation is done by Map's
-    `~sunpy.map.mapbase.GenericMap.rotate` method.
+    Sun is at the center of the image. The transformation is the same as done
+    by Map's `~sunpy.map.mapbase.GenericMap.rotate` method.
 
     This function is similar in functionality to ``aia_prep`` in SSWIDL, but
     it does not use the same transformation to rotate the image and it handles
@@ -31,45 +37,154 @@ def aiaprep(aiamap):
 
     Parameters
     ----------
-    aiamap : `~sunpy.map.sources.sdo.AIAMap`
-        A `sunpy.map.Map` from AIA.
+    aiamap : `~sunpy.map.sources.sdo.AIAMap`, `~sunpy.map.MapSequence` or `list`
+        A `sunpy.map.Map` from AIA, or a sequence or list of these maps or of
+        the paths to their files.
+    order : `int` 0-5, optional
+        Interpolation order used for the rotation, see
+        `~sunpy.map.mapbase.GenericMap.rotate`. Defaults to 4. Lower orders are
+        faster at the cost of accuracy.
+    dtype : `numpy.dtype`, optional
+        The data type of the level 1.5 data. Defaults to float64; float32
+        halves the memory used by the output.
+    max_workers : `int`, optional
+        The maximum number of threads used to process the maps. Defaults to the
+        default of `concurrent.futures.ThreadPoolExecutor`.
 
     Returns
     -------
-    `~sunpy.map.sources.sdo.AIAMap`:
-        A level 1.5 copy of `~sunpy.map.sources.sdo.AIAMap`.
+    `~sunpy.map.sources.sdo.AIAMap`, `~sunpy.map.MapSequence` or `list`:
+        A level 1.5 copy of `~sunpy.map.sources.sdo.AIAMap`, or a sequence or
+        list of level 1.5 maps in the order of the input.
 
     Notes
     -----
     This routine modifies the header information to the standard PCi_j WCS
     formalism. The FITS header resulting in saving a file after this
     procedure will therefore differ from the original file.
+
+    The data of all the maps is written into a single preallocated array.
+    Maps with the same geometry (shape, rotation, scale and reference pixel)
+    share the set up of their transformation. Only the part of the rotated
+    image which is kept is computed, straight into that array. Files are read
+    as they are processed, and their data is not kept by the input maps.
     """
+    # Put the import here to reduce sunpy.map import time
+    import sunpy.map
+
+    if isinstance(aiamap, sunpy.map.MapSequence):
+        return sunpy.map.MapSequence(_prep_maps(aiamap.maps, order, dtype, max_workers),
+                                     sortby=None)
+    if isinstance(aiamap, (list, tuple)):
+        maps = [sunpy.map.Map(amap, lazy=True) if not isinstance(amap, sunpy.map.GenericMap)
+                else amap for amap in aiamap]
+        return _prep_maps(maps, order, dtype, max_workers)
+    return _prep_maps([aiamap], order, dtype, max_workers)[0]
 
-    if not isinstance(aiamap, (AIAMap, HMIMap)):
-        raise ValueError("Input must be an AIAMap or HMIMap.")
 
+def _prep_maps(maps, order, dtype, max_workers):
+    """
+    Process level 1 AIA or HMI maps into level 1.5 maps, in parallel threads.
+    """
+    from sunpy.image.transform import _check_scipy, _prepare_transform, _transform_image
+
+    if order not in range(6):
+        raise ValueError("Order must be between 0 and 5.")
+    for aiamap in maps:
+        if not isinstance(aiamap, (AIAMap, HMIMap)):
+            raise ValueError("Input must be an AIAMap or HMIMap.")
+    # The shape and dtype of maps of files are known without reading the data
+    if len({aiamap._data.shape for aiamap in maps}) > 1:
+        raise ValueError("All the maps must have the same shape.")
+
+    geometries = [_prep_geometry(aiamap) for aiamap in maps]
+
+    use_scipy = _check_scipy(False)
+    if not use_scipy and not all(np.issubdtype(aiamap._data.dtype, np.float64)
+                                 for aiamap in maps):
+        warnings.warn("Input data has been cast to float64.", SunpyUserWarning)
+
+    # Set up the transformation of each distinct geometry once, for only the
+    # window of the rotated data which is kept
+    counts = Counter(geometry['key'] for geometry in geometries)
+    transforms = {}
+    for geometry in geometries:
+        key = geometry['key']
+        if key not in transforms:
+            yslice, xslice = geometry['window']
+            transforms[key] = _prepare_transform(
+                geometry['padded_shape'][::-1], geometry['rmatrix'], geometry['scale_factor'],
+                np.flipud(geometry['pixel_center']), True, order, use_scipy,
+                shared=counts[key] > 1,
+                output_shape=(xslice.stop - xslice.start, yslice.stop - yslice.start),
+                output_origin=geometry['window_origin'][::-1])
+
+    yslice, xslice = geometries[0]['window']
+    out = np.empty((len(maps), yslice.stop - yslice.start, xslice.stop - xslice.start),
+                   dtype=dtype)
+
+    def prep_map(i):
+        aiamap = maps[i]
+        geometry = geometries[i]
+        # Slicing reads the data of a map of a file without keeping it in the map
+        data = aiamap._data[:, :]
+        missing = data.min()
+        pad_x, pad_y = geometry['pad']
+        padded = np.pad(data, ((pad_y, pad_y), (pad_x, pad_x)), mode='constant',
+                        constant_values=(missing, missing))
+        del data
+        _transform_image(padded.T, *transforms[geometry['key']], order, missing, use_scipy,
+                         out=out[i].T)
+        new_meta = _submap_meta(geometry['meta'], geometry['reference_pixel'],
+                                *geometry['window'])
+        new_meta['r_sun'] = new_meta['rsun_obs'] / new_meta['cdelt1']
+        new_meta['lvl_num'] = 1.5
+        new_meta['bitpix'] = -8 * out.dtype.itemsize
+        return aiamap._new_instance(out[i], new_meta, aiamap.plot_settings)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(prep_map, range(len(maps))))
+
+
+def _prep_geometry(aiamap):
+    """
+    The transformation of a level 1 map to level 1.5, which is the rotation of
+    the map by `~sunpy.map.GenericMap.rotate` and the submap of the center of
+    the rotated map.
+    """
+    shape = aiamap._data.shape
     # Target scale is 0.6 arcsec/pixel, but this needs to be adjusted if the map
     # has already been rescaled.
     if ((aiamap.scale[0] / 0.6).round() != 1.0 * u.arcsec / u.pix
-            and aiamap.data.shape != (4096, 4096)):
+            and shape != (4096, 4096)):
         scale = (aiamap.scale[0] / 0.6).round() * 0.6 * u.arcsec
     else:
         scale = 0.6 * u.arcsec  # pragma: no cover # can't test this because it needs a full res image
-    scale_factor = aiamap.scale[0] / scale
+    scale_factor = (aiamap.scale[0] / scale).value
 
-    tempmap = aiamap.rotate(recenter=True, scale=scale_factor.value, missing=aiamap.min())
+    rmatrix = aiamap.rotation_matrix
+    (pad_x, pad_y), (unpad_x, unpad_y), pixel_center, reference_pixel = \
+        aiamap._rotation_geometry(rmatrix, recenter=True)
+    padded_shape = (shape[0] + 2 * pad_y, shape[1] + 2 * pad_x)
+    rotated_shape = (padded_shape[0] - 2 * unpad_y, padded_shape[1] - 2 * unpad_x)
 
-    # extract center from padded aiamap.rotate output
+    # The submap of the center of the rotated map
     # crpix1 and crpix2 will be equal (recenter=True), as aiaprep does not work with submaps
-    center = np.floor(tempmap.meta['crpix1'])
-    range_side = (center + np.array([-1, 1]) * aiamap.data.shape[0] / 2) * u.pix
-    newmap = tempmap.submap(u.Quantity([range_side[0], range_side[0]]),
-                            u.Quantity([range_side[1] - 1 * u.pix,
-                                        range_side[1] - 1 * u.pix]))
-
-    newmap.meta['r_sun'] = newmap.meta['rsun_obs'] / newmap.meta['cdelt1']
-    newmap.meta['lvl_num'] = 1.5
-    newmap.meta['bitpix'] = -64
-
-    return newmap
+    center = np.floor(reference_pixel[0] + 1)
+    range_side = center + np.array([-1, 1]) * shape[0] / 2
+    corners = [range_side[0], range_side[1] - 1]
+    window = _submap_slices(corners, corners, rotated_shape)
+    # The start of the submap in the padded rotated data
+    window_origin = np.array([window[1].start + unpad_x, window[0].start + unpad_y])
+
+    return {'key': (shape, rmatrix.tobytes(), scale_factor, pad_x, pad_y,
+                    pixel_center.tobytes(), window_origin.tobytes()),
+            'rmatrix': rmatrix,
+            'scale_factor': scale_factor,
+            'pad': (pad_x, pad_y),
+            'padded_shape': padded_shape,
+            'pixel_center': pixel_center,
+            'reference_pixel': reference_pixel,
+            'window': window,
+            'window_origin': window_origin,
+            'meta': aiamap._rotated_meta(rmatrix, scale_factor, reference_pixel)}
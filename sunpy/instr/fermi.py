@@ -22,8 +22,13 @@ from sunpy.time.time import _variables_for_parse_time_docstring
 from sunpy.util.decorators import add_common_docstring
 
 __all__ = ['download_weekly_pointing_file', 'get_detector_sun_angles_for_time',
-           'get_detector_sun_angles_for_date', 'plot_detector_sun_angles',
-           'met_to_utc']
+           'get_detector_sun_angles_for_times', 'get_detector_sun_angles_for_date',
+           'plot_detector_sun_angles', 'met_to_utc']
+
+# Contents of the Fermi/LAT weekly pointing files, keyed by file path.  Each
+# entry stores the modification time of the file it was read from so that a
+# changed file is read again.
+_pointing_file_cache = {}
 
 
 @add_common_docstring(**_variables_for_parse_time_docstring())
@@ -156,44 +161,121 @@ def get_detector_sun_angles_for_date(date, file):
 
     date = parse_time(date)
     tran = TimeRange(date, date + TimeDelta(1*u.day))
-    scx, scz, times = get_scx_scz_in_timerange(tran, file)
+    pointing = _read_pointing_file(file)
+    startind, endind = np.searchsorted(pointing['met'],
+                                       [utc_to_met(tran.start).value, utc_to_met(tran.end).value])
 
-    # retrieve the detector angle information in spacecraft coordinates
-    detectors = nai_detector_angles()
+    times = pointing['time'][startind:endind]
+    return _detector_sun_angles(pointing, np.arange(startind, endind),
+                                sun.apparent_rightascension(times).to_value('deg'),
+                                sun.apparent_declination(times).to_value('deg'))
+
+
+@add_common_docstring(**_variables_for_parse_time_docstring())
+def get_detector_sun_angles_for_times(times, file):
+    """
+    Get the GBM detector angles vs the Sun for an array of times.
+
+    The spacecraft pointing used for each time is the one found by
+    `~sunpy.instr.fermi.get_scx_scz_at_time`, and the angles of all detectors
+    at all times are computed together.  The Sun position is interpolated
+    from a one minute grid of times.
+
+    Parameters
+    ----------
+    times : {parse_time_types}
+        An array of times specified as parse_time-compatible
+        time strings, numbers, or datetime objects.
+    file : `str`
+        A filepath to a Fermi/LAT weekly pointing file (e.g. as obtained by the
+        download_weekly_pointing_file function).
+
+    Returns
+    -------
+    `collections.OrderedDict`
+        The angles of each detector as `~astropy.units.Quantity` arrays, and
+        the times of the pointings used under the ``'time'`` key.
+    """
+    times = parse_time(times)
+    if times.isscalar:
+        times = times.reshape((1,))
+    pointing = _read_pointing_file(file)
+    ind = np.searchsorted(pointing['met'], utc_to_met(times).value)
+    if np.any(ind == len(pointing['met'])):
+        raise ValueError('All times must be before the start of the last entry '
+                         'in the pointing file.')
+
+    return _detector_sun_angles(pointing, ind, *_interpolated_sun_radec(times))
+
+
+def _detector_sun_angles(pointing, ind, sun_ra, sun_dec):
+    """
+    Get the GBM detector angles vs the Sun for a set of rows of a weekly
+    pointing file.
+
+    The detector pointings are found once for each distinct row with stacked
+    rotation matrices, and the separations from the Sun are found for all
+    rows at once.
+
+    Parameters
+    ----------
+    pointing : `dict`
+        The contents of a weekly pointing file, as returned by
+        `~sunpy.instr.fermi._read_pointing_file`.
+    ind : `numpy.ndarray`
+        The indices of the rows to use.
+    sun_ra, sun_dec : `numpy.ndarray`
+        The "RA/DEC" of the Sun in degrees for each row.
+
+    Returns
+    -------
+    `collections.OrderedDict`
+        The angles of each detector as `~astropy.units.Quantity` arrays, and
+        the times of the rows under the ``'time'`` key.
+    """
+    rows, inverse = np.unique(ind, return_inverse=True)
+    detector_ra, detector_dec = _nai_detector_radec_arrays(
+        pointing['ra_scx'][rows], pointing['dec_scx'][rows],
+        pointing['ra_scz'][rows], pointing['dec_scz'][rows])
+    separations = _separation_angle_degrees(detector_ra[:, inverse], detector_dec[:, inverse],
+                                            sun_ra, sun_dec)
 
-    detector_to_sun_angles = []
-    # get the detector vs Sun angles for each t and store in a list of
-    # dictionaries.
-    for i in range(len(scx)):
-        detector_radecs = nai_detector_radecs(detectors, scx[i], scz[i],
-                                              times[i])
-
-        # this gets the sun position with RA in hours in decimal format
-        # (e.g. 4.3). DEC is already in degrees
-        sunpos_ra_not_in_deg = [sun.apparent_rightascension(times[i]),
-                                sun.apparent_declination(times[i])]
-        # now Sun position with RA in degrees
-        sun_pos = [sunpos_ra_not_in_deg[0].to('deg'), sunpos_ra_not_in_deg[1]]
-        # now get the angle between each detector and the Sun
-        detector_to_sun_angles.append(
-            get_detector_separation_angles(detector_radecs, sun_pos))
-
-    # slice the list of dictionaries to get the angles for each detector in a
-    # list form
     angles = OrderedDict()
-    key_list = ['n0', 'n1', 'n2', 'n3', 'n4', 'n5', 'n6', 'n7', 'n8', 'n9',
-                'n10', 'n11', 'time']
-    for i in range(13):
-        if not key_list[i] == 'time':
-            angles[key_list[i]] = [item[key_list[i]].value
-                                   for item in detector_to_sun_angles] * u.deg
-        else:
-            angles[key_list[i]] = [item[key_list[i]]
-                                   for item in detector_to_sun_angles]
+    for detector, separation in zip(nai_detector_angles(), separations):
+        angles[detector] = separation * u.deg
+    angles['time'] = pointing['time'][ind]
 
     return angles
 
 
+def _interpolated_sun_radec(times, step=60):
+    """
+    Get the apparent "RA/DEC" of the Sun in degrees for an array of times.
+
+    The Sun position is found on a grid of ``step`` second spacing which
+    brackets the times, and linearly interpolated between the grid points.
+    Over a minute the Sun moves by less than a thousandth of a degree along a
+    path which is straight to well below the precision of the ephemeris, so
+    this avoids evaluating the ephemeris for every time of a high cadence
+    array.
+    """
+    met = utc_to_met(times).value
+    grid_index = np.floor(met / step)
+    grid = np.unique(np.concatenate([grid_index, grid_index + 1]))
+    grid_times = met_to_utc(grid * step)
+    grid_vectors = _radec_to_vector(sun.apparent_rightascension(grid_times).to_value('deg'),
+                                    sun.apparent_declination(grid_times).to_value('deg'))
+
+    lower = np.searchsorted(grid, grid_index)
+    fraction = (met / step - grid_index)[:, np.newaxis]
+    vectors = (1 - fraction) * grid_vectors[lower] + fraction * grid_vectors[lower + 1]
+    vectors /= np.sqrt(np.sum(vectors * vectors, axis=-1, keepdims=True))
+
+    ra = np.degrees(np.arctan2(vectors[:, 1], vectors[:, 0])) % 360
+    dec = np.degrees(np.arcsin(vectors[:, 2]))
+    return ra, dec
+
+
 def plot_detector_sun_angles(angles):
     """
     Plots the Fermi/GBM detector angles as a function of time.
@@ -211,13 +293,13 @@ def plot_detector_sun_angles(angles):
     for n in angles.keys():
         if not n == 'time':
             plt.plot(
-                angles['time'],
+                angles['time'].datetime,
                 angles[n].value,
                 label='{lab} ({val})'.format(
                     lab=n, val=str(np.mean(angles[n].value))[0:5]))
     plt.ylim(180, 0)
     plt.ylabel('angle (degrees)')
-    plt.xlabel('Start time: ' + angles['time'][0].isoformat())
+    plt.xlabel('Start time: ' + angles['time'][0].isot)
     plt.title('Detector pointing angle from Sun')
     plt.legend(fontsize=10)
     figure.autofmt_xdate()
@@ -247,18 +329,15 @@ def get_scx_scz_at_time(time, file):
     """
 
     time = parse_time(time)
-    hdulist = fits.open(file)
-    timesinutc = []
-    for tim in hdulist[1].data['START']:
-        timesinutc.append(met_to_utc(tim))
-    ind = np.searchsorted(timesinutc, time)
+    pointing = _read_pointing_file(file)
+    ind = np.searchsorted(pointing['met'], utc_to_met(time).value)
 
-    scx_radec = (Longitude(hdulist[1].data['RA_SCX'][ind] * u.deg),
-                 Latitude(hdulist[1].data['DEC_SCX'][ind] * u.deg))
-    scz_radec = (Longitude(hdulist[1].data['RA_SCZ'][ind] * u.deg),
-                 Latitude(hdulist[1].data['DEC_SCZ'][ind] * u.deg))
+    scx_radec = (Longitude(pointing['ra_scx'][ind] * u.deg),
+                 Latitude(pointing['dec_scx'][ind] * u.deg))
+    scz_radec = (Longitude(pointing['ra_scz'][ind] * u.deg),
+                 Latitude(pointing['dec_scz'][ind] * u.deg))
 
-    return scx_radec, scz_radec, timesinutc[ind]
+    return scx_radec, scz_radec, pointing['time'][ind]
 
 
 def get_scx_scz_in_timerange(timerange, file):
@@ -281,22 +360,57 @@ def get_scx_scz_in_timerange(timerange, file):
         and it's time.
     """
 
-    hdulist = fits.open(file)
-    timesinutc = []
-    for tim in hdulist[1].data['START']:
-        timesinutc.append(met_to_utc(tim))
-
-    startind = np.searchsorted(timesinutc, timerange.start)
-    endind = np.searchsorted(timesinutc, timerange.end)
+    pointing = _read_pointing_file(file)
+    startind, endind = np.searchsorted(pointing['met'],
+                                       [utc_to_met(timerange.start).value,
+                                        utc_to_met(timerange.end).value])
 
     scx_radec = []
     scz_radec = []
     for i in range(startind, endind):
-        scx_radec.append((Longitude(hdulist[1].data['RA_SCX'][i] * u.deg),
-                          Latitude(hdulist[1].data['DEC_SCX'][i] * u.deg)))
-        scz_radec.append((Longitude(hdulist[1].data['RA_SCZ'][i] * u.deg),
-                          Latitude(hdulist[1].data['DEC_SCZ'][i] * u.deg)))
-    return scx_radec, scz_radec, timesinutc[startind:endind]
+        scx_radec.append((Longitude(pointing['ra_scx'][i] * u.deg),
+                          Latitude(pointing['dec_scx'][i] * u.deg)))
+        scz_radec.append((Longitude(pointing['ra_scz'][i] * u.deg),
+                          Latitude(pointing['dec_scz'][i] * u.deg)))
+    return scx_radec, scz_radec, list(pointing['time'][startind:endind])
+
+
+def _read_pointing_file(file):
+    """
+    Read the start times and spacecraft axes pointings from a Fermi/LAT weekly
+    pointing file.
+
+    The contents of each file are kept in memory until the file on disk
+    changes.
+
+    Parameters
+    ----------
+    file : `str`
+        A filepath to a Fermi/LAT weekly pointing file.
+
+    Returns
+    -------
+    `dict`
+        The start times of each row in MET seconds (``'met'``) and as
+        `~astropy.time.Time` (``'time'``), and the "RA/DEC" of the spacecraft
+        X and Z axes in degrees (``'ra_scx'``, ``'dec_scx'``, ``'ra_scz'``,
+        ``'dec_scz'``).
+    """
+    file = str(file)
+    mtime = os.path.getmtime(file)
+    cached = _pointing_file_cache.get(file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with fits.open(file) as hdulist:
+        data = hdulist[1].data
+        pointing = {'met': np.array(data['START'], dtype=float)}
+        for column in ['RA_SCX', 'DEC_SCX', 'RA_SCZ', 'DEC_SCZ']:
+            pointing[column.lower()] = np.array(data[column], dtype=float)
+    pointing['time'] = met_to_utc(pointing['met'])
+
+    _pointing_file_cache[file] = (mtime, pointing)
+    return pointing
 
 
 def nai_detector_angles():
@@ -414,14 +528,21 @@ def rotate_vector(vector, axis, theta):
     theta : `float`
         The angle (in radians) by which to rotate vector around axis.
 
+    Notes
+    -----
+    ``vector``, ``axis`` and ``theta`` may also be stacks of vectors (along the
+    last axis) and angles, which are broadcast against each other; each
+    vector is then rotated by its own rotation matrix.
+
     Reference
     ---------
     https://en.wikipedia.org/wiki/Euler-Rodrigues_parameters#Rotation_angle_and_rotation_axis
     """
 
-    axis = axis / np.sqrt(np.dot(axis, axis))
+    axis = axis / np.sqrt(np.sum(axis * axis, axis=-1, keepdims=True))
     a = np.cos(theta / 2)
-    b, c, d = -axis * np.sin(theta / 2)
+    b, c, d = np.moveaxis(-axis * np.asarray(np.sin(theta / 2))[..., np.newaxis], -1, 0)
+    a, b, c, d = np.broadcast_arrays(a, b, c, d)
 
     rot_matrix = np.array(
         [[a * a + b * b - c * c - d * d, 2 * (b * c + a * d), 2 *
@@ -429,8 +550,68 @@ def rotate_vector(vector, axis, theta):
                              d, 2 * (c * d + a * b)],
          [2 * (b * d + a * c), 2 * (c * d - a * b), a * a + d * d - b * b - c *
           c]])
+    rot_matrix = np.moveaxis(rot_matrix, (0, 1), (-2, -1))
+
+    return np.einsum('...ij,...j->...i', rot_matrix, vector)
 
-    return np.dot(rot_matrix, vector)
+
+def _radec_to_vector(ra, dec):
+    """
+    Convert arrays of "RA/DEC" in degrees to unit vectors, stacked along the
+    last axis.
+    """
+    ra = np.deg2rad(ra)
+    dec = np.deg2rad(dec)
+    return np.stack([np.cos(ra) * np.cos(dec), np.sin(ra) * np.cos(dec), np.sin(dec)], axis=-1)
+
+
+def _nai_detector_radec_arrays(scx_ra, scx_dec, scz_ra, scz_dec):
+    """
+    Calculates the "RA/DEC" of each NaI detector for arrays of spacecraft
+    "x" and "z" axis "RA/DEC" positions.
+
+    This does the same rotations as `~sunpy.instr.fermi.nai_detector_radecs`
+    for all detectors and pointings at once.
+
+    Parameters
+    ----------
+    scx_ra, scx_dec, scz_ra, scz_dec : `numpy.ndarray`
+        The "RA/DEC" of the spacecraft X and Z axes in degrees.
+
+    Returns
+    -------
+    `numpy.ndarray`, `numpy.ndarray`
+        The "RA" and "DEC" in degrees of each detector (in the order of
+        `~sunpy.instr.fermi.nai_detector_angles`) at each pointing, of shape
+        ``(12, len(scx_ra))``.
+    """
+    scx_vector = _radec_to_vector(scx_ra, scx_dec)
+    scz_vector = _radec_to_vector(scz_ra, scz_dec)
+    detectors = nai_detector_angles().values()
+    phi = np.deg2rad([d[0].value for d in detectors])[:, np.newaxis]
+    theta = np.deg2rad([d[1].value for d in detectors])[:, np.newaxis]
+
+    # rotate about spacecraft z-axis first
+    vx_primed = rotate_vector(scx_vector, scz_vector, phi)
+    # now find spacecraft y-axis using cross product
+    vy_primed = np.cross(scz_vector, vx_primed)
+    # do the second part of the rotation around vy
+    vz_primed = rotate_vector(scz_vector, vy_primed, theta)
+
+    ra = np.degrees(np.arctan2(vz_primed[..., 1], vz_primed[..., 0])) % 360
+    dec = np.degrees(np.arcsin(np.clip(vz_primed[..., 2], -1, 1)))
+    return ra, dec
+
+
+def _separation_angle_degrees(ra1, dec1, ra2, dec2):
+    """
+    Use the law of spherical cosines to calculate the separation angle in
+    degrees between arrays of "RA/DEC" positions in degrees.
+    """
+    ra1, dec1, ra2, dec2 = map(np.deg2rad, (ra1, dec1, ra2, dec2))
+    cosine_of_angle = (np.sin(dec1) * np.sin(dec2) +
+                       np.cos(dec1) * np.cos(dec2) * np.cos(ra1 - ra2))
+    return np.degrees(np.arccos(np.clip(cosine_of_angle, -1, 1)))
 
 
 def get_detector_separation_angles(detector_radecs, sunpos):
@@ -45,6 +45,7 @@ References
           `10.1051/0004-6361/200911712 <https://doi.org/10.1051/0004-6361/200911712>`__
 """
 
+import os
 import csv
 import copy
 import socket
@@ -90,6 +91,17 @@ FILE_EM_COR = "goes_chianti_em_cor.csv"
 FILE_EM_PHO = "goes_chianti_em_pho.csv"
 FILE_RAD_COR = "chianti7p1_rad_loss.txt"
 
+# Model values and spline representations read from the lookup tables above,
+# keyed by file path and the columns interpolated.  Each entry stores the
+# modification time of the file it was read from so that a re-downloaded table
+# is read again.
+_lookup_table_cache = {}
+
+# GOES events already retrieved from the HEK, keyed by the GOES class filter
+# used in the query.  Each entry stores the time intervals that have been
+# searched and the events found within them.
+_goes_event_cache = {}
+
 
 def get_goes_event_list(timerange, goes_class_filter=None):
     """
@@ -107,6 +119,34 @@ def get_goes_event_list(timerange, goes_class_filter=None):
     -------
     `list`:
         A list of all the flares found for the given time range.
+
+    Notes
+    -----
+    The events returned by the HEK are kept in a catalog for the rest of the
+    session, so that repeated calls for overlapping time ranges only query
+    the parts of the time range that have not been searched before.
+    """
+    key = goes_class_filter.upper() if goes_class_filter else None
+    catalog = _goes_event_cache.setdefault(key, {'covered': [], 'events': {}})
+    tstart = timerange.start
+    tend = timerange.end
+
+    for gap_start, gap_end in _uncovered_intervals(catalog['covered'], tstart, tend):
+        for event in _query_goes_events(gap_start, gap_end, goes_class_filter):
+            event_key = (event['start_time'].isot, event['peak_time'].isot,
+                         event['goes_class'], event['goes_location'])
+            catalog['events'].setdefault(event_key, event)
+        catalog['covered'] = _merge_intervals(catalog['covered'] + [(gap_start, gap_end)])
+
+    # The HEK returns all events overlapping the requested time range
+    events = sorted(catalog['events'].values(), key=lambda event: event['start_time'].jd)
+    return [copy.copy(event) for event in events
+            if event['start_time'] <= tend and event['end_time'] >= tstart]
+
+
+def _query_goes_events(tstart, tend, goes_class_filter=None):
+    """
+    Query the HEK for GOES flares between ``tstart`` and ``tend``.
     """
     # Importing hek here to avoid calling code that relies on optional dependencies.
     from sunpy.net import hek
@@ -114,8 +154,6 @@ def get_goes_event_list(timerange, goes_class_filter=None):
     # use HEK module to search for GOES events
     client = hek.HEKClient()
     event_type = 'FL'
-    tstart = timerange.start
-    tend = timerange.end
 
     # query the HEK for a list of events detected by the GOES instrument
     # between tstart and tend (using a GOES-class filter)
@@ -152,6 +190,41 @@ def get_goes_event_list(timerange, goes_class_filter=None):
     return goes_event_list
 
 
+def _merge_intervals(intervals):
+    """
+    Merge a list of ``(start, end)`` time intervals into a sorted list of
+    disjoint intervals.
+    """
+    merged = []
+    for start, end in sorted(intervals, key=lambda interval: interval[0].jd):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _uncovered_intervals(covered, tstart, tend):
+    """
+    Return the parts of the time range ``tstart`` to ``tend`` that are not
+    contained in the sorted, disjoint intervals ``covered``.
+    """
+    gaps = []
+    for start, end in covered:
+        if end < tstart:
+            continue
+        if start > tend:
+            break
+        if start > tstart:
+            gaps.append((tstart, start))
+        if end >= tend:
+            return gaps
+        tstart = end
+    gaps.append((tstart, tend))
+    return gaps
+
+
 def calculate_temperature_em(goests, abundances="coronal",
                              download=False, download_dir=None):
     """
@@ -532,23 +605,13 @@ def _goes_get_chianti_temp(fluxratio: u.one, satellite=8, abundances="coronal",
         raise ValueError("abundances must be a string equalling "
                          "'coronal' or 'photospheric'.")
 
-    # Initialize lists to hold model data of flux ratio - temperature
-    # relationship read in from csv file
-    modeltemp = []  # modelled temperature is in log_10 space in units of MK
-    modelratio = []
     # Determine name of column in csv file containing model ratio values
     # for relevant GOES satellite
     label = f"ratioGOES{satellite}"
-    # Read data representing appropriate temperature--flux ratio
+    # Get data representing appropriate temperature--flux ratio
     # relationship depending on satellite number and assumed abundances.
-    with open(data_file, "r") as csvfile:
-        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
-        csvreader = csv.DictReader(startline, delimiter=";")
-        for row in csvreader:
-            modeltemp.append(float(row["log10temp_MK"]))
-            modelratio.append(float(row[label]))
-    modeltemp = np.asarray(modeltemp)
-    modelratio = np.asarray(modelratio)
+    # modelled temperature is in log_10 space in units of MK
+    modelratio, modeltemp, spline = _get_lookup_table(data_file, label, "log10temp_MK")
 
     # Ensure input values of flux ratio are within limits of model table
     if np.min(fluxratio) < np.min(modelratio) or \
@@ -558,9 +621,8 @@ def _goes_get_chianti_temp(fluxratio: u.one, satellite=8, abundances="coronal",
             "the range {1} - {2}.".format(satellite, np.min(modelratio),
                                           np.max(modelratio)))
 
-    # Perform spline fit to model data to get temperatures for input
+    # Evaluate spline fit to model data to get temperatures for input
     # values of flux ratio
-    spline = interpolate.splrep(modelratio, modeltemp, s=0)
     temp = 10.**interpolate.splev(fluxratio.value, spline, der=0)
     temp = u.Quantity(temp, unit='MK')
 
@@ -693,24 +755,13 @@ def _goes_get_chianti_em(longflux: u.W/u.m/u.m, temp: u.MK, satellite=8,
         raise ValueError("longflux and temp must have same number of "
                          "elements.")
 
-    # Initialize lists to hold model data of temperature - long channel
-    # flux relationship read in from csv file.
-    modeltemp = []   # modelled temperature is in log_10 space in units of MK
-    modelflux = []
     # Determine name of column in csv file containing model ratio values
     # for relevant GOES satellite
     label = f"longfluxGOES{satellite}"
-
-    # Read data representing appropriate temperature--long flux
+    # Get data representing appropriate temperature--long flux
     # relationship depending on satellite number and assumed abundances.
-    with open(data_file, "r") as csvfile:
-        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
-        csvreader = csv.DictReader(startline, delimiter=";")
-        for row in csvreader:
-            modeltemp.append(float(row["log10temp_MK"]))
-            modelflux.append(float(row[label]))
-    modeltemp = np.asarray(modeltemp)
-    modelflux = np.asarray(modelflux)
+    # modelled temperature is in log_10 space in units of MK
+    modeltemp, modelflux, spline = _get_lookup_table(data_file, "log10temp_MK", label)
 
     # Ensure input values of flux ratio are within limits of model table
     if np.min(log10_temp) < np.min(modeltemp) or \
@@ -720,8 +771,7 @@ def _goes_get_chianti_em(longflux: u.W/u.m/u.m, temp: u.MK, satellite=8,
                          "{} - {} MK.".format(np.min(10**modeltemp),
                                               np.max(10**modeltemp)))
 
-    # Perform spline fit to model data
-    spline = interpolate.splrep(modeltemp, modelflux, s=0)
+    # Evaluate spline fit to model data
     denom = interpolate.splev(log10_temp, spline, der=0)
     em = longflux.value/denom * 1e55
     em = u.Quantity(em, unit='cm**(-3)')
@@ -955,29 +1005,15 @@ def _calc_rad_loss(temp: u.MK, em: u.cm**-3, obstime=None, force_download=False,
     if len(temp) != len(em):
         raise ValueError("temp and em must all have same number of elements.")
 
-    # Initialize lists to hold model data of temperature - rad loss rate
-    # relationship read in from csv file
-    modeltemp = []    # modelled temperature is in log_10 space in units of MK
-    model_loss_rate = []
-
-    # Read data from csv file into lists, being sure to skip commented
-    # lines beginning with "#"
-    with open(manager.get('file_rad_cor'), "r") as csvfile:
-        startline = csvfile.readlines()[7:]
-        csvreader = csv.reader(startline, delimiter=" ")
-        for row in csvreader:
-            modeltemp.append(float(row[0]))
-            model_loss_rate.append(float(row[1]))
-    modeltemp = np.asarray(modeltemp)
-    model_loss_rate = np.asarray(model_loss_rate)
+    # Get model data of temperature - rad loss rate relationship.
+    modeltemp, model_loss_rate, spline = _get_lookup_table(manager.get('file_rad_cor'), 0, 1)
     # Ensure input values of flux ratio are within limits of model table
     if temp.value.min() < modeltemp.min() or temp.value.max() > modeltemp.max():
         raise ValueError("All values in temp must be within the range " +
                          "{} - {} MK.".format(np.min(modeltemp/1e6),
                                               np.max(modeltemp/1e6)))
-    # Perform spline fit to model data to get temperatures for input
-    # values of flux ratio
-    spline = interpolate.splrep(modeltemp, model_loss_rate, s=0)
+    # Evaluate spline fit to model data to get radiative loss rates for
+    # input values of temperature
     rad_loss = em.value * interpolate.splev(temp.value, spline, der=0)
     rad_loss = u.Quantity(rad_loss, unit='erg/s')
     rad_loss = rad_loss.to(u.J/u.s)
@@ -1016,6 +1052,59 @@ def _calc_rad_loss(temp: u.MK, em: u.cm**-3, obstime=None, force_download=False,
     return rad_loss_out
 
 
+def _get_lookup_table(data_file, xcolumn, ycolumn):
+    """
+    Returns one relationship from a GOES lookup table and its spline fit.
+
+    The table is only read from disk and fitted the first time it is needed;
+    subsequent calls reuse the model values and spline held in memory, so
+    whole flux arrays can be evaluated with a single call to
+    `scipy.interpolate.splev`.
+
+    Parameters
+    ----------
+    data_file : `str` or `pathlib.Path`
+        Path to the lookup table.  Files ending in ".csv" are read as
+        semicolon delimited tables with named columns, preceded by comment
+        lines beginning with "#".  Other files are read as space delimited
+        tables with 7 header lines and are indexed by column number.
+
+    xcolumn, ycolumn : `str` or `int`
+        The columns of the table holding the independent and dependent
+        variables of the relationship.
+
+    Returns
+    -------
+    modelx, modely : `numpy.ndarray`
+        The model values of the independent and dependent variables.
+
+    spline : `tuple`
+        The spline representation of the relationship as returned by
+        `scipy.interpolate.splrep`.
+    """
+    data_file = str(data_file)
+    mtime = os.path.getmtime(data_file)
+    key = (data_file, xcolumn, ycolumn)
+    cached = _lookup_table_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(data_file, "r") as csvfile:
+        if data_file.endswith(".csv"):
+            startline = dropwhile(lambda l: l.startswith("#"), csvfile)
+            rows = list(csv.DictReader(startline, delimiter=";"))
+        else:
+            startline = csvfile.readlines()[7:]
+            rows = list(csv.reader(startline, delimiter=" "))
+    modelx = np.array([row[xcolumn] for row in rows], dtype=float)
+    modely = np.array([row[ycolumn] for row in rows], dtype=float)
+    spline = interpolate.splrep(modelx, modely, s=0)
+
+    table = (modelx, modely, spline)
+    _lookup_table_cache[key] = (mtime, table)
+    return table
+
+
 def calculate_xray_luminosity(goests):
     """
     Calculates GOES solar X-ray luminosity.
@@ -1266,18 +1355,20 @@ def flareclass_to_flux(flareclass):
 
     Parameters
     ----------
-    flareclass : str
+    flareclass : `str` or array-like of `str`
         The case-insensitive flare class (e.g., 'X3.2', 'm1.5', 'A9.6').
+        An array of flare classes is converted element by element.
 
     Returns
     -------
     flux : `~astropy.units.Quantity`
         X-ray flux between 1 and 8 Angstroms as measured near Earth in W/m^2.
+        This has the same shape as ``flareclass``.
 
     Raises
     ------
     TypeError
-        Input must be a string.
+        Input must be a string or an array of strings.
 
     Examples
     --------
@@ -1288,15 +1379,22 @@ def flareclass_to_flux(flareclass):
     <Quantity 4.7e-06 W / m2>
     >>> flareclass_to_flux('X2.4')
     <Quantity 0.00024 W / m2>
+    >>> flareclass_to_flux(['A1.0', 'c4.7', 'X2.4'])
+    <Quantity [1.0e-08, 4.7e-06, 2.4e-04] W / m2>
     """
-    if not isinstance(flareclass, type('str')):
-        raise TypeError("Input must be a string")
-    # TODO should probably make sure the string is in the expected format.
+    if isinstance(flareclass, str):
+        # TODO should probably make sure the string is in the expected format.
+        flareclass = flareclass.upper()
+        return float(flareclass[1:]) * GOES_CONVERSION_DICT[flareclass[0]]
 
-    flareclass = flareclass.upper()
-    # invert the conversion dictionary
-    # conversion_dict = {v: k for k, v in GOES_CONVERSION_DICT.items()}
-    return float(flareclass[1:]) * GOES_CONVERSION_DICT[flareclass[0]]
+    flareclass = np.asarray(flareclass)
+    if flareclass.dtype.kind not in 'SU':
+        raise TypeError("Input must be a string or an array of strings")
+    # Long series of flare classes contain few distinct values, so each
+    # distinct class is only parsed once.
+    classes, inverse = np.unique(np.char.upper(flareclass.astype(str)), return_inverse=True)
+    fluxes = np.array([float(c[1:]) * GOES_CONVERSION_DICT[c[0]].value for c in classes])
+    return u.Quantity(fluxes[inverse].reshape(flareclass.shape), "W/m^2")
 
 
 @u.quantity_input
@@ -1308,12 +1406,15 @@ def flux_to_flareclass(goesflux: u.watt/u.m**2):
     ----------
     flux : `~astropy.units.Quantity`
         X-ray flux between 1 and 8 Angstroms (usually measured by GOES) as
-        measured at the Earth in W/m^2
+        measured at the Earth in W/m^2. An array of fluxes is converted
+        element by element.
 
     Returns
     -------
-    flareclass : str
-        The flare class e.g.: 'X3.2', 'M1.5', 'A9.6'.
+    flareclass : `str` or `numpy.ndarray`
+        The flare class e.g.: 'X3.2', 'M1.5', 'A9.6', or an empty string for
+        a flux which is NaN or infinite. For an array of fluxes, an array of
+        flare classes with the same shape.
 
     Raises
     ------
@@ -1338,24 +1439,25 @@ def flux_to_flareclass(goesflux: u.watt/u.m**2):
     'A0.78'
     >>> flux_to_flareclass(0.00682 * u.watt/u.m**2)
     'X68.2'
+    >>> flux_to_flareclass([7.8e-09, 4.7e-06] * u.watt/u.m**2)
+    array(['A0.78', 'C4.7'], dtype='<U5')
     """
-
-    if goesflux.value < 0:
-        raise ValueError("Flux cannot be negative")
-
-    decade = np.floor(np.log10(goesflux.to('W/m**2').value))
-    # invert the conversion dictionary
-    conversion_dict = {v: k for k, v in GOES_CONVERSION_DICT.items()}
-    if decade < -8:
-        str_class = "A"
-        decade = -8
-    elif decade > -4:
-        str_class = "X"
-        decade = -4
-    else:
-        str_class = conversion_dict.get(u.Quantity(10 ** decade, "W/m**2"))
-    goes_subclass = 10 ** -decade * goesflux.to('W/m**2').value
-    return f"{str_class}{goes_subclass:.3g}"
+    flux = goesflux.to_value('W/m**2')
+    with np.errstate(invalid='ignore'):
+        if np.any(flux < 0):
+            raise ValueError("Flux cannot be negative")
+
+    # Fluxes which are not finite, e.g. gaps in GOES data, have no class
+    finite = np.isfinite(flux)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        decade = np.clip(np.floor(np.log10(np.where(finite, flux, 1))), -8, -4)
+    str_class = np.array(['A', 'B', 'C', 'M', 'X'])[decade.astype(int) + 8]
+    goes_subclass = 10 ** -decade * flux
+    flareclass = np.char.add(str_class, np.char.mod('%.3g', goes_subclass))
+    flareclass = np.where(finite, flareclass, '')
+    if flareclass.ndim == 0:
+        return str(flareclass)
+    return flareclass
 
 
 def _assert_chrono_order(obstime):
@@ -2,10 +2,10 @@
 This module provides processing routines for data captured with the LYRA (Lyman
 Alpha Radiometer) instrument on Proba-2.
 """
+import os
 import csv
 import copy
 import sqlite3
-import datetime
 from warnings import warn
 from urllib.parse import urljoin
 
@@ -21,6 +21,17 @@ from sunpy.util.decorators import add_common_docstring
 from sunpy.util.exceptions import SunpyDeprecationWarning
 
 LYTAF_REMOTE_PATH = "http://proba2.oma.be/lyra/data/lytaf/"
+LYTAF_DTYPE = [("insertion_time", object),
+               ("begin_time", object),
+               ("reference_time", object),
+               ("end_time", object),
+               ("event_type", object),
+               ("event_definition", object)]
+
+# Parsed contents of the LYTAF databases, keyed by file path.  Each entry
+# stores the modification time of the file it was read from so that a
+# re-downloaded database is read again.
+_lytaf_database_cache = {}
 
 
 __all__ = ['remove_lytaf_events_from_timeseries',
@@ -272,13 +283,20 @@ def _remove_lytaf_events(time, channels=None, artifacts=None,
         artifacts_not_found = artifacts
     else:
         # Remove periods corresponding to artifacts from flux and time
-        # arrays.
-        bad_indices = np.empty(0, dtype="int64")
-        all_indices = np.arange(len(time))
-        for index in artifact_indices:
-            bad_period = np.logical_and(time >= lytaf["begin_time"][index].datetime,
-                                        time <= lytaf["end_time"][index].datetime)
-            bad_indices = np.append(bad_indices, all_indices[bad_period])
+        # arrays.  Sorting the artifacts by begin time and taking the running
+        # maximum of their end times merges overlapping periods, so a time is
+        # bad if it is no later than the merged end time of the last artifact
+        # that begins before it.
+        begin_times = _time_column_to_datetime64(lytaf["begin_time"][artifact_indices])
+        end_times = _time_column_to_datetime64(lytaf["end_time"][artifact_indices])
+        order = np.argsort(begin_times, kind="stable")
+        begin_times = begin_times[order]
+        merged_end_times = np.maximum.accumulate(end_times[order])
+        times = np.asarray(clean_time.datetime64, dtype="datetime64[ns]")
+        last_begun = np.searchsorted(begin_times, times, side="right") - 1
+        bad_period = np.logical_and(last_begun >= 0,
+                                    times <= merged_end_times[np.maximum(last_begun, 0)])
+        bad_indices = np.flatnonzero(bad_period)
         clean_time = np.delete(clean_time, bad_indices)
         if channels:
             for i, f in enumerate(clean_channels):
@@ -389,84 +407,36 @@ def get_lytaf_events(start_time, end_time, lytaf_path=None,
     start_time_uts = (start_time - Time('1970-1-1')).sec
     end_time_uts = (end_time - Time('1970-1-1')).sec
 
-    # Define numpy record array which will hold the information from
-    # the annotation file.
-    lytaf = np.empty((0,), dtype=[("insertion_time", object),
-                                  ("begin_time", object),
-                                  ("reference_time", object),
-                                  ("end_time", object),
-                                  ("event_type", object),
-                                  ("event_definition", object)])
-    # Access annotation files
+    # Collect the rows of each annotation file which fall in the given time
+    # range as whole columns, so that they can be combined in one go.
+    columns = {name: [] for name, _ in LYTAF_DTYPE}
     for suffix in combine_files:
-        # Check database files are present
         dbname = f"annotation_{suffix}.db"
         lytaf_path = cache.download(urljoin(LYTAF_REMOTE_PATH, dbname))
-        # Open SQLITE3 annotation files
-        connection = sqlite3.connect(str(lytaf_path))
-        # Create cursor to manipulate data in annotation file
-        cursor = connection.cursor()
-        # Check if lytaf file spans the start and end times defined by
-        # user.  If not, download newest version.
-        # First get start time of first event and end time of last
-        # event in lytaf.
-        cursor.execute("select begin_time from event order by begin_time asc "
-                       "limit 1;")
-        db_first_begin_time = cursor.fetchone()[0]
-        db_first_begin_time = datetime.datetime.fromtimestamp(db_first_begin_time)
-        cursor.execute("select end_time from event order by end_time desc "
-                       "limit 1;")
-        db_last_end_time = cursor.fetchone()[0]
-        db_last_end_time = datetime.datetime.fromtimestamp(db_last_end_time)
-        # If lytaf does not include entire input time range...
-        if not force_use_local_lytaf:
-            if end_time > db_last_end_time or start_time < db_first_begin_time:
-                # ...close lytaf file...
-                cursor.close()
-                connection.close()
-                # ...Download latest lytaf file...
+        events = _read_lytaf_database(lytaf_path)
+        # If lytaf does not include entire input time range download the
+        # newest version of the file.
+        if not force_use_local_lytaf and len(events["begin_time"]):
+            if (end_time_uts > events["end_time"].max() or
+                    start_time_uts < events["begin_time"].min()):
                 lytaf_path = cache.download(urljoin(LYTAF_REMOTE_PATH, dbname),
                                             redownload=True)
-                # ...and open new version of lytaf database.
-                connection = sqlite3.connect(str(lytaf_path))
-                cursor = connection.cursor()
-        # Select and extract the data from event table within file within
-        # given time range
-        cursor.execute("select insertion_time, begin_time, reference_time, "
-                       "end_time, eventType_id from event where end_time >= "
-                       "{} and begin_time <= "
-                       "{}".format(start_time_uts, end_time_uts))
-        event_rows = cursor.fetchall()
-        # Select and extract the event types from eventType table
-        cursor.row_factory = sqlite3.Row
-        cursor.execute("select * from eventType")
-        eventType_rows = cursor.fetchall()
-        eventType_id = []
-        eventType_type = []
-        eventType_definition = []
-        for eventType_row in eventType_rows:
-            eventType_id.append(eventType_row["id"])
-            eventType_type.append(eventType_row["type"])
-            eventType_definition.append(eventType_row["definition"])
-        # Enter desired information into the lytaf numpy record array
-        for event_row in event_rows:
-            id_index = eventType_id.index(event_row[4])
-            lytaf = np.append(lytaf,
-                              np.array((Time(datetime.datetime.utcfromtimestamp(event_row[0]),
-                                             format='datetime'),
-                                        Time(datetime.datetime.utcfromtimestamp(event_row[1]),
-                                             format='datetime'),
-                                        Time(datetime.datetime.utcfromtimestamp(event_row[2]),
-                                             format='datetime'),
-                                        Time(datetime.datetime.utcfromtimestamp(event_row[3]),
-                                             format='datetime'),
-                                        eventType_type[id_index],
-                                        eventType_definition[id_index]), dtype=lytaf.dtype))
-        # Close file
-        cursor.close()
-        connection.close()
-    # Sort lytaf in ascending order of begin time
-    np.recarray.sort(lytaf, order="begin_time")
+                events = _read_lytaf_database(lytaf_path)
+        # Select the events within given time range
+        in_range = np.logical_and(events["end_time"] >= start_time_uts,
+                                  events["begin_time"] <= end_time_uts)
+        for name in columns:
+            columns[name].append(events[name][in_range])
+    columns = {name: np.concatenate(values) for name, values in columns.items()}
+
+    # Sort events in ascending order of begin time and enter them into the
+    # lytaf numpy record array.
+    order = np.argsort(columns["begin_time"], kind="stable")
+    lytaf = np.empty((len(order),), dtype=LYTAF_DTYPE)
+    for name in ("insertion_time", "begin_time", "reference_time", "end_time"):
+        lytaf[name] = _unix_to_time_list(columns[name][order])
+    lytaf["event_type"] = columns["event_type"][order]
+    lytaf["event_definition"] = columns["event_definition"][order]
 
     # If csvfile kwarg is set, write out lytaf to csv file
     if csvfile:
@@ -520,21 +490,16 @@ def get_lytaf_event_types(lytaf_path=None, print_event_types=True):
         dbname = f"annotation_{suffix}.db"
         # Check database file exists, else download it.
         lytaf_path = cache.download(urljoin(LYTAF_REMOTE_PATH, dbname))
-        # Open SQLITE3 LYTAF files
-        connection = sqlite3.connect(str(lytaf_path))
-        # Create cursor to manipulate data in annotation file
-        cursor = connection.cursor()
-        cursor.execute("select type from eventType;")
-        event_types = cursor.fetchall()
+        event_types = _read_lytaf_database(lytaf_path)["event_types"]
         all_event_types.append(event_types)
         if print_event_types:
             print("----------------\n{} database\n----------------"
                   .format(suffix))
             for event_type in event_types:
-                print(str(event_type[0]))
+                print(str(event_type))
             print(" ")
     # Unpack event types in all_event_types into single list
-    all_event_types = [event_type[0] for event_types in all_event_types
+    all_event_types = [event_type for event_types in all_event_types
                        for event_type in event_types]
     return all_event_types
 
@@ -547,7 +512,8 @@ def split_series_using_lytaf(timearray, data, lytaf):
     Parameters
     ----------
     timearray : `numpy.ndarray`
-        An array of times understood by `sunpy.time.parse_time`.
+        An array of times understood by `sunpy.time.parse_time`, sorted in
+        ascending order.
     data : `numpy.ndarray`
         An array corresponding to the given time array.
     lytaf : `numpy.recarray`
@@ -561,24 +527,23 @@ def split_series_using_lytaf(timearray, data, lytaf):
         "good data".
     """
     n = len(timearray)
-    mask = np.ones(n)
-    el = len(lytaf)
 
-    # make the input time array a list of Time objects
-    time_array = [parse_time(tim) for tim in timearray]
+    # make the input time array an array of Time objects
+    time_array = parse_time(timearray)
+    times = np.asarray(time_array.datetime64, dtype="datetime64[ns]")
 
-    # scan through each entry retrieved from the LYTAF database
-    for j in range(0, el):
-        # want to mark all times with events as bad in the mask, i.e. = 0
-        start_dt = lytaf['begin_time'][j]
-        end_dt = lytaf['end_time'][j]
+    # find the start and end indices of each entry retrieved from the LYTAF
+    # database
+    start_ind = np.searchsorted(times, _time_column_to_datetime64(lytaf['begin_time']))
+    end_ind = np.searchsorted(times, _time_column_to_datetime64(lytaf['end_time']))
 
-        # find the start and end indices for each event
-        start_ind = np.searchsorted(time_array, start_dt)
-        end_ind = np.searchsorted(time_array, end_dt)
-
-        # append the mask to mark event as 'bad'
-        mask[start_ind:end_ind] = 0
+    # want to mark all times with events as bad in the mask, i.e. = 0
+    # Count the events covering each time by accumulating +1 where an event
+    # starts and -1 where it ends.
+    coverage = np.zeros(n + 1)
+    np.add.at(coverage, start_ind, 1)
+    np.add.at(coverage, end_ind, -1)
+    mask = (np.cumsum(coverage[:-1]) <= 0).astype(float)
 
     diffmask = np.diff(mask)
     tmp_discontinuity = np.where(diffmask != 0.)
@@ -588,7 +553,7 @@ def split_series_using_lytaf(timearray, data, lytaf):
     if len(disc) == 0:
         print('No events found within time series interval. '
               'Returning original series.')
-        return [{'subtimes': time_array, 'subdata': data}]
+        return [{'subtimes': list(time_array), 'subdata': data}]
 
     # -1 in diffmask means went from good data to bad
     # +1 means went from bad data to good
@@ -608,12 +573,12 @@ def split_series_using_lytaf(timearray, data, lytaf):
 
         if h == limit-1:
             # can't index h+1 here. Go to end of series
-            subtimes = time_array[disc[h]:-1]
+            subtimes = list(time_array[disc[h]:-1])
             subdata = data[disc[h]:-1]
             subseries = {'subtimes': subtimes, 'subdata': subdata}
             split_series.append(subseries)
         else:
-            subtimes = time_array[disc[h]:disc[h+1]]
+            subtimes = list(time_array[disc[h]:disc[h+1]])
             subdata = data[disc[h]:disc[h+1]]
             subseries = {'subtimes': subtimes, 'subdata': subdata}
             split_series.append(subseries)
@@ -621,6 +586,86 @@ def split_series_using_lytaf(timearray, data, lytaf):
     return split_series
 
 
+def _read_lytaf_database(lytaf_path):
+    """
+    Reads the events and event types from a LYTAF database.
+
+    The database is read with one query per table and the result is kept in
+    memory until the file on disk changes.
+
+    Parameters
+    ----------
+    lytaf_path : `str` or `pathlib.Path`
+        Path to the SQLITE3 LYTAF database.
+
+    Returns
+    -------
+    `dict`
+        The ``"insertion_time"``, ``"begin_time"``, ``"reference_time"`` and
+        ``"end_time"`` of each event as UNIX timestamps, its
+        ``"event_type"`` and ``"event_definition"``, and the list of all
+        ``"event_types"`` in the database.
+    """
+    lytaf_path = str(lytaf_path)
+    mtime = os.path.getmtime(lytaf_path)
+    cached = _lytaf_database_cache.get(lytaf_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    connection = sqlite3.connect(lytaf_path)
+    try:
+        cursor = connection.cursor()
+        cursor.execute("select event.insertion_time, event.begin_time, "
+                       "event.reference_time, event.end_time, eventType.type, "
+                       "eventType.definition from event join eventType on "
+                       "event.eventType_id = eventType.id")
+        event_rows = cursor.fetchall()
+        cursor.execute("select type from eventType;")
+        event_types = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+    finally:
+        connection.close()
+
+    columns = list(zip(*event_rows)) or [()] * 6
+    events = {"event_types": event_types}
+    for name, values in zip(("insertion_time", "begin_time", "reference_time", "end_time"),
+                            columns[:4]):
+        events[name] = np.array(values, dtype=float)
+    for name, values in zip(("event_type", "event_definition"), columns[4:]):
+        events[name] = np.empty(len(values), dtype=object)
+        events[name][:] = values
+
+    _lytaf_database_cache[lytaf_path] = (mtime, events)
+    return events
+
+
+def _unix_to_time_list(timestamps):
+    """
+    Converts an array of UNIX timestamps to a list of `~astropy.time.Time`.
+
+    The timestamps are converted in a single call, rounding to the nearest
+    microsecond as `datetime.datetime.utcfromtimestamp` does. The list only
+    holds one `~astropy.time.Time` per event for the object columns of the
+    LYTAF record array.
+    """
+    microseconds = np.round(np.asarray(timestamps, dtype=float) * 1e6).astype(np.int64)
+    if not len(microseconds):
+        return []
+    times = Time(microseconds.astype("datetime64[us]"), format="datetime64")
+    times.format = "datetime"
+    return list(times)
+
+
+def _time_column_to_datetime64(column):
+    """
+    Converts a column of times in a LYTAF record array to `numpy.datetime64`,
+    in a single call.
+    """
+    if not len(column):
+        return np.array([], dtype="datetime64[ns]")
+    return np.asarray(parse_time(list(column)).datetime64, dtype="datetime64[ns]")
+
+
 def _lytaf_event2string(integers):
     if isinstance(integers, int):
         integers = [integers]
@@ -5,6 +5,7 @@ data.
 
 import re
 import csv
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -187,16 +188,22 @@ def hsi_linecolors():
             'olive')
 
 
+# Upper limit on the number of (pixel, event) pairs whose phases are held in
+# memory at once when backprojecting.
+_BACKPROJECT_BLOCK_ELEMENTS = 2 ** 22
+
+
 def _backproject(calibrated_event_list, detector=8, pixel_size=(1., 1.),
-                 image_dim=(64, 64)):
+                 image_dim=(64, 64), chunk_size=None):
     """
     Given a stacked calibrated event list fits file create a back projection
     image for an individual detectors.
 
     Parameters
     ----------
-    calibrated_event_list : `str`
-        Filename of a RHESSI calibrated event list.
+    calibrated_event_list : `str` or `list`
+        Filename of a RHESSI calibrated event list, or the list of
+        `~sunpy.io.header.HDPair` already read from it.
     detector : `int`, optional
         The detector number.
     pixel_size : `tuple`, optional
@@ -205,6 +212,10 @@ def _backproject(calibrated_event_list, detector=8, pixel_size=(1., 1.),
     image_dim : `tuple`, optional
         A length 2 tuple with the size of the output image in number of pixels.
         Defaults to ``(64, 64)``.
+    chunk_size : `int`, optional
+        The number of events to backproject at a time.  Defaults to as many
+        events as keep the phases of one block of events for all pixels within
+        ``2**22`` elements.
 
     Returns
     -------
@@ -214,7 +225,10 @@ def _backproject(calibrated_event_list, detector=8, pixel_size=(1., 1.),
     # info_parameters = fits[2]
     # detector_efficiency = info_parameters.data.field('cbe_det_eff$$REL')
 
-    afits = sunpy.io.read_file(calibrated_event_list)
+    if isinstance(calibrated_event_list, list):
+        afits = calibrated_event_list
+    else:
+        afits = sunpy.io.read_file(calibrated_event_list)
 
     fits_detector_index = detector + 2
     detector_index = detector - 1
@@ -227,24 +241,37 @@ def _backproject(calibrated_event_list, detector=8, pixel_size=(1., 1.),
     grid_transmission = afits[fits_detector_index].data.field('gridtran')
     count = afits[fits_detector_index].data.field('count')
 
-    tempa = (np.arange(image_dim[0] * image_dim[1]) % image_dim[0]) - (image_dim[0]-1)/2.
-    tempb = tempa.reshape(image_dim[0], image_dim[1]).transpose().reshape(image_dim[0]*image_dim[1])
-
-    pixel = np.array(list(zip(tempa, tempb)))*pixel_size[0]
-    phase_pixel = (2 * np.pi/harm_ang_pitch) *\
-                  (np.outer(pixel[:, 0], np.cos(this_roll_angle - grid_angle)) -
-                   np.outer(pixel[:, 1], np.sin(this_roll_angle - grid_angle))) + phase_map_center
-    phase_modulation = np.cos(phase_pixel)
-    gridmod = modamp * grid_transmission
-    probability_of_transmission = gridmod * phase_modulation + grid_transmission
-    bproj_image = np.inner(probability_of_transmission, count).reshape(image_dim)
-
-    return bproj_image
+    # Pixel offsets from the centre of the image, in row-major order
+    nx, ny = int(image_dim[0]), int(image_dim[1])
+    pixel_x = np.tile((np.arange(nx) - (nx - 1)/2.) * pixel_size[0], ny)
+    pixel_y = np.repeat((np.arange(ny) - (ny - 1)/2.) * pixel_size[1], nx)
+
+    # The probability of transmission of each event through the grids at each
+    # pixel is gridmod * cos(phase) + grid_transmission, so the image is
+    # cos(phase) weighted by gridmod * count plus a constant background.
+    phase_x = (2 * np.pi/harm_ang_pitch) * np.cos(this_roll_angle - grid_angle)
+    phase_y = -(2 * np.pi/harm_ang_pitch) * np.sin(this_roll_angle - grid_angle)
+    weight = modamp * grid_transmission * count
+    bproj_image = np.full(nx * ny, np.inner(grid_transmission, count), dtype=float)
+
+    # Stream the events through in blocks so that memory use does not grow
+    # with the length of the event list.
+    if chunk_size is None:
+        chunk_size = max(1, _BACKPROJECT_BLOCK_ELEMENTS // (nx * ny))
+    for start in range(0, len(count), chunk_size):
+        block = slice(start, start + chunk_size)
+        phase_pixel = np.multiply.outer(pixel_x, phase_x[block])
+        phase_pixel += np.multiply.outer(pixel_y, phase_y[block])
+        phase_pixel += phase_map_center[block]
+        np.cos(phase_pixel, out=phase_pixel)
+        bproj_image += phase_pixel @ weight[block]
+
+    return bproj_image.reshape(ny, nx)
 
 
 @u.quantity_input
 def backprojection(calibrated_event_list, pixel_size: u.arcsec = (1., 1.) * u.arcsec,
-                   image_dim: u.pix = (64, 64) * u.pix):
+                   image_dim: u.pix = (64, 64) * u.pix, chunk_size=None, max_workers=None):
     """
     Given a stacked calibrated event list fits file create a back projection
     image.
@@ -263,6 +290,13 @@ def backprojection(calibrated_event_list, pixel_size: u.arcsec = (1., 1.) * u.ar
     image_dim : `tuple`, optional
         A length 2 tuple with the size of the output image in number of pixel
         `~astropy.units.Quantity` Defaults to ``(64, 64) * u.pix``.
+    chunk_size : `int`, optional
+        The number of events of each detector to backproject at a time.
+        Defaults to a block size which bounds the memory used for each
+        detector independently of the length of the event list.
+    max_workers : `int`, optional
+        The maximum number of detectors backprojected concurrently.
+        Defaults to the `concurrent.futures.ThreadPoolExecutor` default.
 
     Returns
     -------
@@ -280,28 +314,35 @@ def backprojection(calibrated_event_list, pixel_size: u.arcsec = (1., 1.) * u.ar
     xyoffset = info_parameters.data.field('USED_XYOFFSET')[0]
     time_range = TimeRange(info_parameters.data.field('ABSOLUTE_TIME_RANGE')[0], format='utime')
 
-    image = np.zeros(image_dim)
-
     # find out what detectors were used
     det_index_mask = afits[1].data.field('det_index_mask')[0]
     detector_list = (np.arange(9)+1) * np.array(det_index_mask)
-    for detector in detector_list:
-        if detector > 0:
-            image = image + _backproject(calibrated_event_list, detector=detector,
-                                         pixel_size=pixel_size.value, image_dim=image_dim)
+    detector_list = detector_list[detector_list > 0]
+
+    # The work for each detector is dominated by numpy operations which
+    # release the GIL, so the detectors are backprojected in threads.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        detector_images = executor.map(
+            lambda detector: _backproject(afits, detector=detector,
+                                          pixel_size=pixel_size.value, image_dim=image_dim,
+                                          chunk_size=chunk_size),
+            detector_list)
+        image = np.zeros((image_dim[1], image_dim[0]))
+        for detector_image in detector_images:
+            image = image + detector_image
 
     dict_header = {
         "DATE-OBS": time_range.center.strftime("%Y-%m-%d %H:%M:%S"),
-        "CDELT1": pixel_size[0],
+        "CDELT1": pixel_size[0].value,
         "NAXIS1": image_dim[0],
         "CRVAL1": xyoffset[0],
         "CRPIX1": image_dim[0]/2 + 0.5,
         "CUNIT1": "arcsec",
         "CTYPE1": "HPLN-TAN",
-        "CDELT2": pixel_size[1],
+        "CDELT2": pixel_size[1].value,
         "NAXIS2": image_dim[1],
         "CRVAL2": xyoffset[1],
-        "CRPIX2": image_dim[0]/2 + 0.5,
+        "CRPIX2": image_dim[1]/2 + 0.5,
         "CUNIT2": "arcsec",
         "CTYPE2": "HPLT-TAN",
         "HGLT_OBS": 0,
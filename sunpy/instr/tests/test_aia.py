@@ -1,8 +1,10 @@
 import tempfile
+import warnings
 
 import numpy as np
 import pytest
 
+import astropy.units as u
 from astropy.io.fits.verify import VerifyWarning
 
 import sunpy.data.test as test
@@ -64,3 +66,75 @@ def test_filesave(prep_map):
         prep_map.rotation_matrix, np.identity(2), rtol=1e-5, atol=1e-8)
     # Check level number
     assert load_map.meta['lvl_num'] == 1.5
+
+
+def test_aiaprep_sequence(original, prep_map):
+    sequence = sunpy.map.Map([original, original], sequence=True)
+    with pytest.warns(SunpyDeprecationWarning):
+        prep_sequence = aiaprep(sequence, max_workers=2)
+    assert isinstance(prep_sequence, sunpy.map.MapSequence)
+    assert len(prep_sequence) == 2
+    for amap in prep_sequence:
+        np.testing.assert_array_equal(amap.data, prep_map.data)
+        assert dict(amap.meta) == dict(prep_map.meta)
+
+
+def test_aiaprep_files():
+    filepath = test.get_test_filepath("aia_171_level1.fits")
+    with pytest.warns(SunpyDeprecationWarning):
+        prep_from_map = aiaprep(sunpy.map.Map(filepath))
+    with pytest.warns(SunpyDeprecationWarning):
+        prep_maps = aiaprep([filepath, filepath])
+    assert isinstance(prep_maps, list)
+    for amap in prep_maps:
+        np.testing.assert_array_equal(amap.data, prep_from_map.data)
+
+    # The data of a map of a file is read without being kept by the map
+    lazy_map = sunpy.map.Map(filepath, lazy=True)
+    with pytest.warns(SunpyDeprecationWarning):
+        prep_lazy = aiaprep([lazy_map])
+    np.testing.assert_array_equal(prep_lazy[0].data, prep_from_map.data)
+    assert not isinstance(lazy_map._data, np.ndarray)
+    assert lazy_map._data._data is None
+
+
+def rotate_prep(amap, order):
+    """
+    A level 1.5 map made with `~sunpy.map.GenericMap.rotate` and
+    `~sunpy.map.GenericMap.submap`, as aiaprep used to do it.
+    """
+    scale = (amap.scale[0] / 0.6).round() * 0.6 * u.arcsec
+    # The warnings are those of aiaprep, about the header of the HMI map, its
+    # NaNs and the data not being float64
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        rotated = amap.rotate(recenter=True, scale=(amap.scale[0] / scale).value, order=order,
+                              missing=amap.min())
+        center = np.floor(rotated.meta['crpix1'])
+        range_side = (center + np.array([-1, 1]) * amap.data.shape[0] / 2) * u.pix
+        return rotated.submap(u.Quantity([range_side[0], range_side[0]]),
+                              top_right=u.Quantity([range_side[1] - 1 * u.pix,
+                                                    range_side[1] - 1 * u.pix]))
+
+
+@pytest.mark.parametrize("order", [1, 3, 4])
+def test_aiaprep_options(original, order):
+    expected = rotate_prep(original, order)
+    with pytest.warns(SunpyDeprecationWarning):
+        prep = aiaprep(original, order=order)
+    np.testing.assert_allclose(prep.data, expected.data, rtol=1e-10, atol=1e-10)
+    for key in ['crpix1', 'crpix2', 'crval1', 'crval2', 'cdelt1', 'cdelt2',
+                'PC1_1', 'PC1_2', 'PC2_1', 'PC2_2', 'naxis1', 'naxis2']:
+        np.testing.assert_allclose(prep.meta[key], expected.meta[key], rtol=1e-10)
+
+    with pytest.warns(SunpyDeprecationWarning):
+        prep_low = aiaprep(original, order=order, dtype=np.float32)
+    assert prep_low.data.dtype == np.float32
+    assert prep_low.meta['bitpix'] == -32
+    np.testing.assert_array_equal(prep_low.data, prep.data.astype(np.float32))
+
+
+def test_aiaprep_invalid(original):
+    with pytest.warns(SunpyDeprecationWarning):
+        with pytest.raises(ValueError, match="Order must be between 0 and 5"):
+            aiaprep(original, order=6)
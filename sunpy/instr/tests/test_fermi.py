@@ -1,7 +1,9 @@
+import numpy as np
 import pytest
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_allclose, assert_almost_equal
 
 import astropy.units as u
+from astropy.io import fits
 
 from sunpy.instr import fermi
 from sunpy.time import parse_time
@@ -54,6 +56,55 @@ def test_detector_angles():
     assert_almost_equal(det2['n9'].value, 126.82, decimal=1)
 
 
+@pytest.fixture
+def pointing_file(tmp_path):
+    # A day of random spacecraft pointings at one minute cadence
+    rng = np.random.RandomState(0)
+    n = 1440
+    start = fermi.utc_to_met(parse_time('2012-02-15')).value + 60 * np.arange(n)
+    columns = [fits.Column('START', 'D', array=start),
+               fits.Column('RA_SCX', 'E', array=rng.uniform(0, 360, n)),
+               fits.Column('DEC_SCX', 'E', array=rng.uniform(-80, 80, n)),
+               fits.Column('RA_SCZ', 'E', array=rng.uniform(0, 360, n)),
+               fits.Column('DEC_SCZ', 'E', array=rng.uniform(-80, 80, n))]
+    filename = str(tmp_path / 'lat_spacecraft_weekly_test.fits')
+    fits.HDUList([fits.PrimaryHDU(),
+                  fits.BinTableHDU.from_columns(columns)]).writeto(filename)
+    return filename
+
+
+def test_detector_angles_for_times(pointing_file):
+    times = parse_time('2012-02-15 02:00') + [0, 30, 61, 3599] * u.s
+    angles = fermi.get_detector_sun_angles_for_times(times, pointing_file)
+    assert len(angles) == 13
+    for i, time in enumerate(times):
+        expected = fermi.get_detector_sun_angles_for_time(time, pointing_file)
+        assert angles['time'][i] == expected['time']
+        for detector in fermi.nai_detector_angles():
+            assert_allclose(angles[detector][i].value, expected[detector].value, atol=1e-8)
+
+
+def test_detector_angles_for_date(pointing_file):
+    angles = fermi.get_detector_sun_angles_for_date('2012-02-15', pointing_file)
+    assert len(angles['n0']) == 1440
+    scx, scz, tt = fermi.get_scx_scz_at_time(angles['time'][100], pointing_file)
+    detector_radecs = fermi.nai_detector_radecs(fermi.nai_detector_angles(), scx, scz, tt)
+    sun_pos = [fermi.sun.apparent_rightascension(tt).to('deg'), fermi.sun.apparent_declination(tt)]
+    expected = fermi.get_detector_separation_angles(detector_radecs, sun_pos)
+    for detector in fermi.nai_detector_angles():
+        assert_allclose(angles[detector][100].value, expected[detector].value, atol=1e-8)
+
+
+def test_rotate_vector_stacked():
+    rng = np.random.RandomState(0)
+    vectors = rng.normal(size=(4, 3))
+    axes = rng.normal(size=(4, 3))
+    thetas = rng.uniform(0, np.pi, 4)
+    rotated = fermi.rotate_vector(vectors, axes, thetas)
+    for vector, axis, theta, result in zip(vectors, axes, thetas, rotated):
+        assert_allclose(result, fermi.rotate_vector(vector, axis, theta))
+
+
 def test_met_to_utc():
     time = fermi.met_to_utc(500000000)
     assert (time - parse_time('2016-11-05T00:53:16.000')) < 1e-7 * u.s
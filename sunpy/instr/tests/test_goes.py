@@ -345,6 +345,25 @@ def test_calc_rad_loss_obstime():
                              rad_loss_expected["rad_loss_cumul"], rtol=0.0001)
 
 
+def test_get_lookup_table(tmp_path):
+    data_file = tmp_path / "goes_chianti_temp_cor.csv"
+    data_file.write_text("# A comment line\n"
+                         "log10temp_MK;ratioGOES15;ratioGOES14\n"
+                         "0.0;0.01;0.02\n"
+                         "0.5;0.05;0.06\n"
+                         "1.0;0.1;0.2\n"
+                         "1.5;0.3;0.4\n")
+    modelratio, modeltemp, spline = goes._get_lookup_table(data_file, "ratioGOES15",
+                                                           "log10temp_MK")
+    assert_array_equal(modelratio, [0.01, 0.05, 0.1, 0.3])
+    assert_array_equal(modeltemp, [0.0, 0.5, 1.0, 1.5])
+    # A second request for the same relationship is answered from memory
+    assert goes._get_lookup_table(data_file, "ratioGOES15", "log10temp_MK")[2] is spline
+    # Other columns of the same table are fitted separately
+    modelratio, _, _ = goes._get_lookup_table(data_file, "ratioGOES14", "log10temp_MK")
+    assert_array_equal(modelratio, [0.02, 0.06, 0.2, 0.4])
+
+
 @pytest.mark.remote_data
 def test_calculate_xray_luminosity(goeslc):
     # Check correct exceptions are raised to incorrect inputs
@@ -487,3 +506,67 @@ def test_joint_class_to_flux():
         assert c == goes.flux_to_flareclass(goes.flareclass_to_flux(c))
 
 # TODO add a test to check for raising error
+
+
+def test_flareclass_to_flux_array():
+    classes = np.array([['A3.49', 'a0.23', 'M1', 'X2.3'], ['M5.8', 'C2.3', 'B3.45', 'X20']])
+    fluxes = goes.flareclass_to_flux(classes)
+    assert fluxes.shape == (2, 4)
+    for c, f in zip(classes.flat, fluxes.flat):
+        assert_almost_equal(f.value, goes.flareclass_to_flux(c).value)
+    with pytest.raises(TypeError):
+        goes.flareclass_to_flux([1e-6, 1e-5])
+
+
+def test_flux_to_flareclass_array():
+    fluxes = Quantity([[1e-08, 0.00682, 7.8e-09], [0.00024, 0, 2.1e-05]], 'W/m**2')
+    classes = goes.flux_to_flareclass(fluxes)
+    assert classes.shape == (2, 3)
+    for f, c in zip(fluxes.flat, classes.flat):
+        assert c == goes.flux_to_flareclass(f)
+    with pytest.raises(ValueError):
+        goes.flux_to_flareclass(Quantity([1e-6, -1e-6], 'W/m**2'))
+
+
+def test_flux_to_flareclass_not_finite():
+    assert goes.flux_to_flareclass(np.nan * u.watt/u.m**2) == ''
+    classes = goes.flux_to_flareclass(Quantity([1e-6, np.nan, np.inf], 'W/m**2'))
+    assert classes.tolist() == ['C1', '', '']
+
+
+def test_goes_event_list_cache(monkeypatch):
+    queries = []
+
+    def fake_query(tstart, tend, goes_class_filter=None):
+        queries.append((tstart.isot, tend.isot))
+        events = []
+        for start in ['2011-06-07T06:16:00.000', '2011-06-07T18:00:00.000']:
+            start = parse_time(start)
+            if tstart <= start + 20 * u.min and start <= tend:
+                events.append({'event_date': start.strftime('%Y-%m-%d'),
+                               'start_time': start,
+                               'peak_time': start + 10 * u.min,
+                               'end_time': start + 20 * u.min,
+                               'goes_class': 'M2.5',
+                               'goes_location': (54, -21),
+                               'noaa_active_region': 11226})
+        return events
+
+    monkeypatch.setattr(goes, '_query_goes_events', fake_query)
+    monkeypatch.setattr(goes, '_goes_event_cache', {})
+
+    result = goes.get_goes_event_list(TimeRange('2011-06-07 00:00', '2011-06-07 12:00'))
+    assert len(result) == 1
+    result = goes.get_goes_event_list(TimeRange('2011-06-07 06:00', '2011-06-08 00:00'))
+    assert len(result) == 2
+    assert is_time_equal(result[0]['start_time'], parse_time((2011, 6, 7, 6, 16)))
+    assert queries == [('2011-06-07T00:00:00.000', '2011-06-07T12:00:00.000'),
+                       ('2011-06-07T12:00:00.000', '2011-06-08T00:00:00.000')]
+    # Fully covered ranges do not query again
+    result = goes.get_goes_event_list(TimeRange('2011-06-07 06:30', '2011-06-07 20:00'))
+    assert len(result) == 2
+    assert len(queries) == 2
+    # A different class filter is a separate catalog
+    goes.get_goes_event_list(TimeRange('2011-06-07 06:30', '2011-06-07 20:00'),
+                             goes_class_filter='M1')
+    assert len(queries) == 3
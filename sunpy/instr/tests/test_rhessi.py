@@ -6,6 +6,8 @@ from distutils.version import LooseVersion
 import numpy as np
 import pytest
 
+import astropy.units as u
+
 import sunpy.instr.rhessi as rhessi
 import sunpy.io
 import sunpy.map
@@ -34,6 +36,33 @@ def test_backprojection():
     assert is_time_equal(amap.date, parse_time((2002, 2, 20, 11, 6, 21)))
 
 
+def test_backproject_chunked():
+    """
+    Test that backprojecting the events in blocks gives the same image as
+    backprojecting them all at once.
+    """
+    test_filename = 'hsi_calib_ev_20020220_1106_20020220_1106_25_40.fits'
+    afits = sunpy.io.read_file(get_test_filepath(test_filename))
+    n_events = len(afits[10].data)
+    image = rhessi._backproject(afits, detector=8, chunk_size=n_events)
+    chunked_image = rhessi._backproject(afits, detector=8, chunk_size=7)
+    np.testing.assert_allclose(chunked_image, image, rtol=1e-10)
+
+
+def test_backprojection_image_dim():
+    """
+    Test that non-square images have the requested number of pixels on each
+    axis.
+    """
+    test_filename = 'hsi_calib_ev_20020220_1106_20020220_1106_25_40.fits'
+    amap = rhessi.backprojection(get_test_filepath(test_filename),
+                                 pixel_size=(2., 1.) * u.arcsec,
+                                 image_dim=(32, 48) * u.pix)
+    assert amap.data.shape == (48, 32)
+    assert amap.scale.axis1 == 2 * u.arcsec / u.pix
+    assert amap.reference_pixel.y == 23.5 * u.pix
+
+
 def test_parse_obssum_dbase_file():
     fname = get_test_filepath("hsi_obssumm_filedb_201104.txt")
     obssum = rhessi.parse_observing_summary_dbase_file(fname)
@@ -6,10 +6,16 @@ This is a modified version of `pyana <https://github.com/tvwerkhoven/pyana>`__.
 .. warning::
 
     The reading and writing of ana files is not supported under Windows.
+
+The C extension does not hold the GIL while reading or writing a file, so that
+several files can be read or written in parallel with a thread pool, e.g. with
+`concurrent.futures.ThreadPoolExecutor`.
 """
 import os
 import collections
 
+import numpy as np
+
 from sunpy.io.header import FileHeader
 
 try:
@@ -22,6 +28,15 @@ __all__ = ['read', 'get_header', 'write']
 
 HDPair = collections.namedtuple('HDPair', ['data', 'header'])
 
+# The first block of the header of an ANA file, which is little-endian
+_HEADER_DTYPE = np.dtype([('synch_pattern', '<u4'), ('subf', 'u1'), ('source', 'u1'),
+                          ('nhb', 'u1'), ('datyp', 'u1'), ('ndim', 'u1'), ('file_class', 'u1'),
+                          ('cbytes', 'u1', 4), ('free', 'u1', 178), ('dim', '<i4', 16),
+                          ('txt', 'S256')])
+_SYNCH_PATTERNS = (0x5555aaaa, 0xaaaa5555)
+# The size in bytes of each ANA data type
+_TYPE_SIZES = (1, 2, 4, 4, 8, 8)
+
 
 def read(filename, debug=False, **kwargs):
     """
@@ -72,18 +87,36 @@ def get_header(filename, debug=False):
     out : `list`
         A list of `~sunpy.io.header.FileHeader` headers.
 
+    Notes
+    -----
+    Only the header block at the start of the file is read, so the data is
+    never decompressed.
+
     Examples
     --------
     >>> header = sunpy.io.ana.get_header(filename)  # doctest: +SKIP
     """
-    if _pyana is None:
-        raise ImportError("C extension for ANA is missing, please rebuild")
-
-    data = _pyana.fzread(filename, debug)
-    return [FileHeader(data['header'])]
-
-
-def write(filename, data, comments=False, compress=True, debug=False):
+    with open(filename, 'rb') as fp:
+        block = fp.read(_HEADER_DTYPE.itemsize)
+    if len(block) < _HEADER_DTYPE.itemsize:
+        raise ValueError(f"{filename} is too short to be an ANA file.")
+    head = np.frombuffer(block, dtype=_HEADER_DTYPE)[0]
+    if head['synch_pattern'] not in _SYNCH_PATTERNS:
+        raise ValueError(f"{filename} does not have the ANA synch pattern.")
+    if head['datyp'] >= len(_TYPE_SIZES):
+        raise ValueError(f"{filename} has an unknown ANA data type.")
+    if debug:
+        print(f"get_header(): {head['ndim']} dimensions, data type {head['datyp']}")
+
+    dims = head['dim'][:head['ndim']]
+    # The same values as the header of the data read by the C extension
+    header = {'size': int(np.prod(dims, dtype=np.int64)) * _TYPE_SIZES[head['datyp']],
+              'dims': (int(head['dim'][0]), int(head['dim'][1])),
+              'header': head['txt'].split(b'\0', 1)[0].decode('utf-8')}
+    return [FileHeader(header)]
+
+
+def write(filename, data, comments=False, compress=True, debug=False, threads=1):
     """
     Saves a 2D `numpy.array` as an ANA file and returns the bytes written or
     ``NULL``.
@@ -100,6 +133,10 @@ def write(filename, data, comments=False, compress=True, debug=False):
         Compress the data with `True` (the default).
     debug : `bool`, optional
         Prints verbose debug information, defaults to `False`.
+    threads : `int`, optional
+        The number of threads used to compress the data, each compressing a
+        block of rows. The file written does not depend on the number of
+        threads. Defaults to 1.
 
     Returns
     -------
@@ -113,7 +150,10 @@ def write(filename, data, comments=False, compress=True, debug=False):
     if _pyana is None:
         raise ImportError("C extension for ANA is missing, please rebuild")
 
+    if threads < 1:
+        raise ValueError("threads must be a positive integer.")
+
     if comments:
-        return _pyana.fzwrite(filename, data, int(compress), comments, debug)
+        return _pyana.fzwrite(filename, data, int(compress), comments, debug, int(threads))
     else:
-        return _pyana.fzwrite(filename, data, int(compress), '', debug)
+        return _pyana.fzwrite(filename, data, int(compress), '', debug, int(threads))
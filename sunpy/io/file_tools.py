@@ -3,6 +3,7 @@ This module provides a generic file reader.
 """
 import os
 import re
+import zlib
 import pathlib
 
 try:
@@ -20,14 +21,29 @@ try:
 except ImportError:
     ana = None
 
-__all__ = ['read_file', 'read_file_header', 'write_file']
+__all__ = ['read_file', 'read_file_header', 'write_file', 'register_reader',
+           'unregister_reader']
 
 # File formats supported by SunPy
-_known_extensions = {
-    ('fts', 'fits'): 'fits',
-    ('jp2', 'j2k', 'jpc', 'jpt'): 'jp2',
-    ('fz', 'f0'): 'ana'
-}
+_known_extensions = {}
+
+# The magic bytes at the start of the files each reader reads, and the
+# optional reading features each reader supports, keyed by reader name
+_signatures = {}
+_capabilities = {}
+
+# Keywords of read_file which are only passed to readers with the matching
+# capability
+_OPTIONAL_READ_KEYWORDS = ('lazy', 'memmap', 'reduction_level', 'region')
+# The capability of readers which read the headers without the data
+_HEADER_ONLY = 'header'
+
+# Number of bytes read from the start of a file to detect its type
+_DETECT_SIZE = 512
+_GZIP_SIGNATURE = b'\x1f\x8b'
+
+# The detected type of each file, with the modification time of the file
+_filetype_cache = {}
 
 
 # Define a dict which raises a custom error message if the value is None
@@ -45,11 +61,98 @@ class Readers(dict):
 
 
 # Map the readers
-_readers = Readers({
-    'fits': fits,
-    'jp2': jp2,
-    'ana': ana
-})
+_readers = Readers()
+
+
+def register_reader(name, reader, extensions=(), signatures=(), capabilities=()):
+    """
+    Register a reader for a file format with `read_file`, `read_file_header`
+    and `write_file`.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the file format, which can be given as ``filetype``.
+        Registering a name again replaces the previous reader.
+    reader : module or object
+        An object with ``read(filepath, **kwargs)`` and
+        ``get_header(filepath, **kwargs)`` functions returning lists of
+        (data, header) pairs and headers, and optionally a
+        ``write(fname, data, header, **kwargs)`` function. `None` marks a
+        reader whose dependencies are not installed.
+    extensions : iterable of `str`, optional
+        The file extensions, without a leading dot, of this format.
+    signatures : iterable of `bytes` or `re.Pattern`, optional
+        The magic bytes at the start of files of this format, or compiled
+        regular expressions matching the start of these files. Gzip
+        compressed files are matched on their decompressed contents.
+    capabilities : iterable of `str`, optional
+        The optional keywords of `read_file` the reader supports, out of
+        ``'lazy'``, ``'memmap'``, ``'reduction_level'`` and ``'region'``.
+        These keywords are not passed to readers which do not support them.
+        ``'header'`` declares that ``get_header`` reads the headers without
+        the data. `read_file_header` takes the headers of the pairs returned
+        by ``read`` for readers which do not declare it.
+
+    Examples
+    --------
+    >>> import sunpy.io
+    >>> import myformat  # doctest: +SKIP
+    >>> sunpy.io.register_reader('myformat', myformat, extensions=('myf',),
+    ...                          signatures=(b'MYFORMAT',))  # doctest: +SKIP
+    """
+    for key in [key for key, value in _known_extensions.items() if value == name]:
+        del _known_extensions[key]
+    if extensions:
+        _known_extensions[tuple(extensions)] = name
+    _readers[name] = reader
+    _signatures[name] = list(signatures)
+    _capabilities[name] = frozenset(capabilities)
+    _filetype_cache.clear()
+
+
+def unregister_reader(name):
+    """
+    Remove a reader registered with `register_reader`, along with its file
+    extensions and signatures.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the file format.
+
+    Raises
+    ------
+    KeyError
+        If no reader is registered with this name.
+    """
+    if name not in _readers:
+        raise KeyError(f"No reader is registered for {name}.")
+    for key in [key for key, value in _known_extensions.items() if value == name]:
+        del _known_extensions[key]
+    del _readers[name]
+    del _signatures[name]
+    del _capabilities[name]
+    _filetype_cache.clear()
+
+
+register_reader('fits', fits, extensions=('fts', 'fits'),
+                # Some FITS files do not start with the SIMPLE keyword
+                signatures=(b'SIMPLE  =', re.compile(br"[A-Z0-9_]{0,8} *=")),
+                capabilities=('lazy', 'memmap', 'header'))
+# Checks for one of two signatures found at beginning of all JP2 files.
+# Adapted from ExifTool
+# [1] https://www.sno.phy.queensu.ca/~phil/exiftool/
+# [2] http://www.hlevkin.com/Standards/fcd15444-2.pdf
+# [3] http://www.hlevkin.com/Standards/fcd15444-1.pdf
+register_reader('jp2', jp2, extensions=('jp2', 'j2k', 'jpc', 'jpt'),
+                signatures=(b"\x00\x00\x00\x0cjP  \x0d\x0a\x87\x0a",
+                            b"\x00\x00\x00\x0cjP\x1a\x1a\x0d\x0a\x87\x0a"),
+                capabilities=('reduction_level', 'region', 'header'))
+# The synchronisation pattern of ANA files, in either byte order
+register_reader('ana', ana, extensions=('fz', 'f0'),
+                signatures=(b"\xaa\xaaUU", b"UU\xaa\xaa"),
+                capabilities=('header',))
 
 
 def read_file(filepath, filetype=None, **kwargs):
@@ -62,10 +165,24 @@ def read_file(filepath, filetype=None, **kwargs):
         The file to be read.
     filetype : `str`, optional
         Supported reader or extension to manually specify the filetype.
-        Supported readers are ('jp2', 'fits', 'ana')
+        Supported readers are ('jp2', 'fits', 'ana') and any reader added
+        with `register_reader`.
     memmap : `bool`, optional
         Should memory mapping be used, i.e. keep data on disk rather than in RAM.
         This is currently only supported by the FITS reader.
+    lazy : `bool`, optional
+        Should the data only be read when it is first accessed. The data of
+        each pair is then an array-like object that reads the data on first
+        use, and reads only the part requested when it is sliced.
+        This is currently only supported by the FITS reader.
+    reduction_level : `int`, optional
+        Read the image at a resolution reduced by a factor of
+        ``2**reduction_level`` along each axis.
+        This is currently only supported by the JPEG2000 reader.
+    region : `tuple`, optional
+        Only read the region ``(x0, y0, x1, y1)`` of the image, in zero-based
+        full resolution pixels.
+        This is currently only supported by the JPEG2000 reader.
 
     Returns
     -------
@@ -76,18 +193,8 @@ def read_file(filepath, filetype=None, **kwargs):
     -----
     Other keyword arguments are passed to the reader used.
     """
-    # Use the explicitly passed filetype
-    if filetype is not None:
-        return _readers[filetype].read(filepath, **kwargs)
-
-    # Go through the known extensions
-    for extension, readername in _known_extensions.items():
-        if filepath.endswith(extension) or filetype in extension:
-            return _readers[readername].read(filepath, **kwargs)
-
-    # If filetype is not apparent from the extension, attempt to detect it
-    readername = _detect_filetype(filepath)
-    return _readers[readername].read(filepath, **kwargs)
+    readername = _get_reader_name(filepath, filetype)
+    return _readers[readername].read(filepath, **_reader_kwargs(readername, kwargs))
 
 
 def read_file_header(filepath, filetype=None, **kwargs):
@@ -102,25 +209,25 @@ def read_file_header(filepath, filetype=None, **kwargs):
         The file from which the header is to be read.
     filetype : `str`
         Supported reader or extension to manually specify the filetype.
-        Supported readers are ('jp2', 'fits').
+        Supported readers are ('jp2', 'fits', 'ana') and any reader added
+        with `register_reader`.
 
     Returns
     -------
     headers : `list`
         A list of headers.
-    """
-    # Use the explicitly passed filetype
-    if filetype is not None:
-        return _readers[filetype].get_header(filepath, **kwargs)
-
-    # Go through the known extensions
-    for extension, readername in _known_extensions.items():
-        if filepath.endswith(extension) or filetype in extension:
-            return _readers[readername].get_header(filepath, **kwargs)
 
-    # If filetype is not apparent from the extension, attempt to detect it
-    readername = _detect_filetype(filepath)
-    return _readers[readername].get_header(filepath, **kwargs)
+    Notes
+    -----
+    Readers which do not declare the ``'header'`` capability of
+    `register_reader` read the whole file to get the headers.
+    """
+    readername = _get_reader_name(filepath, filetype)
+    reader = _readers[readername]
+    kwargs = _reader_kwargs(readername, kwargs)
+    if _HEADER_ONLY in _capabilities.get(readername, frozenset()):
+        return reader.get_header(filepath, **kwargs)
+    return [header for data, header in reader.read(filepath, **kwargs)]
 
 
 def write_file(fname, data, header, filetype='auto', **kwargs):
@@ -156,11 +263,44 @@ def write_file(fname, data, header, filetype='auto', **kwargs):
     raise ValueError(f"The filetype provided ({filetype}) is not supported")
 
 
+def _get_reader_name(filepath, filetype=None):
+    """
+    Return the name of the reader for a file, from the given filetype, the
+    file extension or the contents of the file, in that order.
+    """
+    # Use the explicitly passed filetype, which can be a reader or an extension
+    if filetype is not None:
+        for extensions, readername in _known_extensions.items():
+            if filetype in extensions:
+                return readername
+        return filetype
+
+    # Go through the known extensions
+    for extensions, readername in _known_extensions.items():
+        if filepath.endswith(extensions):
+            return readername
+
+    # If filetype is not apparent from the extension, attempt to detect it
+    return _detect_filetype(filepath)
+
+
+def _reader_kwargs(readername, kwargs):
+    """
+    Drop the optional keywords of `read_file` the reader does not support.
+    """
+    capabilities = _capabilities.get(readername, frozenset())
+    return {key: value for key, value in kwargs.items()
+            if key not in _OPTIONAL_READ_KEYWORDS or key in capabilities}
+
+
 def _detect_filetype(filepath):
     """
     Attempts to determine the type of data contained in a file. This is only
     used for reading because it opens the file to check the data.
 
+    The file type is detected from the magic bytes at the start of the file,
+    and is cached until the file is modified.
+
     Parameters
     ----------
     filepath : `str`
@@ -171,44 +311,30 @@ def _detect_filetype(filepath):
     filetype : `str`
         The type of file.
     """
+    filepath = os.fspath(filepath)
+    mtime = os.stat(filepath).st_mtime
+    cached = _filetype_cache.get(filepath)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
-    # Open file and read in first two lines
     with open(filepath, 'rb') as fp:
-        line1 = fp.readline()
-        line2 = fp.readline()
-        # Some FITS files do not have line breaks at the end of header cards.
-        fp.seek(0)
-        first80 = fp.read(80)
-
-    # FITS
-    #
-    # Check the extensions to see if it is a gzipped FITS file
-    filepath_rest_ext1, ext1 = os.path.splitext(filepath)
-    _, ext2 = os.path.splitext(filepath_rest_ext1)
-
-    gzip_extensions = [".gz"]
-    fits_extensions = [".fts", ".fit", ".fits"]
-    if (ext1 in gzip_extensions and ext2 in fits_extensions):
-        return 'fits'
-
-    # Check for "KEY_WORD  =" at beginning of file
-    match = re.match(br"[A-Z0-9_]{0,8} *=", first80)
-    if match is not None:
-        return 'fits'
-
-    # JPEG 2000
-    #
-    # Checks for one of two signatures found at beginning of all JP2 files.
-    # Adapted from ExifTool
-    # [1] https://www.sno.phy.queensu.ca/~phil/exiftool/
-    # [2] http://www.hlevkin.com/Standards/fcd15444-2.pdf
-    # [3] http://www.hlevkin.com/Standards/fcd15444-1.pdf
-    jp2_signatures = [b"\x00\x00\x00\x0cjP  \x0d\x0a\x87\x0a",
-                      b"\x00\x00\x00\x0cjP\x1a\x1a\x0d\x0a\x87\x0a"]
-
-    for sig in jp2_signatures:
-        if line1 + line2 == sig:
-            return 'jp2'
+        first_bytes = fp.read(_DETECT_SIZE)
+    # Check the decompressed start of gzipped files
+    if first_bytes.startswith(_GZIP_SIGNATURE):
+        try:
+            first_bytes = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(first_bytes)
+        except zlib.error:
+            pass
+
+    for readername, signatures in _signatures.items():
+        for signature in signatures:
+            if isinstance(signature, bytes):
+                match = first_bytes.startswith(signature)
+            else:
+                match = signature.match(first_bytes) is not None
+            if match:
+                _filetype_cache[filepath] = (mtime, readername)
+                return readername
 
     # Raise an error if an unsupported filetype is encountered
     raise UnrecognizedFileTypeError("The requested filetype is not currently "
@@ -26,21 +26,31 @@ Notes
 import os
 import re
 import sys
+import gzip
 import warnings
 import traceback
 import collections
+import collections.abc
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 from astropy.io import fits
 
 from sunpy.io.header import FileHeader
 from sunpy.util.exceptions import SunpyUserWarning
 
-__all__ = ['header_to_fits', 'read', 'get_header', 'write', 'extract_waveunit']
+__all__ = ['header_to_fits', 'read', 'get_header', 'scan_header', 'scan_headers', 'write',
+           'extract_waveunit']
 
 HDPair = collections.namedtuple('HDPair', ['data', 'header'])
 
+# Size of a FITS header or data block and of a header card, in bytes.
+_BLOCK_SIZE = 2880
+_CARD_SIZE = 80
+
 
-def read(filepath, hdus=None, memmap=None, **kwargs):
+def read(filepath, hdus=None, memmap=None, lazy=False, **kwargs):
     """
     Read a fits file.
 
@@ -50,6 +60,9 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
         The fits file to be read.
     hdus: `int` or iterable
         The HDU indexes to read from the file.
+    lazy : `bool`, optional
+        If `True`, the data of each HDU is not read until it is first used.
+        Defaults to `False`.
 
     Returns
     -------
@@ -63,13 +76,24 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
 
     Also all comments in the original file are concatenated into a single
     "comment" key in the returned FileHeader.
+
+    With ``lazy=True`` the data of each HDU is returned as an array-like
+    object with the ``shape`` and ``dtype`` of the data, which reads and
+    decodes (or decompresses) the data on first access. Indexing it with
+    integers and slices reads only the requested part of uncompressed
+    images, and of tile-compressed images if the installed version of
+    `astropy` supports sections of them. Errors in the data are then only
+    raised when it is accessed.
     """
     with fits.open(filepath, ignore_blank=True, memmap=memmap) as hdulist:
+        indices = range(len(hdulist)) if hdus is None else hdus
         if hdus is not None:
             if isinstance(hdus, int):
                 hdulist = hdulist[hdus]
-            elif isinstance(hdus, collections.Iterable):
-                hdulist = [hdulist[i] for i in hdus]
+                indices = [hdus]
+            elif isinstance(hdus, collections.abc.Iterable):
+                indices = list(hdus)
+                hdulist = [hdulist[i] for i in indices]
 
         hdulist = fits.hdu.HDUList(hdulist)
         for h in hdulist:
@@ -78,7 +102,10 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
         headers = get_header(hdulist)
         pairs = []
 
-        for i, (hdu, header) in enumerate(zip(hdulist, headers)):
+        for i, (hdu, header) in zip(indices, zip(hdulist, headers)):
+            if lazy:
+                pairs.append(HDPair(_lazy_hdu_data(filepath, i, hdu, memmap), header))
+                continue
             try:
                 pairs.append(HDPair(hdu.data, header))
             except (KeyError, ValueError) as e:
@@ -92,6 +119,119 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
     return pairs
 
 
+def _lazy_hdu_data(filepath, index, hdu, memmap=None):
+    """
+    Return a `_LazyHDUData` for the data of an HDU, or `None` if it has none.
+    """
+    header = hdu.header
+    naxis = header.get('NAXIS', 0)
+    if naxis == 0:
+        return None
+    shape = tuple(header[f'NAXIS{n}'] for n in range(naxis, 0, -1))
+    dtype = None
+    if isinstance(hdu, (fits.PrimaryHDU, fits.ImageHDU, fits.CompImageHDU)):
+        dtype = _image_dtype(header, compressed=isinstance(hdu, fits.CompImageHDU))
+    elif isinstance(hdu, (fits.BinTableHDU, fits.TableHDU)):
+        # Tables are read as one record per row
+        shape = shape[:1]
+    return _LazyHDUData(filepath, index, shape, dtype, memmap)
+
+
+def _image_dtype(header, compressed=False):
+    """
+    The dtype of the data astropy returns for an image HDU with this header.
+    """
+    bitpix = header['BITPIX']
+    bscale = header.get('BSCALE', 1)
+    bzero = header.get('BZERO', 0)
+    dtype = np.dtype(fits.hdu.base.BITPIX2DTYPE[bitpix])
+    if bscale == 1 and bzero == 0:
+        # Unscaled data is read straight from the big-endian file
+        return dtype if compressed else dtype.newbyteorder('>')
+    if bscale == 1 and bitpix in (16, 32, 64) and bzero == 1 << (bitpix - 1):
+        return np.dtype(f'uint{bitpix}')
+    if bscale == 1 and bitpix == 8 and bzero == -128 and 'int8' in fits.hdu.base.DTYPE2BITPIX:
+        # Signed bytes are stored as unsigned bytes with an offset, which
+        # astropy reads as such from version 4.3
+        return np.dtype('int8')
+    if bitpix > 16:
+        return np.dtype('float64')
+    if bitpix > 0:
+        return np.dtype('float32')
+    return dtype
+
+
+class _LazyHDUData:
+    """
+    The data of one HDU of a fits file, read when it is first used.
+
+    Converting this to an array reads all of the data, which is then kept.
+    Indexing it with integers and slices before then only reads the part of
+    the data that is needed, where `astropy.io.fits` supports this.
+    """
+
+    def __init__(self, filepath, index, shape, dtype=None, memmap=None):
+        self._filepath = filepath
+        self._index = index
+        self._shape = shape
+        self._dtype = dtype
+        self._memmap = memmap
+        self._data = None
+
+    @property
+    def shape(self):
+        return self._shape
+
+    @property
+    def ndim(self):
+        return len(self._shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self._shape))
+
+    @property
+    def dtype(self):
+        if self._dtype is None:
+            self._dtype = self._load().dtype
+        return self._dtype
+
+    def __len__(self):
+        return self._shape[0]
+
+    def __repr__(self):
+        return (f"<{type(self).__name__} HDU {self._index} of {self._filepath} "
+                f"shape={self._shape}>")
+
+    def _load(self):
+        if self._data is None:
+            with fits.open(self._filepath, ignore_blank=True, memmap=self._memmap) as hdulist:
+                self._data = hdulist[self._index].data
+        return self._data
+
+    def __array__(self, dtype=None):
+        return np.asarray(self._load(), dtype=dtype)
+
+    def __getitem__(self, item):
+        if self._data is not None or not _is_basic_index(item):
+            return self._load()[item]
+        with fits.open(self._filepath, ignore_blank=True, memmap=self._memmap) as hdulist:
+            hdu = hdulist[self._index]
+            section = getattr(hdu, 'section', None)
+            if section is None:
+                return np.array(hdu.data[item])
+            return np.array(section[item])
+
+
+def _is_basic_index(item):
+    """
+    Whether an index only contains integers and slices.
+    """
+    if not isinstance(item, tuple):
+        item = (item,)
+    return all(isinstance(i, (int, np.integer, slice)) for i in item)
+
+
 def get_header(afile):
     """
     Read a fits file and return just the headers for all HDU's. In each header,
@@ -117,36 +257,252 @@ def get_header(afile):
         close = True
 
     try:
-        headers = []
-        for hdu in hdulist:
-            try:
-                comment = "".join(hdu.header['COMMENT']).strip()
-            except KeyError:
-                comment = ""
-            try:
-                history = "".join(hdu.header['HISTORY']).strip()
-            except KeyError:
-                history = ""
-
-            header = FileHeader(hdu.header)
-            header['COMMENT'] = comment
-            header['HISTORY'] = history
-
-            # Strip out KEYCOMMENTS to a dict, the hard way
-            keydict = {}
-            for card in hdu.header.cards:
-                if card.comment != '':
-                    keydict.update({card.keyword: card.comment})
-            header['KEYCOMMENTS'] = keydict
-            header['WAVEUNIT'] = extract_waveunit(header)
-
-            headers.append(header)
+        headers = [_to_file_header(hdu.header) for hdu in hdulist]
     finally:
         if close:
             hdulist.close()
     return headers
 
 
+def _to_file_header(fits_header):
+    """
+    Convert a `~astropy.io.fits.Header` into a `~sunpy.io.header.FileHeader`.
+    """
+    try:
+        comment = "".join(fits_header['COMMENT']).strip()
+    except KeyError:
+        comment = ""
+    try:
+        history = "".join(fits_header['HISTORY']).strip()
+    except KeyError:
+        history = ""
+
+    header = FileHeader(fits_header)
+    header['COMMENT'] = comment
+    header['HISTORY'] = history
+
+    # Strip out KEYCOMMENTS to a dict, the hard way
+    keydict = {}
+    for card in fits_header.cards:
+        if card.comment != '':
+            keydict.update({card.keyword: card.comment})
+    header['KEYCOMMENTS'] = keydict
+    header['WAVEUNIT'] = extract_waveunit(header)
+    return header
+
+
+def scan_header(filepath, keywords=None, hdus=None):
+    """
+    Read the headers of a fits file without reading any of its data.
+
+    The header blocks are read straight from the file and the data blocks
+    are skipped over, so this is much faster than `get_header` for large or
+    compressed files. If ``keywords`` is given, only those cards are parsed.
+
+    Parameters
+    ----------
+    filepath : `str`
+        The fits file to be read.
+    keywords : iterable of `str`, optional
+        The header keywords to return. By default all keywords are returned.
+    hdus : `int` or iterable, optional
+        The HDU indexes to read from the file. By default all HDUs are read.
+
+    Returns
+    -------
+    headers : `list`
+        A list of `sunpy.io.header.FileHeader` headers.
+
+    Notes
+    -----
+    For the keywords it returns, each header matches the one returned by
+    `get_header`. Requested keywords that are not in a header are left out,
+    except for "COMMENT", "HISTORY" and "WAVEUNIT" which `get_header` always
+    sets. "KEYCOMMENTS" only holds the comments of the returned keywords.
+
+    The headers of tile-compressed image HDUs describe the compressed
+    binary table, so these are read with `astropy.io.fits`, which does not
+    decompress the data when only the header is accessed.
+    """
+    if isinstance(hdus, int):
+        hdus = [hdus]
+    elif hdus is not None:
+        hdus = list(hdus)
+    if keywords is not None:
+        keywords = {keyword.upper() for keyword in keywords}
+
+    raw_headers = _read_header_blocks(filepath, None if hdus is None else max(hdus) + 1)
+    if hdus is None:
+        hdus = range(len(raw_headers))
+
+    headers = []
+    for i in hdus:
+        raw_header = raw_headers[i]
+        if _raw_card_value(raw_header, 'ZIMAGE') is True:
+            with fits.open(filepath, ignore_blank=True) as hdulist:
+                hdulist[i].verify('silentfix')
+                fits_header = hdulist[i].header
+        elif keywords is None:
+            fits_header = fits.Header.fromstring(raw_header.decode('ascii'))
+            for card in fits_header.cards:
+                card.verify('silentfix')
+        else:
+            headers.append(_keywords_from_raw_header(raw_header, keywords))
+            continue
+
+        header = _to_file_header(fits_header)
+        if keywords is not None:
+            header = _select_keywords(header, keywords)
+        headers.append(header)
+    return headers
+
+
+def scan_headers(filepaths, keywords=None, hdus=None, max_workers=None):
+    """
+    Read the headers of many fits files without reading any of their data.
+
+    Parameters
+    ----------
+    filepaths : iterable of `str`
+        The fits files to be read.
+    keywords : iterable of `str`, optional
+        The header keywords to return. By default all keywords are returned.
+    hdus : `int` or iterable, optional
+        The HDU indexes to read from each file. By default all HDUs are read.
+    max_workers : `int`, optional
+        The number of threads used to read the files. By default this is
+        chosen by `concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    headers : `list`
+        For each file, the list of `sunpy.io.header.FileHeader` headers
+        returned by `scan_header`.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda filepath: scan_header(filepath, keywords, hdus),
+                                 filepaths))
+
+
+def _read_header_blocks(filepath, nhdus=None):
+    """
+    Return the raw header cards, up to but excluding the END card, of the
+    first ``nhdus`` HDUs in a fits file, skipping over all of the data.
+    """
+    raw_headers = []
+    with open(filepath, 'rb') as fileobj:
+        compressed = fileobj.read(2) == b'\x1f\x8b'
+    with (gzip.open if compressed else open)(filepath, 'rb') as fileobj:
+        if fileobj.read(6) != b'SIMPLE':
+            raise OSError(f"Empty or corrupt FITS file: {filepath}")
+        fileobj.seek(0)
+        while nhdus is None or len(raw_headers) < nhdus:
+            raw_header = bytearray()
+            end = -1
+            while end < 0:
+                block = fileobj.read(_BLOCK_SIZE)
+                if len(block) < _BLOCK_SIZE:
+                    if nhdus is not None or raw_header:
+                        raise IndexError(f"{filepath} has only {len(raw_headers)} HDUs")
+                    return raw_headers
+                for offset in range(0, _BLOCK_SIZE, _CARD_SIZE):
+                    if block[offset:offset + 8] == b'END     ':
+                        end = len(raw_header) + offset
+                        break
+                raw_header += block
+            raw_header = bytes(raw_header[:end])
+            raw_headers.append(raw_header)
+            fileobj.seek(_data_size(raw_header), os.SEEK_CUR)
+    return raw_headers
+
+
+def _data_size(raw_header):
+    """
+    The size in bytes, including padding, of the data following a header.
+    """
+    naxis = _raw_card_value(raw_header, 'NAXIS') or 0
+    if naxis == 0:
+        return 0
+    shape = [_raw_card_value(raw_header, f'NAXIS{i}') for i in range(1, naxis + 1)]
+    if shape[0] == 0 and _raw_card_value(raw_header, 'GROUPS') is True:
+        # Random groups data has NAXIS1 = 0
+        shape = shape[1:]
+    size = (abs(_raw_card_value(raw_header, 'BITPIX')) // 8 *
+            (_raw_card_value(raw_header, 'GCOUNT') or 1) *
+            ((_raw_card_value(raw_header, 'PCOUNT') or 0) + int(np.prod(shape))))
+    return -(-size // _BLOCK_SIZE) * _BLOCK_SIZE
+
+
+def _iter_raw_cards(raw_header):
+    """
+    Iterate over the ``(keyword, card image)`` of every card in a raw header.
+    Long string values continued over CONTINUE cards are returned as one
+    card image.
+    """
+    keyword = image = None
+    for offset in range(0, len(raw_header), _CARD_SIZE):
+        card = raw_header[offset:offset + _CARD_SIZE].decode('ascii')
+        if card.startswith('CONTINUE') and image is not None:
+            image += card
+            continue
+        if image is not None:
+            yield keyword, image
+        keyword, image = card[:8].rstrip(), card
+        if keyword == 'HIERARCH':
+            keyword = fits.Card.fromstring(card).keyword.upper()
+    if image is not None:
+        yield keyword, image
+
+
+def _raw_card_value(raw_header, keyword):
+    """
+    The value of the first card with the given keyword in a raw header, or
+    `None` if there is no such card.
+    """
+    keyword = keyword.encode('ascii').ljust(8)
+    for offset in range(0, len(raw_header), _CARD_SIZE):
+        if raw_header[offset:offset + 8] == keyword:
+            return fits.Card.fromstring(raw_header[offset:offset + _CARD_SIZE].decode('ascii')).value
+
+
+def _keywords_from_raw_header(raw_header, keywords):
+    """
+    Build a `~sunpy.io.header.FileHeader` holding only the given keywords,
+    parsing only the cards needed for them.
+    """
+    # WAVEUNIT is always derived from these cards by get_header
+    wanted = keywords | {'WAVEUNIT', 'WAVELNTH'} if 'WAVEUNIT' in keywords else keywords
+    cards = collections.OrderedDict()
+    commentary = {'COMMENT': [], 'HISTORY': []}
+    for keyword, image in _iter_raw_cards(raw_header):
+        if keyword in commentary and keyword in wanted:
+            commentary[keyword].append(fits.Card.fromstring(image).value)
+        elif keyword in wanted and keyword not in cards:
+            cards[keyword] = fits.Card.fromstring(image)
+            cards[keyword].verify('silentfix')
+
+    header = FileHeader((keyword, card.value) for keyword, card in cards.items())
+    header['KEYCOMMENTS'] = {keyword: card.comment for keyword, card in cards.items()
+                             if card.comment != ''}
+    for keyword, values in commentary.items():
+        if keyword in keywords:
+            header[keyword] = "".join(values).strip()
+    if 'WAVEUNIT' in keywords:
+        header['WAVEUNIT'] = extract_waveunit(header)
+    return _select_keywords(header, keywords)
+
+
+def _select_keywords(header, keywords):
+    """
+    Restrict a `~sunpy.io.header.FileHeader` to the given keywords.
+    """
+    selected = FileHeader((key, value) for key, value in header.items()
+                          if key in keywords)
+    selected['KEYCOMMENTS'] = {key: comment for key, comment in header['KEYCOMMENTS'].items()
+                               if key in keywords}
+    return selected
+
+
 def write(fname, data, header, hdu_type=None, **kwargs):
     """
     Take a data header pair and write a FITS file.
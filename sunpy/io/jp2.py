@@ -12,7 +12,7 @@ __all__ = ['read', 'get_header', 'write']
 HDPair = collections.namedtuple('HDPair', ['data', 'header'])
 
 
-def read(filepath, **kwargs):
+def read(filepath, reduction_level=0, region=None, **kwargs):
     """
     Reads a JPEG2000 file.
 
@@ -20,21 +20,77 @@ def read(filepath, **kwargs):
     ----------
     filepath : `str`
         The file to be read.
+    reduction_level : `int`, optional
+        Decode the image at a resolution reduced by a factor of
+        ``2**reduction_level`` along each axis. JPEG2000 files store these
+        lower resolutions, so this decodes fewer pixels. Defaults to 0, which
+        decodes the full resolution image.
+    region : `tuple`, optional
+        The region ``(x0, y0, x1, y1)`` of the image to decode, in zero-based
+        full resolution pixels with the origin at the bottom left of the image
+        and the end of each range excluded. If a reduced resolution is decoded,
+        the region is widened to a multiple of the reduction factor. Defaults
+        to the whole image.
 
     Returns
     -------
     pairs : `list`
         A list of (data, header) tuples.
+
+    Notes
+    -----
+    The reference pixel, pixel scale and image dimensions in the header are
+    changed to describe the decoded data.
     """
     # Put import here to speed up sunpy.io import time
     from glymur import Jp2k
-    header = get_header(filepath)
+    header = get_header(filepath)[0]
 
-    data = Jp2k(filepath)[...]
+    jp2 = Jp2k(filepath)
+    if reduction_level == 0 and region is None:
+        data = jp2[...]
+    else:
+        factor = 2 ** reduction_level
+        ny, nx = jp2.shape[:2]
+        x0, y0, x1, y1 = (0, 0, nx, ny) if region is None else region
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, nx), min(y1, ny)
+        if x0 >= x1 or y0 >= y1:
+            raise ValueError(f"The region {region} does not overlap the image.")
+        # The image is stored top row first, and the decoded pixels are aligned
+        # to multiples of the reduction factor from the top left corner.
+        row0 = (ny - y1) // factor * factor
+        col0 = x0 // factor * factor
+        data = jp2[row0:ny - y0:factor, col0:x1:factor]
+        header = _reduce_header(header, factor, col0, ny - row0 - factor * data.shape[0],
+                                data.shape)
     # For some reason Jp2k doesn't like [::-1], so do directly on the array
     data = data[::-1]
 
-    return [HDPair(data, header[0])]
+    return [HDPair(data, header)]
+
+
+def _reduce_header(header, factor, x0, y0, shape):
+    """
+    Update the pixel coordinates in a header for an image of the given shape
+    which has been cropped to start at full resolution pixel ``(x0, y0)`` and
+    then binned by ``factor``.
+    """
+    header = header.copy()
+    # Header keys keep the case used in the XML box
+    keys = {key.upper(): key for key in header}
+    for axis, start in ((1, x0), (2, y0)):
+        if f'CRPIX{axis}' in keys:
+            crpix = keys[f'CRPIX{axis}']
+            # Pixel centres of the binned image sit (factor - 1) / 2 full
+            # resolution pixels above the start of each bin.
+            header[crpix] = (header[crpix] - 1 - start - (factor - 1) / 2) / factor + 1
+        for key in (f'CDELT{axis}', f'CD{axis}_1', f'CD{axis}_2'):
+            if key in keys:
+                header[keys[key]] = header[keys[key]] * factor
+        if f'NAXIS{axis}' in keys:
+            header[keys[f'NAXIS{axis}']] = shape[2 - axis]
+    return header
 
 
 def get_header(filepath):
@@ -16,7 +16,9 @@ def get_extensions():
         cfg['include_dirs'].append(numpy.get_include())
         cfg['sources'].extend(sorted(glob(
             os.path.join(os.path.dirname(__file__), 'src', 'ana', '*.c'))))
-        cfg['extra_compile_args'].extend(['-std=c99', '-O3'])
+        cfg['extra_compile_args'].extend(['-std=c99', '-O3', '-pthread'])
+        # The compression of row blocks runs in parallel threads
+        cfg['extra_link_args'].append('-pthread')
         # Squash some warnings
         cfg['extra_compile_args'].extend(['-Wno-unused-but-set-variable',
                                           '-Wno-unused-variable',
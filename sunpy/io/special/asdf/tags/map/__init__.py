@@ -1,3 +1,3 @@
-from .generic_map import GenericMapType
+from .generic_map import GenericMapType, MapSequenceType
 
-__all__ = ["GenericMapType"]
+__all__ = ["GenericMapType", "MapSequenceType"]
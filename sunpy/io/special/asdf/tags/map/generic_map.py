@@ -1,12 +1,75 @@
 import numpy as np
 
 import astropy.units as u
+from asdf.util import get_array_base
 from asdf.yamlutil import custom_tree_to_tagged_tree
 
 import sunpy.map
 from sunpy.io.special.asdf.types import SunPyType
+from sunpy.map.mapbase import SpatialPair
 
-__all__ = ['GenericMapType']
+__all__ = ['GenericMapType', 'MapSequenceType']
+
+
+def _map_to_node(smap, meta):
+    """
+    The tree of a map, with the given metadata.
+    """
+    data = np.asarray(smap.data)
+    # ASDF writes the whole base array of a view, so only write a copy of the
+    # data when the map is a view of a larger array
+    base = get_array_base(data)
+    if base is not data and base.nbytes > data.nbytes:
+        data = data.copy()
+
+    node = {}
+    node['data'] = data
+    node['meta'] = meta
+    node['shift'] = u.Quantity(smap.shifted_value)
+    # Optional entries are left out rather than stored as null, which is not
+    # valid against the schema
+    for key in ['mask', 'uncertainty', 'unit']:
+        value = getattr(smap, key)
+        if value is not None:
+            node[key] = value
+
+    # TODO: Save some or all of plot_settings
+    # node['plot_settings'] = smap.plot_settings
+
+    return node
+
+
+def _map_from_node(node, meta):
+    """
+    Create a map from its tree, with the given metadata.
+
+    Uncompressed data is memory mapped when the file was opened with
+    ``copy_arrays=False`` (the default), so it is not copied.
+    """
+    # Use the factory here to get the correct subclass back
+    out_map = sunpy.map.Map(np.asarray(node['data']), meta)
+    # The metadata already includes the shift, so only record it
+    out_map._shift = SpatialPair(*node['shift'])
+
+    out_map.mask = node.get('mask')
+    out_map.uncertainty = node.get('uncertainty')
+    out_map._unit = node.get('unit')
+
+    return out_map
+
+
+def _assert_maps_equal(old, new):
+    np.testing.assert_allclose(old.data, new.data)
+
+    # Test the meta by force!
+    for ok, ov in old.meta.items():
+        assert ok in new.meta
+        assert new.meta[ok] == ov
+
+    assert u.allclose(old.shifted_value, new.shifted_value)
+    if old.mask is not None and new.mask is not None:
+        np.testing.assert_allclose(old.mask, new.mask)
+    assert old.unit == new.unit
 
 
 class GenericMapType(SunPyType):
@@ -17,28 +80,53 @@ class GenericMapType(SunPyType):
 
     @classmethod
     def from_tree(cls, node, ctx):
-        # Use the factory here to get the correct subclass back
-        out_map = sunpy.map.Map(np.asarray(node['data']), node['meta'])
-        out_map.shift(*node['shift'])
+        return _map_from_node(node, node['meta'])
 
-        out_map.mask = node.get('mask')
-        out_map.uncertainty = node.get('uncertainty')
-        out_map._unit = node.get('unit')
+    @classmethod
+    def to_tree(cls, smap, ctx):
+        return custom_tree_to_tagged_tree(_map_to_node(smap, dict(smap.meta)), ctx)
 
-        return out_map
+    @classmethod
+    def assert_equal(cls, old, new):
+        """
+        This method is used by asdf to test that to_tree > from_tree gives an
+        equivalent object.
+        """
+        _assert_maps_equal(old, new)
+
+
+class MapSequenceType(SunPyType):
+    """
+    A sequence of maps, each with its data in its own block.
+
+    The metadata which is the same for all the maps is only stored once.
+    """
+    name = "map/map_sequence"
+    types = ['sunpy.map.MapSequence']
+    requires = ['sunpy']
+    version = "1.0.0"
 
     @classmethod
-    def to_tree(cls, smap, ctx):
-        node = {}
-        node['data'] = np.asarray(smap.data)
-        node['meta'] = dict(smap.meta)
-        node['shift'] = u.Quantity(smap.shifted_value)
-        node['mask'] = smap.mask
-        node['uncertainty'] = smap.uncertainty
-        node['unit'] = smap.unit
+    def from_tree(cls, node, ctx):
+        maps = [_map_from_node(map_node, {**node['meta'], **map_node['meta']})
+                for map_node in node['maps']]
+        # The maps are stored in the order of the sequence
+        return sunpy.map.MapSequence(maps, sortby=None)
+
+    @classmethod
+    def to_tree(cls, sequence, ctx):
+        metas = [dict(amap.meta) for amap in sequence.maps]
+        shared = {}
+        if metas:
+            shared = {key: value for key, value in metas[0].items()
+                      if all(key in meta and _same_value(meta[key], value)
+                             for meta in metas[1:])}
 
-        # TODO: Save some or all of plot_settings
-        # node['plot_settings'] = smap.plot_settings
+        node = {}
+        node['meta'] = shared
+        node['maps'] = [_map_to_node(amap, {key: value for key, value in meta.items()
+                                            if key not in shared})
+                        for amap, meta in zip(sequence.maps, metas)]
 
         return custom_tree_to_tagged_tree(node, ctx)
 
@@ -48,14 +136,13 @@ class GenericMapType(SunPyType):
         This method is used by asdf to test that to_tree > from_tree gives an
         equivalent object.
         """
-        np.testing.assert_allclose(old.data, new.data)
+        assert len(old) == len(new)
+        for old_map, new_map in zip(old.maps, new.maps):
+            _assert_maps_equal(old_map, new_map)
 
-        # Test the meta by force!
-        for ok, ov in old.meta.items():
-            assert ok in new.meta
-            assert new.meta[ok] == ov
 
-        assert u.allclose(old.shifted_value, new.shifted_value)
-        if old.mask is not None and new.mask is not None:
-            np.testing.assert_allclose(old.mask, new.mask)
-        assert old.unit == new.unit
+def _same_value(value1, value2):
+    """
+    Whether two metadata values are the same, including their type.
+    """
+    return type(value1) is type(value2) and value1 == value2
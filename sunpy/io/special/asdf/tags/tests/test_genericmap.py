@@ -54,3 +54,48 @@ def test_genericmap_mask(aia171_test_map, tmpdir):
     tree = {'smap': aia171_test_map}
 
     assert_roundtrip_tree(tree, tmpdir, extensions=SunpyExtension())
+
+
+@skip_windows_asdf
+@asdf_entry_points
+def test_mapsequence(aia171_test_map, tmpdir):
+
+    shifted = aia171_test_map.shift(1 * u.arcsec, 2 * u.arcsec)
+    tree = {'seq': sunpy.map.MapSequence([aia171_test_map, shifted], sortby=None)}
+
+    assert_roundtrip_tree(tree, tmpdir, extensions=SunpyExtension())
+
+
+@skip_windows_asdf
+@asdf_entry_points
+def test_mapsequence_shared_meta(aia171_test_map, tmpdir):
+    other = sunpy.map.Map(aia171_test_map.data, aia171_test_map.meta.copy())
+    other.meta['exptime'] = 1.5
+    seq = sunpy.map.MapSequence([aia171_test_map, other], sortby=None)
+
+    with asdf.AsdfFile({'seq': seq}) as af:
+        af.write_to(str(tmpdir / 'seq.asdf'))
+
+    with asdf.open(str(tmpdir / 'seq.asdf'), _force_raw_types=True) as af:
+        node = af.tree['seq']
+        assert node['meta']['telescop'] == aia171_test_map.meta['telescop']
+        assert 'exptime' not in node['meta']
+        assert node['maps'][1]['meta']['exptime'] == 1.5
+
+    with asdf.open(str(tmpdir / 'seq.asdf')) as af:
+        assert af['seq'][0].meta['exptime'] == aia171_test_map.meta['exptime']
+        assert af['seq'][1].meta['exptime'] == 1.5
+
+
+@skip_windows_asdf
+@asdf_entry_points
+@pytest.mark.parametrize('compression', [None, 'zlib'])
+def test_genericmap_compression(aia171_test_map, tmpdir, compression):
+    with asdf.AsdfFile({'smap': aia171_test_map}) as af:
+        af.write_to(str(tmpdir / 'map.asdf'), all_array_compression=compression)
+
+    with asdf.open(str(tmpdir / 'map.asdf'), copy_arrays=True) as af:
+        smap = af['smap']
+    # The data is still available once the file is closed
+    assert smap.dimensions == aia171_test_map.dimensions
+    np.testing.assert_allclose(smap.data, aia171_test_map.data)
@@ -1,6 +1,7 @@
 """
 This module implements a solarsoft genx file reader.
 """
+import os
 import copy
 import xdrlib
 from collections import OrderedDict
@@ -9,6 +10,26 @@ import numpy as np
 
 __all__ = ['read_genx']
 
+# The big-endian type of the XDR items for each IDL numeric type, and whether
+# each value is stored as a pair of (real, imaginary) items
+_XDR_DTYPES = {
+    2: ('>i4', False),
+    3: ('>i4', False),
+    4: ('>f4', False),
+    5: ('>f8', False),
+    6: ('>f4', True),
+    9: ('>f8', True),
+    12: ('>u4', False),
+    13: ('>u4', False),
+    14: ('>i8', False),
+    15: ('>u8', False),
+}
+
+# The files which have been read, keyed by the path of the file and the tags
+# read, with the modification time and size of the file when it was read
+_genx_cache = {}
+_GENX_CACHE_SIZE = 16
+
 
 class SSWUnpacker(xdrlib.Unpacker):
     """
@@ -110,12 +131,66 @@ def struct_to_data(xdrdata, subskeleton):
             sswtype = sswsize[-2]
             if sswsize[0] == 0:
                 subskeleton[key] = types_dict[sswtype][0]()
+            elif sswtype in _XDR_DTYPES:
+                subskeleton[key] = _unpack_array(xdrdata, sswsize[-1], sswtype,
+                                                 types_dict[sswtype][1]).reshape(sswsize[1:-2][::-1])
             else:
                 subskeleton[key] = np.array(xdrdata.unpack_farray(sswsize[-1], types_dict[sswtype][0]),
                                             dtype=types_dict[sswtype][1]).reshape(sswsize[1:-2][::-1])
 
 
-def read_genx(filename):
+def _unpack_array(xdrdata, count, sswtype, dtype):
+    """
+    Read an array of ``count`` numbers of an IDL numeric type at once.
+    """
+    xdr_dtype, is_complex = _XDR_DTYPES[sswtype]
+    nitems = 2 * count if is_complex else count
+    position = xdrdata.get_position()
+    end = position + nitems * np.dtype(xdr_dtype).itemsize
+    buffer = xdrdata.get_buffer()
+    if end > len(buffer):
+        raise EOFError
+    items = np.frombuffer(buffer, dtype=xdr_dtype, count=nitems, offset=position)
+    xdrdata.set_position(end)
+
+    if is_complex:
+        # The values are converted to double precision complex numbers first,
+        # as when read one at a time
+        values = np.empty(count, dtype=np.complex128)
+        values.real = items[0::2]
+        values.imag = items[1::2]
+        return values.astype(dtype)
+    return items.astype(dtype)
+
+
+def _skip_data(xdrdata, subskeleton):
+    """
+    Move the position of ``xdrdata`` past the data of ``subskeleton``, without
+    converting it.
+    """
+    if isinstance(subskeleton, OrderedDict):
+        for value in subskeleton.values():
+            _skip_data(xdrdata, value)
+    elif isinstance(subskeleton, np.ndarray):
+        for elem in subskeleton.flatten():
+            _skip_data(xdrdata, elem)
+    else:
+        sswtype = subskeleton[-2]
+        count = 1 if subskeleton[0] == 0 else subskeleton[-1]
+        if sswtype in _XDR_DTYPES:
+            xdr_dtype, is_complex = _XDR_DTYPES[sswtype]
+            nbytes = count * np.dtype(xdr_dtype).itemsize * (2 if is_complex else 1)
+            position = xdrdata.get_position() + nbytes
+            if position > len(xdrdata.get_buffer()):
+                raise EOFError
+            xdrdata.set_position(position)
+        else:
+            # Strings have to be read to find their length
+            for _ in range(count):
+                xdrdata.unpack_string()
+
+
+def read_genx(filename, tags=None):
     """
     solarsoft genx file reader.
 
@@ -133,6 +208,10 @@ def read_genx(filename):
     ----------
     filename : `str`
         The genx file to be read
+    tags : iterable of `str`, optional
+        The names of the top level variables to read. The data of the other
+        variables is skipped without being converted. Defaults to reading all
+        variables.
 
     Returns
     -------
@@ -149,6 +228,28 @@ def read_genx(filename):
     a single integer is converted from 16 to 32/64 bits, and a float from 32 to 64.
 
     **Strings** read from genx files are assumed to be UTF-8.
+
+    Files are only parsed once: reading a file again returns a copy of the
+    earlier output, unless the file has been modified since.
+    """
+    stat = os.stat(filename)
+    if tags is not None:
+        tags = frozenset(tag.upper() for tag in tags)
+    key = (os.path.abspath(filename), tags)
+    version = (stat.st_mtime_ns, stat.st_size)
+    if key not in _genx_cache or _genx_cache[key][0] != version:
+        # An earlier version of the file is replaced
+        _genx_cache.pop(key, None)
+        if len(_genx_cache) >= _GENX_CACHE_SIZE:
+            _genx_cache.pop(next(iter(_genx_cache)))
+        _genx_cache[key] = version, _read_genx(filename, tags)
+    return copy.deepcopy(_genx_cache[key][1])
+
+
+def _read_genx(filename, tags):
+    """
+    Parse a genx file, reading only the top level variables in ``tags`` if
+    given.
     """
     with open(filename, mode='rb') as xdrfile:
         xdrdata = SSWUnpacker(xdrfile.read())
@@ -176,7 +277,16 @@ def read_genx(filename):
     mainsize = arr_size[2]  # NOQA
 
     skeleton = read_struct_skeleton(xdrdata)
-    struct_to_data(xdrdata, skeleton)
+    if tags is None:
+        struct_to_data(xdrdata, skeleton)
+    else:
+        for key in list(skeleton):
+            if key.upper() in tags:
+                variable = OrderedDict([(key, skeleton[key])])
+                struct_to_data(xdrdata, variable)
+                skeleton[key] = variable[key]
+            else:
+                _skip_data(xdrdata, skeleton.pop(key))
     xdrdata.done()
     skeleton['HEADER'] = OrderedDict([('VERSION', version), ('XDR', xdr), ('CREATION', creation)])
     if version == 2:
@@ -1,16 +1,23 @@
 """
 This module implements a SRS File Reader.
 """
+import os
+import pathlib
 import datetime
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
 import astropy.io.ascii
 import astropy.units as u
 from astropy.table import Column, MaskedColumn, QTable, vstack
+from astropy.time import Time
 
-__all__ = ['read_srs']
+__all__ = ['read_srs', 'read_srs_files']
+
+# Region numbers are given modulo 10000 in files issued after this date
+_NUMBER_WRAP_DATE = datetime.datetime(2002, 6, 15)
 
 
 def read_srs(filepath):
@@ -95,7 +102,24 @@ def make_table(header, section_lines):
     out_table.rename_column("MagType", "Mag Type")
     out_table.rename_column("LL", "Longitudinal Extent")
 
-    # Define a Solar Hemispere Unit
+    # Set units on the table
+    out_table['Carrington Longitude'].unit = u.deg
+    out_table['Area'].unit = _solar_hemisphere_unit()
+    out_table['Longitudinal Extent'].unit = u.deg
+
+    out_table.meta = meta_data
+
+    # Number should be formatted in 10000 after 2002-06-15.
+    if out_table.meta['issued'] > _NUMBER_WRAP_DATE:
+        out_table['Number'] += 10000
+
+    return QTable(out_table)
+
+
+def _solar_hemisphere_unit():
+    """
+    The unit of one millionth of a solar hemisphere.
+    """
     a = {}
     u.def_unit(
         "SH",
@@ -103,19 +127,112 @@ def make_table(header, section_lines):
         prefixes=True,
         namespace=a,
         doc="A solar hemisphere is the area of the visible solar disk.")
+    return a['uSH']
 
-    # Set units on the table
-    out_table['Carrington Longitude'].unit = u.deg
-    out_table['Area'].unit = a['uSH']
-    out_table['Longitudinal Extent'].unit = u.deg
 
-    out_table.meta = meta_data
+def read_srs_files(filepaths, max_workers=None):
+    """
+    Parse many SRS tables from NOAA SWPC into a single table.
 
-    # Number should be formatted in 10000 after 2002-06-15.
-    if out_table.meta['issued'] > datetime.datetime(2002, 6, 15):
-        out_table['Number'] += 10000
+    The files are read and split into sections in a pool of threads, and the
+    rows of all the files are then parsed together.
 
-    return QTable(out_table)
+    Parameters
+    ----------
+    filepaths : `str`, `pathlib.Path` or iterable of these
+        The SRS tables to read, or a directory from which all the files
+        matching ``*SRS.txt`` are read.
+    max_workers : `int`, optional
+        The maximum number of threads used to read the files. Defaults to the
+        default of `concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    table : `astropy.table.QTable`
+        The rows of all the SRS tables, in the order of the files, with the
+        same columns as returned by `read_srs` and an extra ``Date`` column
+        with the time each table was issued.
+    """
+    if isinstance(filepaths, (str, os.PathLike)):
+        path = pathlib.Path(filepaths)
+        filepaths = sorted(path.glob('*SRS.txt')) if path.is_dir() else [path]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        files = list(executor.map(_read_srs_rows, filepaths))
+
+    return _make_bulk_table(files)
+
+
+def _read_srs_rows(filepath):
+    """
+    Read a SRS table and return its issue time and, for each section, its ID,
+    column names and the whitespace separated values of its rows.
+    """
+    with open(filepath) as srs:
+        file_lines = srs.readlines()
+
+    header, section_lines = split_lines(file_lines)
+    meta_data = get_meta_data(header)
+
+    sections = []
+    for key, lines in zip(meta_data['id'].keys(), section_lines):
+        names = lines[1].split()
+        rows = [line.split() for line in lines[2:] if line.strip()]
+        for row in rows:
+            if len(row) != len(names):
+                raise ValueError(f"Could not parse the line {' '.join(row)} "
+                                 f"of section {key} of {filepath}")
+        sections.append((key, names, rows))
+
+    return meta_data['issued'], sections
+
+
+def _make_bulk_table(files):
+    """
+    Create the table of the rows of many SRS tables, as read by
+    `_read_srs_rows`.
+    """
+    names = ['Nmbr', 'Location', 'Lo', 'Area', 'Z', 'LL', 'NN', 'MagType', 'Lat']
+    values = {name: [] for name in names}
+    ids = []
+    dates = []
+    for issued, sections in files:
+        for key, section_names, rows in sections:
+            columns = dict(zip(section_names, zip(*rows)))
+            for name in names:
+                values[name].extend(columns.get(name, [''] * len(rows)))
+            ids.extend([key] * len(rows))
+            dates.extend([issued] * len(rows))
+
+    values = {name: np.array(value, dtype=str) for name, value in values.items()}
+    missing = {name: value == '' for name, value in values.items()}
+
+    def to_numbers(name, dtype):
+        return np.where(missing[name], '0', values[name]).astype(dtype)
+
+    latitude, longitude = _parse_angles(values['Location'])
+    lat_only, _ = _parse_angles(values['Lat'])
+    latitude = np.where(missing['Location'], lat_only, latitude)
+    longitude[missing['Location']] = np.nan
+
+    dates = np.array(dates, dtype='datetime64[us]')
+    number = to_numbers('Nmbr', np.int64)
+    number[dates > np.datetime64(_NUMBER_WRAP_DATE)] += 10000
+
+    out_table = QTable()
+    out_table['ID'] = Column(np.array(ids, dtype=str))
+    out_table['Number'] = Column(number)
+    out_table['Carrington Longitude'] = to_numbers('Lo', float) * u.deg
+    out_table['Area'] = to_numbers('Area', float) * _solar_hemisphere_unit()
+    out_table['Z'] = MaskedColumn(values['Z'], mask=missing['Z'])
+    out_table['Longitudinal Extent'] = to_numbers('LL', float) * u.deg
+    out_table['Number of Sunspots'] = MaskedColumn(to_numbers('NN', np.int64), mask=missing['NN'])
+    out_table['Mag Type'] = MaskedColumn(values['MagType'], mask=missing['MagType'])
+    out_table['Latitude'] = latitude * u.deg
+    out_table['Longitude'] = longitude * u.deg
+    out_table['Date'] = Time(dates, format='datetime64')
+    out_table['Date'].format = 'isot'
+    return out_table
 
 
 def split_lines(file_lines):
@@ -197,23 +314,52 @@ def parse_latitude(value):
         return latsign[value[0]] * float(value[1:3])
 
 
+def _parse_angles(values):
+    """
+    Parse an array of locations in the form "S10E10", or latitudes in the
+    form "S10", into arrays of latitudes and longitudes in degrees, which are
+    NaN where they are not given.
+    """
+    values = np.asarray(values, dtype=str)
+    width = max(int(np.char.str_len(values).max(initial=0)), 4)
+    chars = np.ascontiguousarray(values.astype(f'U{width}')).view('U1').reshape(len(values), width)
+    digits = chars.view(np.uint32).astype(np.int64) - ord('0')
+    is_digit = (digits >= 0) & (digits <= 9)
+
+    def parse_number(start, stop=None):
+        number = np.zeros(len(values))
+        for i in range(start, width if stop is None else stop):
+            number = np.where(is_digit[:, i], number * 10 + digits[:, i], number)
+        return number
+
+    has_latitude = np.any((chars == 'N') | (chars == 'S'), axis=1)
+    latitude = np.where(chars[:, 0] == 'N', 1, -1) * parse_number(1, 3)
+    has_longitude = np.any((chars == 'W') | (chars == 'E'), axis=1)
+    longitude = np.where(chars[:, 3] == 'W', 1, -1) * parse_number(4)
+    return (np.where(has_latitude, latitude, np.nan),
+            np.where(has_longitude, longitude, np.nan))
+
+
+def _column_strings(column):
+    """
+    The values of a column as strings, and whether each value is missing.
+    """
+    missing = np.ma.getmaskarray(column)
+    values = np.asarray(np.ma.getdata(column)).astype(str)
+    missing = missing | (values == '')
+    values[missing] = ''
+    return values, missing
+
+
 def parse_location(column):
     """
     Given a column of location data in the form "S10E10" convert to two columns
     of angles.
     """
-    latitude = MaskedColumn(name="Latitude", unit=u.deg)
-    longitude = MaskedColumn(name="Longitude", unit=u.deg)
-
-    for i, loc in enumerate(column):
-        if loc:
-            lati = parse_latitude(loc)
-            longi = parse_longitude(loc)
-            latitude = latitude.insert(i, lati)
-            longitude = longitude.insert(i, longi)
-        else:
-            latitude = latitude.insert(i, None, mask=True)
-            longitude = longitude.insert(i, None, mask=True)
+    values, missing = _column_strings(column)
+    latitude, longitude = _parse_angles(values)
+    latitude = MaskedColumn(latitude, name="Latitude", unit=u.deg, mask=missing)
+    longitude = MaskedColumn(longitude, name="Longitude", unit=u.deg, mask=missing)
     return latitude, longitude
 
 
@@ -222,8 +368,9 @@ def parse_lat_col(column, latitude_column):
     Given an input column of "latitudes" in the form "S10" parse them and add
     them to an existing column of "latitudes".
     """
-    for i, loc in enumerate(column):
-        if loc:
-            latitude_column.mask[i] = False
-            latitude_column[i] = parse_latitude(loc)
+    values, missing = _column_strings(column)
+    latitude, _ = _parse_angles(values)
+    present = ~missing
+    latitude_column.mask[present] = False
+    latitude_column[present] = latitude[present]
     return latitude_column
@@ -169,7 +169,11 @@ static PyObject *pyana_fzread(PyObject *self, PyObject *args) {
     // Read ANA file
     if (debug == 1)
         printf("pyana_fzread(): Reading in ANA file\n");
+    // The file is read and decompressed without holding the GIL, so that
+    // files can be read in parallel from Python threads
+    Py_BEGIN_ALLOW_THREADS
     anaraw = ana_fzread(filename, &ds, &nd, &header, &type, &size);
+    Py_END_ALLOW_THREADS
 
     if (NULL == anaraw) {
         PyErr_SetString(PyExc_ValueError, "In pyana_fzread: could not read ana file, data returned is NULL.");
@@ -215,6 +219,7 @@ static PyObject *pyana_fzread(PyObject *self, PyObject *args) {
     // Create numpy array from the data
     anadata = (PyArrayObject*) PyArray_SimpleNewFromData(nd, npy_dims,
         npy_type, (void *) anaraw);
+    free(npy_dims);
     // Make sure Python owns the data, so it will free the data after use
     PyArray_ENABLEFLAGS(anadata, NPY_ARRAY_OWNDATA);
 
@@ -229,12 +234,15 @@ static PyObject *pyana_fzread(PyObject *self, PyObject *args) {
     // See:
     // https://www.mail-archive.com/numpy-discussion@scipy.org/msg13354.html
     // ([Numpy-discussion] numpy CAPI questions)
-    return Py_BuildValue("{s:N,s:{s:i,s:(ii),s:s}}",
+    PyObject *result = Py_BuildValue("{s:N,s:{s:i,s:(ii),s:s}}",
         "data", anadata,
         "header",
         "size", size,
         "dims", ds[0], ds[1],
         "header", header);
+    free(ds);
+    free(header);
+    return result;
 }
 
 
@@ -244,13 +252,14 @@ static PyObject *pyana_fzread(PyObject *self, PyObject *args) {
 @param [in] data Data to write (numpy array)
 @param [in] compress Apply (Rice) compression or not
 @param [in] header Add a header to the file (or use default)
+@param [in] nthreads Number of threads used to compress the data
 @return number of bytes read on success, NULL pointer on failure
 */
 static PyObject * pyana_fzwrite(PyObject *self, PyObject *args) {
     // Python function arguments
     char *filename = NULL;
     PyArrayObject *anadata;
-    int compress = 1, debug=0;
+    int compress = 1, debug=0, nthreads=1;
     char *header = NULL;
     // Processed data goes here
     PyObject *anadata_align;
@@ -259,7 +268,7 @@ static PyObject * pyana_fzwrite(PyObject *self, PyObject *args) {
     int	type, d;
 
     // Parse arguments from Python function
-  if (!PyArg_ParseTuple(args, "sO!|isi", &filename, &PyArray_Type, &anadata, &compress, &header, &debug))
+  if (!PyArg_ParseTuple(args, "sO!|isii", &filename, &PyArray_Type, &anadata, &compress, &header, &debug, &nthreads))
       return NULL;
 
     // Check if filename was parsed correctly (should be, otherwise
@@ -327,7 +336,10 @@ static PyObject * pyana_fzwrite(PyObject *self, PyObject *args) {
     // Sanitize data, make a new array from the old array and force the
     // NPY_ARRAY_CARRAY_RO requirement which ensures a C-contiguous and aligned
     // array will be made
+    Py_INCREF(PyArray_DESCR(anadata));  // PyArray_FromArray steals this reference
     anadata_align = PyArray_FromArray(anadata, PyArray_DESCR(anadata),NPY_ARRAY_CARRAY_RO);
+    if (NULL == anadata_align)
+        return NULL;
 
     // Get a pointer to the aligned data
     anadata_bytes = (uint8_t*) PyArray_DATA(anadata_align);
@@ -350,12 +362,17 @@ static PyObject * pyana_fzwrite(PyObject *self, PyObject *args) {
 
     // Write ANA file
     if (debug == 1) printf("pyana_fzwrite(): Compress: %d\n", compress);
+    // The data is compressed and written without holding the GIL, so that
+    // files can be written in parallel from Python threads
+    Py_BEGIN_ALLOW_THREADS
     if (compress == 1)
-        ana_fcwrite(anadata_bytes, filename, dims, nd, header, type, 5);
+        ana_fcwrite(anadata_bytes, filename, dims, nd, header, type, 5, nthreads);
     else
         ana_fzwrite(anadata_bytes, filename, dims, nd, header, type);
+    Py_END_ALLOW_THREADS
 
     free(dims);
+    Py_DECREF(anadata_align);
     // If we didn't crash up to here, we're probably ok :P
     return Py_BuildValue("i", 1);
 }
@@ -6,6 +6,7 @@
 #include <stdarg.h>
 #include <stdint.h>
 #include <math.h>
+#include <pthread.h>
 
 #include "types.h"
 #include "anadecompress.h"
@@ -276,7 +277,77 @@ void ana_fzwrite(uint8_t *data,char *file_name,int *ds,int nd,char *header,int t
   }
 }
 
-void ana_fcwrite(uint8_t *data,char *file_name,int *ds,int nd,char *header,int type,int slice)	/* fcwrite subroutine */
+struct crunch_job{
+  uint8_t *q,*data;
+  int type,slice,nx,ny,limit,t_endian,res,threaded;
+};
+
+static void *crunch_worker(void *arg)
+{ // compress one block of rows, the runlength versions are not used for writing
+  struct crunch_job *job=(struct crunch_job*)arg;
+  switch(job->type){
+    case(0): job->res=anacrunch8(job->q,job->data,job->slice,job->nx,job->ny,job->limit,job->t_endian); break;
+    case(1): job->res=anacrunch(job->q,(int16_t*)job->data,job->slice,job->nx,job->ny,job->limit,job->t_endian); break;
+    case(2): job->res=anacrunch32(job->q,(int32_t*)job->data,job->slice,job->nx,job->ny,job->limit,job->t_endian); break;
+    default: job->res=-1;
+  }
+  return NULL;
+}
+
+static int ana_crunch_parallel(uint8_t *q,uint8_t *data,int type,int slice,int nx,int ny,int limit,int t_endian,int nthreads)
+{ // compress blocks of rows in separate threads into q, returns # of bytes in q
+  // every row starts on a byte boundary of the compressed stream, so the
+  // compressed blocks can be joined to give the same stream as anacrunch
+  int type_sizes[]=ANA_VAR_SZ;
+  if(nthreads>ny) nthreads=ny;
+  struct crunch_job *jobs=malloc(nthreads*sizeof(struct crunch_job));
+  pthread_t *threads=malloc(nthreads*sizeof(pthread_t));
+  int k,y0=0;
+  for(k=0;k<nthreads;++k){
+    int rows=ny/nthreads+(k<ny%nthreads);
+    int size=rows*nx*type_sizes[type];
+    jobs[k].limit=size+size/2+32;     // the crunch routines need some margin
+    jobs[k].q=malloc(jobs[k].limit);
+    jobs[k].data=data+(size_t)y0*nx*type_sizes[type];
+    jobs[k].type=type;
+    jobs[k].slice=slice;
+    jobs[k].nx=nx;
+    jobs[k].ny=rows;
+    jobs[k].t_endian=t_endian;
+    jobs[k].res=-1;
+    // compress the block in this thread if no new thread can be started
+    jobs[k].threaded=(pthread_create(&threads[k],NULL,crunch_worker,&jobs[k])==0);
+    if(!jobs[k].threaded) crunch_worker(&jobs[k]);
+    y0+=rows;
+  }
+  int res=14;
+  for(k=0;k<nthreads;++k){
+    if(jobs[k].threaded) pthread_join(threads[k],NULL);
+    if(jobs[k].res<0 || res<0) res=-1; else res+=jobs[k].res-14;
+  }
+  if(res>limit) res=-1;
+  if(res>0){
+    memcpy(q,jobs[0].q,14);           // the header of the first block, with bsize, slice and type
+    uint8_t *p=q+14;
+    for(k=0;k<nthreads;++k){
+      memcpy(p,jobs[k].q+14,jobs[k].res-14);
+      p+=jobs[k].res-14;
+    }
+    struct compresshead *ch=(struct compresshead*)q;
+    ch->tsize=res;
+    ch->nblocks=ny;
+    if(t_endian){
+      bswapi32(&(ch->tsize),1);
+      bswapi32(&(ch->nblocks),1);
+    }
+  }
+  for(k=0;k<nthreads;++k) free(jobs[k].q);
+  free(jobs);
+  free(threads);
+  return res;
+}
+
+void ana_fcwrite(uint8_t *data,char *file_name,int *ds,int nd,char *header,int type,int slice,int nthreads)	/* fcwrite subroutine */
 { // write standard f0 files, compressed format
   FILE *f=fopen(file_name,"w");
   fzhead_t fh;
@@ -322,7 +393,9 @@ void ana_fcwrite(uint8_t *data,char *file_name,int *ds,int nd,char *header,int t
 /* extended to 32 bits 2/4/96 */
   int res,crunch_slice=slice,runlengthflag=0,limit=size+size/2; // reserve a bit extra just in case
   uint8_t *q=malloc(limit);
-  switch(type){
+  if(nthreads>1 && ny>1 && !runlengthflag && type>=0 && type<=2){
+    res=ana_crunch_parallel(q,data,type,crunch_slice,nx,ny,limit,t_endian,nthreads);
+  }else switch(type){
     case(0):{
       if(runlengthflag)
         res=anacrunchrun8(q,data,crunch_slice,nx,ny,limit,t_endian);
@@ -29,6 +29,6 @@ int ck_synch_hd(FILE *fin, fzhead_t *fh, int t_endian);
 char *ana_fzhead(char *file_name); // fzhead subroutine
 uint8_t *ana_fzread(char *file_name, int **ds, int *nd, char **header, int *type, int *osz); // fzread subroutine
 void ana_fzwrite(uint8_t *data, char *file_name, int *ds, int nd, char *header, int py_type);	/* fcwrite subroutine */
-void ana_fcwrite(uint8_t *data, char *file_name, int *ds, int nd, char *header, int py_type, int slice);	/* fcwrite subroutine */
+void ana_fcwrite(uint8_t *data, char *file_name, int *ds, int nd, char *header, int py_type, int slice, int nthreads);	/* fcwrite subroutine */
 
 #endif				// __ANACOMPRESS_H__
@@ -75,3 +75,32 @@ def test_f32c():
     afilename = tempfile.NamedTemporaryFile().name
     with pytest.raises(RuntimeError):
         ana.write(afilename, img_f32, 'testcase', 1)
+
+
+@skip_ana
+@pytest.mark.parametrize('img', [img_i8, img_i16])
+def test_threaded_compression(img, tmp_path):
+    # Compressing row blocks in parallel writes the same file as in serial
+    serial = tmp_path / 'serial.fz'
+    threaded = tmp_path / 'threaded.fz'
+    ana.write(str(serial), img, 'testcase', 1, threads=1)
+    ana.write(str(threaded), img, 'testcase', 1, threads=4)
+    assert threaded.read_bytes() == serial.read_bytes()
+    assert np.all(ana.read(str(threaded))[0][0] == img)
+
+
+@skip_ana
+def test_threads_invalid():
+    afilename = tempfile.NamedTemporaryFile().name
+    with pytest.raises(ValueError):
+        ana.write(afilename, img_i16, 'testcase', 1, threads=0)
+
+
+@skip_ana
+@pytest.mark.parametrize('image, compress', [(img_i8, 0), (img_i16, 1), (img_f32, 0)])
+def test_get_header(image, compress):
+    afilename = tempfile.NamedTemporaryFile().name
+    ana.write(afilename, image, 'testcase', compress)
+    # The header is read without the data and matches the one read with it
+    assert ana.get_header(afilename) == [ana.read(afilename)[0].header]
+    assert ana.get_header(afilename)[0]['header'] == 'testcase'
@@ -135,3 +135,77 @@ class TestFiletools:
         os.remove("ana_test_write.fz")
 
     # TODO: Test write jp2
+
+
+@pytest.mark.parametrize('fname, filetype',
+                         [(AIA_171_IMAGE, 'fits'),
+                          (os.path.join(testpath, 'gzip_test.fits.gz'), 'fits'),
+                          (os.path.join(testpath, '2013_06_24__17_31_30_84__SDO_AIA_AIA_193.jp2'),
+                           'jp2'),
+                          (os.path.join(testpath, 'test_ana.fz'), 'ana')])
+def test_detect_filetype(fname, filetype):
+    assert sunpy.io.file_tools._detect_filetype(fname) == filetype
+
+
+def test_detect_filetype_cache(tmp_path):
+    fname = tmp_path / 'unknown'
+    fname.write_bytes(b'SIMPLE  =                    T')
+    assert sunpy.io.file_tools._detect_filetype(str(fname)) == 'fits'
+    fname.write_bytes(b'\xaa\xaaUU')
+    os.utime(fname, (0, 0))
+    assert sunpy.io.file_tools._detect_filetype(str(fname)) == 'ana'
+    fname.write_bytes(b'not a known format')
+    os.utime(fname, (1, 1))
+    with pytest.raises(sunpy.io.file_tools.UnrecognizedFileTypeError):
+        sunpy.io.file_tools._detect_filetype(str(fname))
+
+
+class MyReader:
+    @staticmethod
+    def read(filepath, **kwargs):
+        return [(np.zeros((2, 2)), sunpy.io.header.FileHeader(kwargs))]
+
+    @staticmethod
+    def get_header(filepath, **kwargs):
+        return [sunpy.io.header.FileHeader(kwargs, header_only=True)]
+
+
+@pytest.fixture
+def my_reader():
+    sunpy.io.register_reader('myformat', MyReader, extensions=('myf',),
+                             signatures=(b'MYFORMAT',), capabilities=('memmap',))
+    yield
+    sunpy.io.unregister_reader('myformat')
+
+
+def test_register_reader(my_reader, tmp_path):
+    fname = tmp_path / 'test.dat'
+    fname.write_bytes(b'MYFORMAT')
+    header = sunpy.io.read_file(str(fname), memmap=True, lazy=True)[0][1]
+    # Keywords for capabilities the reader does not declare are not passed on
+    assert header == {'memmap': True}
+    assert sunpy.io.read_file_header(str(tmp_path / 'test.myf'), extra=1)[0] == {'extra': 1}
+    assert sunpy.io.read_file(str(fname), filetype='myf')[0][0].shape == (2, 2)
+
+
+def test_read_file_header_only(my_reader, tmp_path):
+    fname = str(tmp_path / 'test.myf')
+    # Readers which do not read the headers on their own read the whole file
+    assert 'header_only' not in sunpy.io.read_file_header(fname)[0]
+    sunpy.io.register_reader('myformat', MyReader, extensions=('myf',),
+                             capabilities=('header',))
+    assert sunpy.io.read_file_header(fname)[0]['header_only']
+
+
+def test_unregister_reader(tmp_path):
+    fname = tmp_path / 'test.dat'
+    fname.write_bytes(b'MYFORMAT')
+    sunpy.io.register_reader('myformat', MyReader, extensions=('myf',), signatures=(b'MYFORMAT',))
+    assert sunpy.io.file_tools._detect_filetype(str(fname)) == 'myformat'
+    sunpy.io.unregister_reader('myformat')
+    with pytest.raises(sunpy.io.file_tools.UnrecognizedFileTypeError):
+        sunpy.io.file_tools._detect_filetype(str(fname))
+    with pytest.raises(ValueError, match="not supported"):
+        sunpy.io.write_file(str(tmp_path / 'test.myf'), np.zeros((2, 2)), {})
+    with pytest.raises(KeyError):
+        sunpy.io.unregister_reader('myformat')
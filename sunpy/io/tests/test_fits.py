@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 from collections import OrderedDict
 
+import numpy as np
 import pytest
 
 import astropy.io.fits as fits
@@ -124,3 +125,91 @@ def test_warn_longkey():
                                'goodkey': 'test'})
     assert 'GOODKEY' in fits.keys()
     assert 'BADLONGKEY' not in fits.keys()
+
+
+@pytest.mark.parametrize('fname', [RHESSI_IMAGE, EIT_195_IMAGE, AIA_171_IMAGE, SWAP_LEVEL1_IMAGE])
+def test_scan_header(fname):
+    headers = get_header(fname)
+    scanned = sunpy.io.fits.scan_header(fname)
+    assert len(scanned) == len(headers)
+    for header, scan in zip(headers, scanned):
+        assert list(scan.keys()) == list(header.keys())
+        for key in header:
+            if key != '':
+                assert scan[key] == header[key]
+
+
+@pytest.mark.parametrize('fname', [RHESSI_IMAGE, AIA_171_IMAGE])
+def test_scan_header_keywords(fname):
+    keywords = ['naxis1', 'DATE-OBS', 'WAVEUNIT', 'COMMENT', 'NOT-HERE']
+    header = get_header(fname)[0]
+    scan = sunpy.io.fits.scan_header(fname, keywords=keywords, hdus=0)[0]
+    expected = {'NAXIS1', 'DATE-OBS', 'WAVEUNIT', 'COMMENT'} & set(header.keys())
+    assert set(scan.keys()) == expected | {'KEYCOMMENTS'}
+    for key in expected:
+        assert scan[key] == header[key]
+    assert scan['KEYCOMMENTS'] == {key: comment for key, comment in header['KEYCOMMENTS'].items()
+                                   if key in expected}
+
+
+def test_scan_header_hdus():
+    headers = get_header(RHESSI_IMAGE)
+    scanned = sunpy.io.fits.scan_header(RHESSI_IMAGE, keywords=['EXTNAME'], hdus=[2, 1])
+    assert [scan.get('EXTNAME') for scan in scanned] == [headers[2].get('EXTNAME'),
+                                                         headers[1].get('EXTNAME')]
+    with pytest.raises(IndexError):
+        sunpy.io.fits.scan_header(RHESSI_IMAGE, hdus=10)
+
+
+def test_scan_header_not_fits(tmp_path):
+    fname = tmp_path / 'not_a.fits'
+    fname.write_bytes(b'not a fits file')
+    with pytest.raises(OSError):
+        sunpy.io.fits.scan_header(str(fname))
+
+
+def test_scan_headers():
+    fnames = [RHESSI_IMAGE, AIA_171_IMAGE, EIT_195_IMAGE]
+    scanned = sunpy.io.fits.scan_headers(fnames, keywords=['TELESCOP'], hdus=0, max_workers=2)
+    expected = [get_header(fname)[0]['TELESCOP'] for fname in fnames]
+    assert [scan[0]['TELESCOP'] for scan in scanned] == expected
+
+
+@pytest.mark.parametrize('fname', [RHESSI_IMAGE, EIT_195_IMAGE, AIA_171_IMAGE])
+def test_read_lazy(fname):
+    pairs = sunpy.io.fits.read(fname)
+    lazy_pairs = sunpy.io.fits.read(fname, lazy=True)
+    assert len(lazy_pairs) == len(pairs)
+    for (data, header), (lazy_data, lazy_header) in zip(pairs, lazy_pairs):
+        assert lazy_header == header
+        if data is None:
+            assert lazy_data is None
+            continue
+        assert lazy_data.shape == data.shape
+        assert lazy_data.dtype == data.dtype
+        if data.ndim == 2:
+            np.testing.assert_array_equal(lazy_data[1:5, 2:9], data[1:5, 2:9])
+        np.testing.assert_array_equal(np.asarray(lazy_data), data)
+
+
+@pytest.mark.parametrize('dtype, bzero', [('uint8', None), ('uint8', -128),
+                                          ('int16', None), ('uint16', None),
+                                          ('uint32', None), ('float32', None)])
+def test_read_lazy_dtype(tmpdir, dtype, bzero):
+    filename = str(tmpdir / 'data.fits')
+    fits.writeto(filename, np.arange(12, dtype=dtype).reshape(3, 4))
+    if bzero is not None:
+        # Signed bytes
+        fits.setval(filename, 'BZERO', value=bzero)
+    data = sunpy.io.fits.read(filename)[0].data
+    lazy_data = sunpy.io.fits.read(filename, lazy=True)[0].data
+    assert lazy_data.dtype == data.dtype
+    np.testing.assert_array_equal(np.asarray(lazy_data), data)
+
+
+def test_read_lazy_hdus():
+    pairs = sunpy.io.fits.read(RHESSI_IMAGE, hdus=[2, 1], lazy=True)
+    assert len(pairs) == 2
+    assert pairs[0].header == get_header(RHESSI_IMAGE)[2]
+    np.testing.assert_array_equal(np.asarray(pairs[1].data),
+                                  sunpy.io.fits.read(RHESSI_IMAGE, hdus=1)[0].data)
@@ -71,3 +71,43 @@ def test_date():
     creation = datetime.datetime.strptime(creation_str, '%a %b %d %H:%M:%S %Y')
     assert int(''.join(chr(x)
                        for x in TESTING['MYSTRUCTURE']['RANDOMNUMBERS'][-4:])) == creation.year
+
+
+def test_read_tags():
+    filename = os.path.join(rootdir, 'generated_sample.genx')
+    partial = genx.read_genx(filename, tags=['mystructure', 'MYNUMBER_ARRAY'])
+    assert list(partial.keys()) == ['MYNUMBER_ARRAY', 'MYSTRUCTURE', 'HEADER']
+    np.testing.assert_array_equal(partial['MYNUMBER_ARRAY'], TESTING['MYNUMBER_ARRAY'])
+    np.testing.assert_array_equal(partial['MYSTRUCTURE']['NESTEDSTRUCT']['MYLARRAYD'],
+                                  TESTING['MYSTRUCTURE']['NESTEDSTRUCT']['MYLARRAYD'])
+    assert partial['HEADER'] == TESTING['HEADER']
+
+
+def test_read_cached_copy():
+    filename = os.path.join(rootdir, 'generated_sample.genx')
+    first = genx.read_genx(filename)
+    first['MYSTRUCTURE']['MYFARRAY'][0] = 100
+    second = genx.read_genx(filename)
+    np.testing.assert_allclose(second['MYSTRUCTURE']['MYFARRAY'], np.arange(3.))
+
+
+def test_read_cache_replaced(tmp_path, monkeypatch):
+    monkeypatch.setattr(genx, '_genx_cache', {})
+    monkeypatch.setattr(genx, '_GENX_CACHE_SIZE', 2)
+    source = os.path.join(rootdir, 'generated_sample.genx')
+    filename = str(tmp_path / 'sample.genx')
+    with open(source, 'rb') as f:
+        contents = f.read()
+    with open(filename, 'wb') as f:
+        f.write(contents)
+    genx.read_genx(filename)
+    # A modified file replaces its earlier version in the cache
+    stat = os.stat(filename)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    genx.read_genx(filename)
+    assert len(genx._genx_cache) == 1
+    # The oldest files are dropped from the cache
+    genx.read_genx(source)
+    genx.read_genx(source, tags=['MYNUMBER_ARRAY'])
+    assert list(genx._genx_cache) == [(os.path.abspath(source), None),
+                                      (os.path.abspath(source), frozenset(['MYNUMBER_ARRAY']))]
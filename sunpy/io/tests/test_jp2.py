@@ -1,5 +1,7 @@
 import numpy as np
 
+import astropy.units as u
+
 from sunpy.data.test import get_test_filepath
 from sunpy.io.header import FileHeader
 from sunpy.map import GenericMap, Map
@@ -36,3 +38,43 @@ def test_read_file():
     """
     map_ = Map(AIA_193_JP2)
     assert isinstance(map_, GenericMap)
+
+
+def test_reduce_header():
+    from sunpy.io.jp2 import _reduce_header
+    header = FileHeader([('NAXIS1', 4096), ('NAXIS2', 4096), ('CDELT1', 0.6), ('CDELT2', 0.6),
+                         ('CRPIX1', 2048.5), ('CRPIX2', 2048.5)])
+    reduced = _reduce_header(header, 4, 1024, 512, (768, 512))
+    assert reduced['NAXIS1'] == 512
+    assert reduced['NAXIS2'] == 768
+    assert reduced['CDELT1'] == 2.4
+    assert reduced['CDELT2'] == 2.4
+    # The full resolution pixel centre of the reference pixel is unchanged
+    assert (reduced['CRPIX1'] - 1) * 4 + 1024 + 1.5 == header['CRPIX1'] - 1
+    assert (reduced['CRPIX2'] - 1) * 4 + 512 + 1.5 == header['CRPIX2'] - 1
+    assert header['CDELT1'] == 0.6
+
+
+@skip_glymur
+def test_read_reduced():
+    from sunpy.io.jp2 import read
+    data, header = read(AIA_193_JP2)[0]
+    reduced_data, reduced_header = read(AIA_193_JP2, reduction_level=2)[0]
+    assert reduced_data.shape == tuple(np.ceil(np.array(data.shape) / 4).astype(int))
+    assert reduced_header['CDELT1'] == 4 * header['CDELT1']
+    full_map = Map(AIA_193_JP2)
+    reduced_map = Map(AIA_193_JP2, reduction_level=2)
+    assert u.allclose(reduced_map.pixel_to_world(0 * u.pix, 0 * u.pix).Tx,
+                      full_map.pixel_to_world(1.5 * u.pix, 1.5 * u.pix).Tx)
+
+
+@skip_glymur
+def test_read_region():
+    from sunpy.io.jp2 import read
+    data = read(AIA_193_JP2)[0].data
+    region_data, region_header = read(AIA_193_JP2, region=(10, 20, 40, 30))[0]
+    np.testing.assert_array_equal(region_data, data[20:30, 10:40])
+    full_map = Map(AIA_193_JP2)
+    region_map = Map(AIA_193_JP2, region=(10, 20, 40, 30))
+    assert u.allclose(region_map.pixel_to_world(0 * u.pix, 0 * u.pix).Tx,
+                      full_map.pixel_to_world(10 * u.pix, 20 * u.pix).Tx)
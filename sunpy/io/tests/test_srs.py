@@ -55,3 +55,31 @@ def test_parse_location(loc_column, exp_longitude, exp_latitude):
     latitude, longitude = srs.parse_location(loc_column)
     assert_quantity_allclose(latitude, exp_latitude)
     assert_quantity_allclose(longitude, exp_longitude)
+
+
+@pytest.mark.filterwarnings('ignore:dropping mask in Quantity column')
+def test_read_srs_files():
+    paths = [os.path.join(testpath, elem['file']) for elem in filenames]
+    table = srs.read_srs_files(paths, max_workers=2)
+    assert len(table) == sum(elem['rows'] for elem in filenames)
+
+    start = 0
+    for path in paths:
+        single = srs.read_srs(path)
+        rows = table[start:start + len(single)]
+        start += len(single)
+        assert all(rows['Date'].datetime == single.meta['issued'])
+        for name in single.colnames:
+            expected = single[name]
+            if isinstance(expected, u.Quantity):
+                assert_quantity_allclose(rows[name], expected, equal_nan=True)
+            else:
+                # Masked values are None in both lists
+                assert rows[name].tolist() == expected.tolist()
+
+
+@pytest.mark.filterwarnings('ignore:dropping mask in Quantity column')
+def test_read_srs_files_directory():
+    table = srs.read_srs_files(testpath)
+    assert len(table) == sum(elem['rows'] for elem in filenames)
+    assert set(table['ID']) == {'I', 'IA', 'II'}
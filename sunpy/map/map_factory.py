@@ -13,6 +13,7 @@ from astropy.wcs import WCS
 from sunpy import log
 from sunpy.data import cache
 from sunpy.io.file_tools import read_file
+from sunpy.io.fits import _LazyHDUData
 from sunpy.io.header import FileHeader
 from sunpy.map.compositemap import CompositeMap
 from sunpy.map.mapbase import GenericMap, MapMetaValidationError
@@ -28,7 +29,8 @@ from sunpy.util.functools import seconddispatch
 from sunpy.util.metadata import MetaDict
 from sunpy.util.types import DatabaseEntryType
 
-SUPPORTED_ARRAY_TYPES = (np.ndarray,)
+# Data which is read from a file when it is first used is also accepted
+SUPPORTED_ARRAY_TYPES = (np.ndarray, _LazyHDUData)
 try:
     import dask.array
     SUPPORTED_ARRAY_TYPES += (dask.array.Array,)
@@ -294,7 +296,8 @@ class MapFactory(BasicRegistrationFactory):
         else:
             raise ValueError(f'Did not find any files at {arg}')
 
-    def __call__(self, *args, composite=False, sequence=False, silence_errors=False, **kwargs):
+    def __call__(self, *args, composite=False, sequence=False, silence_errors=False, lazy=False,
+                 reduction_level=0, region=None, **kwargs):
         """ Method for running the factory. Takes arbitrary arguments and
         keyword arguments and passes them to a sequence of pre-registered types
         to determine which is the correct Map-type to build.
@@ -314,13 +317,34 @@ class MapFactory(BasicRegistrationFactory):
         silence_errors : `bool`, optional
             If set, ignore data-header pairs which cause an exception.
             Default is ``False``.
+        lazy : `bool`, optional
+            If set, the data of maps read from FITS files is only read when it
+            is first accessed, and `~sunpy.map.GenericMap.submap` only reads
+            the part of the data it needs. Data-header pairs that are not used
+            to create a map are never read.
+            Default is ``False``.
+        reduction_level : `int`, optional
+            Read JPEG2000 files at a resolution reduced by a factor of
+            ``2**reduction_level`` along each axis.
+            Default is 0.
+        region : `tuple`, optional
+            Only read the region ``(x0, y0, x1, y1)``, in zero-based full
+            resolution pixels, of JPEG2000 files.
+            Default is the whole image.
 
         Notes
         -----
         Extra keyword arguments are passed through to `sunpy.io.read_file` such
         as `memmap` for FITS files.
         """
-        data_header_pairs = self._parse_args(*args, **kwargs)
+        read_kwargs = {}
+        if lazy:
+            read_kwargs['lazy'] = True
+        if reduction_level:
+            read_kwargs['reduction_level'] = reduction_level
+        if region is not None:
+            read_kwargs['region'] = region
+        data_header_pairs = self._parse_args(*args, **read_kwargs, **kwargs)
         new_maps = list()
 
         # Loop over each registered type and check to see if WidgetType
@@ -359,13 +383,9 @@ class MapFactory(BasicRegistrationFactory):
 
     def _check_registered_widgets(self, data, meta, **kwargs):
 
-        candidate_widget_types = list()
-
-        for key in self.registry:
-
-            # Call the registered validation function for each registered class
-            if self.registry[key](data, meta, **kwargs):
-                candidate_widget_types.append(key)
+        # Call the registered validation function of each registered class
+        # whose header prefixes match
+        candidate_widget_types = self._matching_widget_types(meta.get, data, meta, **kwargs)
 
         n_matches = len(candidate_widget_types)
 
@@ -33,6 +33,7 @@ from sunpy.coordinates import HeliographicCarrington, HeliographicStonyhurst, ge
 from sunpy.coordinates.utils import get_rectangle_coordinates
 from sunpy.image.resample import resample as sunpy_image_resample
 from sunpy.image.resample import reshape_image_to_4d_superpixel
+from sunpy.io.fits import _LazyHDUData
 from sunpy.sun import constants
 from sunpy.time import is_time, parse_time
 from sunpy.util import expand_list
@@ -42,6 +43,12 @@ from sunpy.util.functools import seconddispatch
 from sunpy.visualization import axis_labels_from_ctype, peek_show, wcsaxes_compat
 
 TIME_FORMAT = config.get("general", "time_format")
+# The number of contour levels of which the contours are cached by each map
+_CONTOUR_CACHE_SIZE = 32
+# The approximate number of pixels the previews of _repr_html_ are computed from
+_PREVIEW_SAMPLE_SIZE = 2**20
+# The number of pixels histogram counts at once
+_HISTOGRAM_BLOCK_SIZE = 2**20
 PixelPair = namedtuple('PixelPair', 'x y')
 SpatialPair = namedtuple('SpatialPair', 'axis1 axis2')
 
@@ -203,6 +210,8 @@ class GenericMap(NDData):
         # TODO: This should be a function of the header, not of the map
         self._validate_meta()
         self._shift = SpatialPair(0 * u.arcsec, 0 * u.arcsec)
+        # The array indices of the contours found by contours
+        self._contour_cache = {}
 
         if self.dtype == np.uint8:
             norm = None
@@ -220,6 +229,16 @@ class GenericMap(NDData):
         if plot_settings:
             self.plot_settings.update(plot_settings)
 
+    @property
+    def data(self):
+        """
+        The data array of the map.
+        """
+        if isinstance(self._data, _LazyHDUData):
+            # Data read lazily from a file is read in full on first access
+            self._data = np.asarray(self._data)
+        return self._data
+
     def __getitem__(self, key):
         """ This should allow indexing by physical coordinate """
         raise NotImplementedError(
@@ -269,10 +288,13 @@ class GenericMap(NDData):
                 <tr><th>{partial_html}</td></tr>
             </table>""").replace('\n', '')
 
-        # Handle bad values (infinite and NaN) in the data array
-        finite_data = self.data[np.isfinite(self.data)]
-        count_nan = np.isnan(self.data).sum()
-        count_inf = np.isinf(self.data).sum()
+        # Handle bad values (infinite and NaN) in the data array. The previews
+        # of large arrays are computed from a sample of the pixels.
+        stats = self.statistics(sample_size=_PREVIEW_SAMPLE_SIZE)
+        count_nan = stats['count_nan']
+        count_inf = stats['count_inf']
+        finite_data = _strided_sample(self.data, _PREVIEW_SAMPLE_SIZE)
+        finite_data = finite_data[np.isfinite(finite_data)]
 
         # Assemble an informational string with the counts of bad pixels
         bad_pixel_text = ""
@@ -323,7 +345,13 @@ class GenericMap(NDData):
         if fig.canvas is None:
             FigureCanvasBase(fig)
         ax = fig.subplots()
-        ax.hist(finite_data.ravel(), bins=100, histtype='stepfilled')
+        # The counts of a sample are scaled to the number of finite pixels
+        hist_range = (stats['min'], stats['max']) if stats['count'] else (0, 1)
+        counts, bin_edges = self.histogram(bins=100, value_range=hist_range,
+                                           sample_size=_PREVIEW_SAMPLE_SIZE)
+        if stats['count']:
+            counts = counts * ((self.data.size - count_nan - count_inf) / stats['count'])
+        ax.hist(bin_edges[:-1], bins=bin_edges, weights=counts, histtype='stepfilled')
         ax.set_facecolor('white')
         ax.semilogy()
         # Explicitly set the power limits for the X axis formatter to avoid text overlaps
@@ -524,14 +552,14 @@ class GenericMap(NDData):
         """
         The dimensions of the array (x axis first, y axis second).
         """
-        return PixelPair(*u.Quantity(np.flipud(self.data.shape), 'pixel'))
+        return PixelPair(*u.Quantity(np.flipud(self._data.shape), 'pixel'))
 
     @property
     def dtype(self):
         """
         The `numpy.dtype` of the array of the map.
         """
-        return self.data.dtype
+        return self._data.dtype
 
     @property
     @deprecated(since="2.1", message="Use map.data.size instead", alternative="map.data.size")
@@ -546,7 +574,7 @@ class GenericMap(NDData):
         """
         The value of `numpy.ndarray.ndim` of the data array of the map.
         """
-        return self.data.ndim
+        return self._data.ndim
 
     def std(self, *args, **kwargs):
         """
@@ -572,6 +600,103 @@ class GenericMap(NDData):
         """
         return self.data.max(*args, **kwargs)
 
+    def statistics(self, sample_size=None):
+        """
+        Calculate statistics of the finite values of the data array.
+
+        For large arrays, the statistics can be estimated quickly from a
+        regular sample of the pixels, for example for previews.
+
+        Parameters
+        ----------
+        sample_size : `int`, optional
+            The approximate number of pixels to estimate the statistics from.
+            The data array is sampled with the same stride along both axes.
+            Defaults to all the pixels, which gives the exact statistics.
+
+        Returns
+        -------
+        `dict`
+            The ``'min'``, ``'max'``, ``'mean'`` and ``'std'`` of the finite
+            values, the ``'count'`` of finite values they were computed from
+            and the standard error of the mean, ``'mean_error'``, which is 0
+            for the exact statistics. The ``'count_nan'`` and ``'count_inf'``
+            of NaN and infinite values are always those of the whole array.
+
+        Notes
+        -----
+        The minimum and maximum of a sample are only bounds of those of the
+        whole array, and the standard error of the mean assumes that the
+        sampled pixels are independent, which underestimates it for images
+        with structures on the scale of the stride.
+        """
+        if sample_size is not None and sample_size < 1:
+            raise ValueError("sample_size must be a positive number of pixels.")
+        data = np.asarray(self.data)
+        count_nan = int(np.isnan(data).sum())
+        count_inf = int(np.isinf(data).sum())
+        sample = _strided_sample(data, sample_size)
+        if sample is data and count_nan + count_inf == 0:
+            finite = data
+        else:
+            finite = sample[np.isfinite(sample)]
+
+        count = finite.size
+        if not count:
+            return {'min': np.nan, 'max': np.nan, 'mean': np.nan, 'std': np.nan, 'count': 0,
+                    'mean_error': np.nan, 'count_nan': count_nan, 'count_inf': count_inf}
+        std = finite.std()
+        return {'min': finite.min(), 'max': finite.max(), 'mean': finite.mean(), 'std': std,
+                'count': count, 'mean_error': 0. if sample is data else std / np.sqrt(count),
+                'count_nan': count_nan, 'count_inf': count_inf}
+
+    def histogram(self, bins=100, value_range=None, sample_size=None):
+        """
+        Calculate the histogram of the finite values of the data array.
+
+        The histogram is accumulated over blocks of rows, so that the finite
+        values are never copied all at once.
+
+        Parameters
+        ----------
+        bins : `int`, optional
+            The number of bins. Defaults to 100.
+        value_range : `tuple`, optional
+            The lower and upper edges of the bins. Defaults to the minimum and
+            maximum of the finite values given by `statistics`.
+        sample_size : `int`, optional
+            The approximate number of pixels to compute the histogram from, as
+            for `statistics`. Defaults to all the pixels.
+
+        Returns
+        -------
+        counts : `numpy.ndarray`
+            The number of values in each bin.
+        bin_edges : `numpy.ndarray`
+            The edges of the bins, as returned by `numpy.histogram`.
+
+        Notes
+        -----
+        The histogram of a sample counts the sampled pixels, so its counts have
+        to be multiplied by the number of finite pixels of the whole array and
+        divided by the ``'count'`` of `statistics` to estimate those of the
+        whole array.
+        """
+        if value_range is None:
+            stats = self.statistics(sample_size=sample_size)
+            value_range = (stats['min'], stats['max']) if stats['count'] else (0, 1)
+        elif sample_size is not None and sample_size < 1:
+            raise ValueError("sample_size must be a positive number of pixels.")
+        sample = _strided_sample(np.asarray(self.data), sample_size)
+
+        bin_edges = np.histogram_bin_edges([], bins=bins, range=value_range)
+        counts = np.zeros(bins, dtype=int)
+        step = max(1, _HISTOGRAM_BLOCK_SIZE // max(1, sample.shape[1]))
+        for start in range(0, sample.shape[0], step):
+            block = sample[start:start + step]
+            counts += np.histogram(block[np.isfinite(block)], bins=bins, range=value_range)[0]
+        return counts, bin_edges
+
 # #### Keyword attribute and other attribute definitions #### #
 
     def _base_name(self):
@@ -728,7 +853,7 @@ class GenericMap(NDData):
                                self.spatial_units[1] + axis2).to(self.spatial_units[1])).value
 
         # Create new map with the modification
-        new_map = self._new_instance(self.data, new_meta, self.plot_settings)
+        new_map = self._new_instance(self._data, new_meta, self.plot_settings)
 
         new_map._shift = SpatialPair(self.shifted_value[0] + axis1,
                                      self.shifted_value[1] + axis2)
@@ -973,9 +1098,9 @@ class GenericMap(NDData):
     def _fix_naxis(self):
         # If naxis is not specified, get it from the array shape
         if 'naxis1' not in self.meta:
-            self.meta['naxis1'] = self.data.shape[1]
+            self.meta['naxis1'] = self._data.shape[1]
         if 'naxis2' not in self.meta:
-            self.meta['naxis2'] = self.data.shape[0]
+            self.meta['naxis2'] = self._data.shape[0]
         if 'naxis' not in self.meta:
             self.meta['naxis'] = self.ndim
 
@@ -1283,13 +1408,6 @@ class GenericMap(NDData):
         if order not in range(6):
             raise ValueError("Order must be between 0 and 5.")
 
-        # The FITS-WCS transform is by definition defined around the
-        # reference coordinate in the header.
-        lon, lat = self._get_lon_lat(self.reference_coordinate.frame)
-        rotation_center = u.Quantity([lon, lat])
-
-        # Copy meta data
-        new_meta = self.meta.copy()
         if angle is not None:
             # Calculate the parameters for the affine_transform
             c = np.cos(np.deg2rad(angle))
@@ -1297,39 +1415,14 @@ class GenericMap(NDData):
             rmatrix = np.array([[c, -s],
                                 [s, c]])
 
-        # Calculate the shape in pixels to contain all of the image data
-        extent = np.max(np.abs(np.vstack((self.data.shape @ rmatrix,
-                                          self.data.shape @ rmatrix.T))), axis=0)
+        (pad_x, pad_y), (unpad_x, unpad_y), pixel_center, new_reference_pixel = \
+            self._rotation_geometry(rmatrix, recenter)
 
-        # Calculate the needed padding or unpadding
-        diff = np.asarray(np.ceil((extent - self.data.shape) / 2), dtype=int).ravel()
         # Pad the image array
-        pad_x = int(np.max((diff[1], 0)))
-        pad_y = int(np.max((diff[0], 0)))
-
         new_data = np.pad(self.data,
                           ((pad_y, pad_y), (pad_x, pad_x)),
                           mode='constant',
                           constant_values=(missing, missing))
-        new_meta['crpix1'] += pad_x
-        new_meta['crpix2'] += pad_y
-
-        # All of the following pixel calculations use a pixel origin of 0
-
-        pixel_array_center = (np.flipud(new_data.shape) - 1) / 2.0
-
-        # Create a temporary map so we can use it for the data to pixel calculation.
-        temp_map = self._new_instance(new_data, new_meta, self.plot_settings)
-
-        # Convert the axis of rotation from data coordinates to pixel coordinates
-        pixel_rotation_center = u.Quantity(temp_map.world_to_pixel(self.reference_coordinate,
-                                                                   origin=0)).value
-        del temp_map
-
-        if recenter:
-            pixel_center = pixel_rotation_center
-        else:
-            pixel_center = pixel_array_center
 
         # Apply the rotation to the image data
         new_data = affine_transform(new_data.T,
@@ -1339,13 +1432,77 @@ class GenericMap(NDData):
                                     recenter=recenter, missing=missing,
                                     use_scipy=use_scipy).T
 
+        # Unpad the array if necessary
+        if unpad_x > 0:
+            new_data = new_data[:, unpad_x:-unpad_x]
+        if unpad_y > 0:
+            new_data = new_data[unpad_y:-unpad_y, :]
+
+        new_meta = self._rotated_meta(rmatrix, scale, new_reference_pixel)
+
+        # Create new map with the modification
+        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
+
+        return new_map
+
+    def _rotation_geometry(self, rmatrix, recenter):
+        """
+        The geometry of the rotation of the data of this map by `rotate`,
+        which does not need the data to be read.
+
+        Returns the ``(x, y)`` padding of the data before the rotation and
+        unpadding of the data after it, the center of the rotation in the
+        padded data and the reference pixel of the rotated data, all in pixels
+        with an origin of 0.
+        """
+        shape = self._data.shape
+
+        # Calculate the shape in pixels to contain all of the image data
+        extent = np.max(np.abs(np.vstack((shape @ rmatrix,
+                                          shape @ rmatrix.T))), axis=0)
+
+        # Calculate the needed padding or unpadding
+        diff = np.asarray(np.ceil((extent - shape) / 2), dtype=int).ravel()
+        pad_x = int(np.max((diff[1], 0)))
+        pad_y = int(np.max((diff[0], 0)))
+        unpad_x = int(-np.min((diff[1], 0)))
+        unpad_y = int(-np.min((diff[0], 0)))
+
+        # All of the following pixel calculations use a pixel origin of 0
+
+        pixel_array_center = (np.flipud(shape) - 1) / 2.0 + [pad_x, pad_y]
+
+        # Convert the axis of rotation from data coordinates to pixel
+        # coordinates of the padded data
+        pixel_rotation_center = (u.Quantity(self.world_to_pixel(self.reference_coordinate,
+                                                                origin=0)).value
+                                 + [pad_x, pad_y])
+
         if recenter:
+            pixel_center = pixel_rotation_center
             new_reference_pixel = pixel_array_center
         else:
+            pixel_center = pixel_array_center
             # Calculate new pixel coordinates for the rotation center
             new_reference_pixel = pixel_center + np.dot(rmatrix,
                                                         pixel_rotation_center - pixel_center)
             new_reference_pixel = np.array(new_reference_pixel).ravel()
+        new_reference_pixel = new_reference_pixel - [unpad_x, unpad_y]
+
+        return (pad_x, pad_y), (unpad_x, unpad_y), pixel_center, new_reference_pixel
+
+    def _rotated_meta(self, rmatrix, scale, new_reference_pixel):
+        """
+        The metadata of this map after the rotation of its data by `rotate`,
+        given the reference pixel of the rotated data with an origin of 0.
+        """
+        # The FITS-WCS transform is by definition defined around the
+        # reference coordinate in the header.
+        lon, lat = self._get_lon_lat(self.reference_coordinate.frame)
+        rotation_center = u.Quantity([lon, lat])
+
+        # Copy meta data
+        new_meta = self.meta.copy()
 
         # Define the new reference_pixel
         new_meta['crval1'] = rotation_center[0].value
@@ -1353,16 +1510,6 @@ class GenericMap(NDData):
         new_meta['crpix1'] = new_reference_pixel[0] + 1  # FITS pixel origin is 1
         new_meta['crpix2'] = new_reference_pixel[1] + 1  # FITS pixel origin is 1
 
-        # Unpad the array if necessary
-        unpad_x = -np.min((diff[1], 0))
-        if unpad_x > 0:
-            new_data = new_data[:, unpad_x:-unpad_x]
-            new_meta['crpix1'] -= unpad_x
-        unpad_y = -np.min((diff[0], 0))
-        if unpad_y > 0:
-            new_data = new_data[unpad_y:-unpad_y, :]
-            new_meta['crpix2'] -= unpad_y
-
         # Calculate the new rotation matrix to store in the header by
         # "subtracting" the rotation matrix used in the rotate from the old one
         # That being calculate the dot product of the old header data with the
@@ -1387,14 +1534,12 @@ class GenericMap(NDData):
         new_meta.pop('CD2_1', None)
         new_meta.pop('CD2_2', None)
 
-        # Create new map with the modification
-        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
-
-        return new_map
+        return new_meta
 
     @deprecate_positional_args_since(since='2.0', keyword_only=('width', 'height'))
     @u.quantity_input
-    def submap(self, bottom_left, *, top_right=None, width: (u.deg, u.pix) = None, height: (u.deg, u.pix) = None):
+    def submap(self, bottom_left, *, top_right=None, width: (u.deg, u.pix) = None, height: (u.deg, u.pix) = None,
+               view=False):
         """
         Returns a submap defined by a rectangle.
 
@@ -1417,6 +1562,12 @@ class GenericMap(NDData):
             The width of the rectangle. Required if ``top_right`` is omitted.
         height : `astropy.units.Quantity`
             The height of the rectangle. Required if ``top_right`` is omitted.
+        view : `bool`, optional
+            If `False` (the default), the data and mask of the submap are
+            copies. If `True`, they are views of the data and mask of this
+            map, so no memory is used for them. Such a submap is immutable:
+            its data and mask are read-only and can not be modified in place.
+            A writeable copy can be made with ``submap.data.copy()``.
 
         Returns
         -------
@@ -1424,6 +1575,13 @@ class GenericMap(NDData):
             A new map instance is returned representing to specified
             sub-region.
 
+        Notes
+        -----
+        A submap which is a view is not copied when it is written to, instead
+        writing to it raises a `ValueError`. It keeps the whole data array of
+        this map in memory for as long as the submap exists, and sees any
+        changes made to the data of this map.
+
         Examples
         --------
         >>> import astropy.units as u
@@ -1557,39 +1715,20 @@ class GenericMap(NDData):
         x_pixels.sort()
         y_pixels.sort()
 
-        # Round the lower left pixel to the nearest integer
-        # We want 0.5 to be rounded up to 1, so use floor(x + 0.5)
-        x_pixels[0] = np.floor(x_pixels[0] + 0.5)
-        y_pixels[0] = np.floor(y_pixels[0] + 0.5)
-        # Round the top right pixel to the nearest integer, then add 1 for array indexing
-        # We want e.g. 2.5 to be rounded down to 2, so use ceil(x - 0.5)
-        x_pixels[1] = np.ceil(x_pixels[1] - 0.5) + 1
-        y_pixels[1] = np.ceil(y_pixels[1] - 0.5) + 1
-
-        x_pixels = np.array(x_pixels)
-        y_pixels = np.array(y_pixels)
-
-        # Clip pixel values to max of array, prevents negative
-        # indexing
-        x_pixels = np.clip(x_pixels, 0, self.data.shape[1])
-        y_pixels = np.clip(y_pixels, 0, self.data.shape[0])
-
         # Get ndarray representation of submap
-        xslice = slice(int(x_pixels[0]), int(x_pixels[1]))
-        yslice = slice(int(y_pixels[0]), int(y_pixels[1]))
-        new_data = self.data[yslice, xslice].copy()
+        # Slicing data that has not been read yet only reads the part needed
+        yslice, xslice = _submap_slices(x_pixels, y_pixels, self._data.shape)
+        new_data = self._data[yslice, xslice]
+        new_data = _read_only_view(new_data) if view else new_data.copy()
 
         # Make a copy of the header with updated centering information
-        new_meta = self.meta.copy()
-        # Add one to go from zero-based to one-based indexing
-        new_meta['crpix1'] = self.reference_pixel.x.to_value(u.pix) + 1 - x_pixels[0]
-        new_meta['crpix2'] = self.reference_pixel.y.to_value(u.pix) + 1 - y_pixels[0]
-        new_meta['naxis1'] = new_data.shape[1]
-        new_meta['naxis2'] = new_data.shape[0]
+        new_meta = _submap_meta(self.meta, u.Quantity(self.reference_pixel).to_value(u.pix),
+                                yslice, xslice)
 
         # Create new map instance
         if self.mask is not None:
-            new_mask = self.mask[yslice, xslice].copy()
+            new_mask = self.mask[yslice, xslice]
+            new_mask = _read_only_view(new_mask) if view else new_mask.copy()
             # Create new map with the modification
             new_map = self._new_instance(new_data, new_meta, self.plot_settings, mask=new_mask)
             return new_map
@@ -2143,8 +2282,99 @@ class GenericMap(NDData):
         """
         from skimage import measure
         contours = measure.find_contours(self.data, level=level, **kwargs)
-        contours = [self.wcs.array_index_to_world(c[:, 0], c[:, 1]) for c in contours]
-        return contours
+        return self._array_index_contours_to_world([contours])[0]
+
+    def contours(self, levels, downsample=None, **kwargs):
+        """
+        Returns coordinates of the contours for several level values.
+
+        The contours of all the levels are converted to world coordinates
+        together, and the contours found for each level are cached so that they
+        are only found once.
+
+        For details of the contouring algorithm see `skimage.measure.find_contours`.
+
+        Parameters
+        ----------
+        levels : array-like
+            Values along which to find contours in the array.
+        downsample : `int`, optional
+            Find the contours in the data reduced by taking the mean of blocks
+            of ``downsample`` x ``downsample`` pixels, as a quicker preview of
+            the contours. The data which do not fill a block along the top and
+            right edges are left out.
+        kwargs :
+            Additional keyword arguments are passed to `skimage.measure.find_contours`.
+
+        Returns
+        -------
+        contours: list of list of (n,2) `~astropy.coordinates.SkyCoord`
+            Coordinates of each contour, for each level.
+
+        Notes
+        -----
+        The contours are cached by the map, so changes made in place to its
+        data are not taken into account.
+
+        See also
+        --------
+        `skimage.measure.find_contours`
+        """
+        from skimage import measure
+
+        if downsample is not None and downsample < 1:
+            raise ValueError("downsample must be a positive number of pixels.")
+        data = None
+        level_contours = []
+        for level in np.atleast_1d(levels):
+            key = (float(level), downsample, tuple(sorted(kwargs.items())))
+            try:
+                contours = self._contour_cache.get(key)
+            except TypeError:
+                # Keyword arguments which can not be hashed are not cached
+                key = None
+                contours = None
+            if contours is None:
+                if data is None:
+                    data = self._contour_data(downsample)
+                contours = measure.find_contours(data, level=level, **kwargs)
+                if downsample:
+                    # Array indices of the centers of the blocks
+                    contours = [(c + 0.5) * downsample - 0.5 for c in contours]
+                if key is not None:
+                    if len(self._contour_cache) >= _CONTOUR_CACHE_SIZE:
+                        self._contour_cache.pop(next(iter(self._contour_cache)))
+                    self._contour_cache[key] = contours
+            level_contours.append(contours)
+
+        return self._array_index_contours_to_world(level_contours)
+
+    def _contour_data(self, downsample):
+        """
+        The data to find the contours in, reduced by the mean of blocks of
+        ``downsample`` x ``downsample`` pixels.
+        """
+        data = np.asarray(self.data)
+        if not downsample or downsample == 1:
+            return data
+        blocks = reshape_image_to_4d_superpixel(data, (downsample, downsample), (0, 0))
+        return blocks.mean(axis=(1, 3))
+
+    def _array_index_contours_to_world(self, level_contours):
+        """
+        Convert lists of contours in array indices to world coordinates, with a
+        single transformation of all their vertices.
+        """
+        contours = [c for contours in level_contours for c in contours]
+        if not contours:
+            return [[] for contours in level_contours]
+        vertices = np.concatenate(contours)
+        coords = self.wcs.array_index_to_world(vertices[:, 0], vertices[:, 1])
+
+        ends = np.cumsum([len(c) for c in contours])
+        starts = np.concatenate([[0], ends[:-1]])
+        contours = iter([coords[start:end] for start, end in zip(starts, ends)])
+        return [[next(contours) for _ in level] for level in level_contours]
 
 
 class InvalidHeaderInformation(ValueError):
@@ -2157,3 +2387,62 @@ def _figure_to_base64(fig):
     buf = BytesIO()
     fig.savefig(buf, format='png', facecolor='none')  # works better than transparent=True
     return b64encode(buf.getvalue()).decode('utf-8')
+
+
+def _read_only_view(array):
+    # A view of an array which can not be used to modify the array
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def _strided_sample(data, sample_size):
+    """
+    A regular sample of about ``sample_size`` pixels of an image, with the
+    same stride along both axes, or the image itself if it is not larger.
+    """
+    if sample_size is None or data.size <= sample_size:
+        return data
+    stride = int(np.ceil(np.sqrt(data.size / sample_size)))
+    return data[::stride, ::stride]
+
+
+def _submap_slices(x_pixels, y_pixels, shape):
+    """
+    The slices of data of the given shape which give the submap of the
+    rectangle between the sorted pixel coordinates ``x_pixels`` and
+    ``y_pixels``.
+    """
+    x_pixels = np.array(x_pixels, dtype=float)
+    y_pixels = np.array(y_pixels, dtype=float)
+
+    # Round the lower left pixel to the nearest integer
+    # We want 0.5 to be rounded up to 1, so use floor(x + 0.5)
+    x_pixels[0] = np.floor(x_pixels[0] + 0.5)
+    y_pixels[0] = np.floor(y_pixels[0] + 0.5)
+    # Round the top right pixel to the nearest integer, then add 1 for array indexing
+    # We want e.g. 2.5 to be rounded down to 2, so use ceil(x - 0.5)
+    x_pixels[1] = np.ceil(x_pixels[1] - 0.5) + 1
+    y_pixels[1] = np.ceil(y_pixels[1] - 0.5) + 1
+
+    # Clip pixel values to max of array, prevents negative
+    # indexing
+    x_pixels = np.clip(x_pixels, 0, shape[1])
+    y_pixels = np.clip(y_pixels, 0, shape[0])
+
+    return (slice(int(y_pixels[0]), int(y_pixels[1])),
+            slice(int(x_pixels[0]), int(x_pixels[1])))
+
+
+def _submap_meta(meta, reference_pixel, yslice, xslice):
+    """
+    A copy of the metadata of a map, with the centering information updated
+    for its submap given by the slices of its data.
+    """
+    new_meta = meta.copy()
+    # Add one to go from zero-based to one-based indexing
+    new_meta['crpix1'] = reference_pixel[0] + 1 - xslice.start
+    new_meta['crpix2'] = reference_pixel[1] + 1 - yslice.start
+    new_meta['naxis1'] = xslice.stop - xslice.start
+    new_meta['naxis2'] = yslice.stop - yslice.start
+    return new_meta
@@ -1,18 +1,25 @@
 """A Python MapSequence Object"""
 
+import re
 import html
 import textwrap
 import warnings
 import webbrowser
 from copy import deepcopy
 from tempfile import NamedTemporaryFile
+from concurrent.futures import ThreadPoolExecutor
 
 import matplotlib.animation
 import numpy as np
 import numpy.ma as ma
+from matplotlib import cm, colors
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 import astropy.units as u
 
+from sunpy.image.resample import resample as sunpy_image_resample
+from sunpy.io.fits import _LazyHDUData
 from sunpy.map import GenericMap
 from sunpy.util import SunpyUserWarning, expand_list
 from sunpy.visualization import axis_labels_from_ctype, wcsaxes_compat
@@ -20,6 +27,11 @@ from sunpy.visualization.animator.mapsequenceanimator import MapSequenceAnimator
 
 __all__ = ['MapSequence']
 
+# The WCS keys of a map, which are taken from the first map for the result of a
+# reduction of a sequence even if they differ, as are its observer keys
+_COORDINATE_KEY = re.compile(r'^((naxis|crpix|crval|cdelt|ctype|cunit|crota)\d|(pc|cd)\d_\d|'
+                             r'date-obs|date_obs|rsun_obs|rsun_ref|keycomments)$')
+
 
 class MapSequence:
     """
@@ -36,7 +48,8 @@ class MapSequence:
         Defaults to sorting by: "date" and is the only supported sorting strategy.
         Passing `None` will disable sorting.
     derotate : `bool`
-        Apply a derotation to the data. Default to False.
+        Differentially rotate all the maps to the observer of the first map,
+        see `~sunpy.map.MapSequence.derotate`. Default to False.
 
     Attributes
     ----------
@@ -75,6 +88,9 @@ class MapSequence:
         if derotate:
             self._derotate()
 
+        # The frames last rendered by render_frames
+        self._frame_cache = None
+
     def __getitem__(self, key):
         """Overriding indexing operation.  If the key results in a single map,
         then a map object is returned.  This allows functions like enumerate to
@@ -247,8 +263,52 @@ class MapSequence:
         return lambda m: m.date  # maps.sort(key=attrgetter('date'))
 
     def _derotate(self):
-        """Derotates the layers in the MapSequence"""
-        raise NotImplementedError("This functionality has not yet been implemented.")
+        """Derotates the layers in the MapSequence to the observer of the first map"""
+        if self.maps:
+            self.maps = self.derotate(observer=self.maps[0].observer_coordinate).maps
+
+    def derotate(self, observer=None, time=None, max_workers=None, **diff_rot_kwargs):
+        """
+        Returns a sequence of the maps differentially rotated to the same
+        observer.
+
+        Each map is rotated as by
+        `~sunpy.physics.differential_rotation.differential_rotate`, so that
+        solar features remain at the same place in all the maps.
+
+        Parameters
+        ----------
+        observer : `~astropy.coordinates.BaseCoordinateFrame`, `~astropy.coordinates.SkyCoord`, `None`, optional
+            The location of the new observer.
+        time : sunpy-compatible time, `~astropy.time.TimeDelta`, `~astropy.units.Quantity`, `None`, optional
+            The time of the new observer, which is assumed to be on the Earth.
+            A time interval is counted from the observation time of the first
+            map. Either ``observer`` or ``time`` must be given.
+        max_workers : `int`, optional
+            The maximum number of threads used to rotate the maps. Defaults to
+            the default of `concurrent.futures.ThreadPoolExecutor`.
+        diff_rot_kwargs
+            Passed to `~sunpy.physics.differential_rotation.diff_rot`.
+
+        Returns
+        -------
+        `~sunpy.map.MapSequence`
+            A sequence of the rotated maps, in the order of this sequence.
+
+        Notes
+        -----
+        The coordinates of the output pixels seen by the new observer are
+        calculated once for all the maps with the same shape and WCS. When all
+        the maps contain the full disk and have the same shape, the data of
+        the rotated maps are views of a single array with the maps along its
+        first axis.
+        """
+        # Put the import here to avoid a circular import
+        from sunpy.physics.differential_rotation import _differential_rotate_maps
+
+        return MapSequence(_differential_rotate_maps(self.maps, observer=observer, time=time,
+                                                     max_workers=max_workers, **diff_rot_kwargs),
+                           sortby=None)
 
     def plot(self, axes=None, resample=None, annotate=True,
              interval=200, plot_function=None, **kwargs):
@@ -460,12 +520,121 @@ class MapSequence:
 
         return MapSequenceAnimator(plot_sequence, **kwargs)
 
+    def render_frames(self, resample=None, max_workers=None):
+        """
+        Render each map of the sequence to an RGBA image.
+
+        The data of each map is normalized and colored with the norm and
+        colormap of its ``plot_settings``, as when the map is plotted, and the
+        maps are rendered in parallel threads.
+
+        Parameters
+        ----------
+        resample : list, optional
+            Render the maps at a lower resolution, as a fraction of the size of
+            the maps, i.e. ``[0.25, 0.25]`` to render at 1/4 resolution. Only
+            works when all the maps have the same shape.
+        max_workers : `int`, optional
+            The maximum number of threads used to render the maps. Defaults to
+            the default of `concurrent.futures.ThreadPoolExecutor`.
+
+        Returns
+        -------
+        `list` of `numpy.ndarray`
+            A read-only ``uint8`` array of shape ``(ny, nx, 4)`` for each map,
+            with the rows in the same order as the map data.
+
+        Notes
+        -----
+        The frames are cached, so the maps are only rendered again when the maps
+        of the sequence are replaced or a different ``resample`` is given.
+        Changes made in place to the data or the plot settings of the maps are
+        not detected.
+        """
+        dimensions = None
+        if resample:
+            if not self.all_maps_same_shape():
+                raise ValueError('Maps in mapsequence do not all have the same shape.')
+            dimensions = u.Quantity(self.maps[0].dimensions) * np.array(resample)
+
+        key = None if dimensions is None else tuple(dimensions.to_value(u.pix))
+        cached = self._frame_cache
+        if (cached is not None and cached[0] == key and len(cached[1]) == len(self.maps) and
+                all(cached_map is amap for cached_map, amap in zip(cached[1], self.maps))):
+            return list(cached[2])
+
+        # Colormaps initialize their lookup table when they are first used,
+        # which is done here rather than in the threads
+        cmaps = [cm.get_cmap(amap.plot_settings['cmap']) for amap in self.maps]
+        for cmap in {id(cmap): cmap for cmap in cmaps}.values():
+            cmap(0.0)
+
+        def render_frame(i):
+            return _render_frame(self.maps[i], cmaps[i], dimensions)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(render_frame, range(len(self.maps))))
+
+        self._frame_cache = (key, tuple(self.maps), tuple(frames))
+        return frames
+
+    def save_animation(self, filename, writer=None, fps=10, resample=None,
+                       max_workers=None, **writer_kwargs):
+        """
+        Save an animation of the sequence to a movie file.
+
+        The maps are rendered with `render_frames`, which reuses the frames it
+        has already rendered, and each frame is written to the movie at its
+        native resolution, without axes or annotations.
+
+        Parameters
+        ----------
+        filename : `str`
+            The file to save the movie to.
+        writer : `str` or `matplotlib.animation.MovieWriter`, optional
+            The name of a `matplotlib.animation` writer, or a writer. Defaults
+            to the ``animation.writer`` matplotlib rc parameter.
+        fps : `int`, optional
+            The frame rate of the movie, when ``writer`` is a name.
+        resample : list, optional
+            Render the maps at a lower resolution, see `render_frames`.
+        max_workers : `int`, optional
+            The maximum number of threads used to render the maps.
+        **writer_kwargs : `dict`
+            Any additional arguments are passed to the writer, when ``writer``
+            is a name.
+
+        Examples
+        --------
+        >>> sequence = Map(files, sequence=True)   # doctest: +SKIP
+        >>> sequence.save_animation('mapsequence.mp4', writer='ffmpeg', fps=24)   # doctest: +SKIP
+        """
+        frames = self.render_frames(resample=resample, max_workers=max_workers)
+        if len({frame.shape for frame in frames}) > 1:
+            raise ValueError('Maps in mapsequence do not all have the same shape.')
+
+        if writer is None:
+            writer = matplotlib.rcParams['animation.writer']
+        if isinstance(writer, str):
+            writer = matplotlib.animation.writers[writer](fps=fps, **writer_kwargs)
+
+        # With a dpi of 1 the figure is exactly one pixel per frame pixel
+        ny, nx = frames[0].shape[:2]
+        fig = Figure(figsize=(nx, ny), dpi=1)
+        FigureCanvasAgg(fig)
+        image = fig.figimage(frames[0], origin='lower')
+        with writer.saving(fig, filename, 1):
+            for frame in frames:
+                image.set_data(frame)
+                writer.grab_frame()
+
     def all_maps_same_shape(self):
         """
         Tests if all the maps have the same number pixels in the x and y
         directions.
         """
-        return np.all([m.data.shape == self.maps[0].data.shape for m in self.maps])
+        # Use the shape of the data without reading data which is read lazily
+        return np.all([m._data.shape == self.maps[0]._data.shape for m in self.maps])
 
     def at_least_one_map_has_mask(self):
         """
@@ -486,8 +655,8 @@ class MapSequence:
         If all the map shapes are not the same, a ValueError is thrown.
         """
         if self.all_maps_same_shape():
-            data = np.swapaxes(np.swapaxes(np.asarray(
-                [m.data for m in self.maps]), 0, 1).copy(), 1, 2).copy()
+            # Stack the maps along the last axis in a single copy
+            data = np.stack([m.data for m in self.maps], axis=-1)
             if self.at_least_one_map_has_mask():
                 mask_sequence = np.zeros_like(data, dtype=bool)
                 for im, m in enumerate(self.maps):
@@ -499,8 +668,381 @@ class MapSequence:
         else:
             raise ValueError('Not all maps have the same shape.')
 
+    def mean(self, chunk_size=16):
+        """
+        Returns a map of the mean of each pixel over the maps of the sequence.
+
+        NaN values and masked pixels are ignored. The maps are read
+        ``chunk_size`` at a time, so the memory used does not depend on the
+        length of the sequence. The metadata of the map is described in
+        `~sunpy.map.MapSequence.median`.
+
+        Parameters
+        ----------
+        chunk_size : `int`, optional
+            The number of maps read at a time. Defaults to 16.
+
+        Returns
+        -------
+        `~sunpy.map.GenericMap`
+        """
+        total = count = None
+        for chunk in self._chunks(chunk_size):
+            chunk_total = np.nansum(chunk, axis=0)
+            chunk_count = np.sum(~np.isnan(chunk), axis=0)
+            if total is None:
+                total, count = chunk_total, chunk_count
+            else:
+                total += chunk_total
+                count += chunk_count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self._reduced_map(total / count)
+
+    def std(self, ddof=0, chunk_size=16):
+        """
+        Returns a map of the standard deviation of each pixel over the maps of
+        the sequence.
+
+        NaN values and masked pixels are ignored. The maps are read
+        ``chunk_size`` at a time and the variances of the chunks are combined,
+        so the memory used does not depend on the length of the sequence.
+
+        Parameters
+        ----------
+        ddof : `int`, optional
+            The delta degrees of freedom, see `numpy.std`. Defaults to 0.
+        chunk_size : `int`, optional
+            The number of maps read at a time. Defaults to 16.
+
+        Returns
+        -------
+        `~sunpy.map.GenericMap`
+        """
+        count = mean = m2 = None
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for chunk in self._chunks(chunk_size):
+                chunk_count = np.sum(~np.isnan(chunk), axis=0)
+                chunk_mean = np.nansum(chunk, axis=0) / chunk_count
+                chunk_m2 = np.nansum((chunk - chunk_mean) ** 2, axis=0)
+                if count is None:
+                    count, mean, m2 = chunk_count, chunk_mean, chunk_m2
+                    continue
+                # Combine the chunk with the maps before it, ignoring pixels
+                # without any valid values in the chunk
+                new_count = count + chunk_count
+                delta = np.where((count > 0) & (chunk_count > 0), chunk_mean - mean, 0)
+                mean = np.where(count > 0, mean + delta * chunk_count / new_count, chunk_mean)
+                m2 = (np.where(count > 0, m2, 0) + np.where(chunk_count > 0, chunk_m2, 0)
+                      + delta ** 2 * count * chunk_count / new_count)
+                count = new_count
+            variance = np.where(count > ddof, m2 / (count - ddof), np.nan)
+        return self._reduced_map(np.sqrt(variance))
+
+    def min(self, chunk_size=16):
+        """
+        Returns a map of the minimum of each pixel over the maps of the
+        sequence.
+
+        NaN values and masked pixels are ignored. The maps are read
+        ``chunk_size`` at a time, so the memory used does not depend on the
+        length of the sequence.
+
+        Parameters
+        ----------
+        chunk_size : `int`, optional
+            The number of maps read at a time. Defaults to 16.
+
+        Returns
+        -------
+        `~sunpy.map.GenericMap`
+        """
+        return self._reduced_map(self._reduce_chunks(np.fmin, chunk_size))
+
+    def max(self, chunk_size=16):
+        """
+        Returns a map of the maximum of each pixel over the maps of the
+        sequence.
+
+        NaN values and masked pixels are ignored. The maps are read
+        ``chunk_size`` at a time, so the memory used does not depend on the
+        length of the sequence.
+
+        Parameters
+        ----------
+        chunk_size : `int`, optional
+            The number of maps read at a time. Defaults to 16.
+
+        Returns
+        -------
+        `~sunpy.map.GenericMap`
+        """
+        return self._reduced_map(self._reduce_chunks(np.fmax, chunk_size))
+
+    def median(self, chunk_size=16):
+        """
+        Returns a map of the median of each pixel over the maps of the
+        sequence.
+
+        NaN values and masked pixels are ignored, and pixels without any valid
+        value are NaN. The median needs all the values of a pixel, so blocks
+        of rows of all the maps are read at a time, with blocks of about the
+        size of ``chunk_size`` maps.
+
+        The metadata of the map returned by this and the other reductions is
+        the metadata which is the same for all the maps. The keys which define
+        the coordinates of the map, including the observation time and the
+        observer, are taken from the first map, and ``date-end`` is set to the
+        observation time of the last map.
+
+        Parameters
+        ----------
+        chunk_size : `int`, optional
+            The number of maps that the blocks of rows are about the size of.
+            Defaults to 16.
+
+        Returns
+        -------
+        `~sunpy.map.GenericMap`
+        """
+        return self.percentile(50, chunk_size=chunk_size)
+
+    def percentile(self, q, chunk_size=16):
+        """
+        Returns a map of a percentile of each pixel over the maps of the
+        sequence.
+
+        NaN values and masked pixels are ignored, and pixels without any valid
+        value are NaN. Blocks of rows of all the maps are read at a time, see
+        `~sunpy.map.MapSequence.median`.
+
+        Parameters
+        ----------
+        q : `float`
+            The percentile, between 0 and 100.
+        chunk_size : `int`, optional
+            The number of maps that the blocks of rows are about the size of.
+            Defaults to 16.
+
+        Returns
+        -------
+        `~sunpy.map.GenericMap`
+        """
+        ny, nx = self._check_reducible()
+        rows_per_block = max(1, chunk_size * ny // len(self.maps))
+        out = np.empty((ny, nx))
+        for start in range(0, ny, rows_per_block):
+            rows = slice(start, min(start + rows_per_block, ny))
+            block = np.stack([_frame_data(m, rows) for m in self.maps])
+            with warnings.catch_warnings():
+                # Pixels without any valid value are NaN
+                warnings.simplefilter('ignore', RuntimeWarning)
+                out[rows] = np.nanpercentile(block, q, axis=0)
+        return self._reduced_map(out)
+
+    def running_difference(self, lag=1):
+        """
+        Returns a sequence of the differences between each map and the map
+        ``lag`` maps before it.
+
+        The data of each difference map is only calculated when it is first
+        used. Masked pixels are NaN in the differences.
+
+        Parameters
+        ----------
+        lag : `int`, optional
+            The number of maps between the maps which are subtracted. Defaults
+            to 1.
+
+        Returns
+        -------
+        `~sunpy.map.MapSequence`
+            A sequence of ``len(self) - lag`` maps, each with the metadata of
+            the later map of the difference.
+        """
+        if lag < 1:
+            raise ValueError("lag must be a positive integer.")
+        self._check_reducible()
+        return MapSequence([self._difference_map(m, base)
+                            for m, base in zip(self.maps[lag:], self.maps)], sortby=None)
+
+    def base_difference(self, base=0):
+        """
+        Returns a sequence of the differences between each map and a base map.
+
+        The data of each difference map is only calculated when it is first
+        used. Masked pixels are NaN in the differences.
+
+        Parameters
+        ----------
+        base : `int` or `~sunpy.map.GenericMap`, optional
+            The index of the map in the sequence which is subtracted, or a map
+            with the same shape as the maps, such as the mean of the sequence.
+            Defaults to the first map.
+
+        Returns
+        -------
+        `~sunpy.map.MapSequence`
+            A sequence of the differences, each with the metadata of the map
+            the base map is subtracted from.
+        """
+        shape = self._check_reducible()
+        if not isinstance(base, GenericMap):
+            base = self.maps[base]
+        elif base._data.shape != shape:
+            raise ValueError("The base map must have the same shape as the maps.")
+        return MapSequence([self._difference_map(m, base) for m in self.maps], sortby=None)
+
+    def _check_reducible(self):
+        """
+        Check that the maps can be reduced, returning the shape of their data.
+        """
+        if not self.maps:
+            raise ValueError("The sequence does not contain any maps.")
+        if not self.all_maps_same_shape():
+            raise ValueError('Not all maps have the same shape.')
+        return self.maps[0]._data.shape
+
+    def _chunks(self, chunk_size):
+        """
+        Yield stacks of the data of at most ``chunk_size`` maps.
+        """
+        self._check_reducible()
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        for start in range(0, len(self.maps), chunk_size):
+            yield np.stack([_frame_data(m) for m in self.maps[start:start + chunk_size]])
+
+    def _reduce_chunks(self, ufunc, chunk_size):
+        """
+        Reduce the maps with a binary ufunc, one chunk of maps at a time.
+        """
+        out = None
+        for chunk in self._chunks(chunk_size):
+            reduced = ufunc.reduce(chunk, axis=0)
+            out = reduced if out is None else ufunc(out, reduced, out=out)
+        return out
+
+    def _reduced_map(self, data):
+        """
+        A map of the result of a reduction of the maps, with the metadata
+        merged from all the maps.
+        """
+        first = self.maps[0]
+        meta = first.meta.copy()
+        # The observer location changes along a time sequence
+        observer_keys = set(expand_list([keys for keys, _ in
+                                         first._supported_observer_coordinates]))
+        for key, value in first.meta.items():
+            if _COORDINATE_KEY.match(key) or key in observer_keys:
+                continue
+            if not all(key in m.meta and _same_value(m.meta[key], value) for m in self.maps[1:]):
+                meta.pop(key)
+        meta['date-end'] = self.maps[-1].date.isot
+        return first._new_instance(data, meta, first.plot_settings)
+
+    @staticmethod
+    def _difference_map(amap, base):
+        return amap._new_instance(_LazyDifferenceData(amap, base), amap.meta.copy(),
+                                  amap.plot_settings)
+
+    def submap(self, bottom_left, *, top_right=None, width=None, height=None, view=False):
+        """
+        Returns a sequence of the submaps of each map defined by a rectangle.
+
+        See `~sunpy.map.GenericMap.submap` for a description of the parameters.
+        With ``view=True`` the submaps are immutable views of the maps, so
+        a cube of a small region of interest can be extracted from a sequence
+        of large maps with ``sequence.submap(..., view=True).as_array()``,
+        which only copies the data of the region once.
+
+        Returns
+        -------
+        `~sunpy.map.MapSequence`
+            A sequence of the submaps, in the order of this sequence.
+        """
+        return MapSequence([m.submap(bottom_left, top_right=top_right, width=width,
+                                     height=height, view=view) for m in self.maps],
+                           sortby=None)
+
     def all_meta(self):
         """
         Return all the meta objects as a list.
         """
         return [m.meta for m in self.maps]
+
+
+class _LazyDifferenceData(_LazyHDUData):
+    """
+    The difference of the data of two maps, calculated when it is first used.
+    """
+
+    def __init__(self, amap, base):
+        self._map = amap
+        self._base = base
+        super().__init__(None, None, amap._data.shape, np.dtype(np.float64))
+
+    def __repr__(self):
+        return f"<{type(self).__name__} shape={self._shape}>"
+
+    def _load(self):
+        if self._data is None:
+            self._data = _frame_data(self._map) - _frame_data(self._base)
+        return self._data
+
+    def __getitem__(self, item):
+        item = item if isinstance(item, tuple) else (item,)
+        if self._data is not None or not isinstance(item[0], slice):
+            return self._load()[item]
+        # Only calculate the rows that are needed
+        rows = _frame_data(self._map, item[0]) - _frame_data(self._base, item[0])
+        return rows[(slice(None),) + item[1:]]
+
+
+def _frame_data(amap, rows=slice(None)):
+    """
+    A float64 copy of rows of the data of a map, with NaN at masked pixels.
+
+    Data which is read lazily is read without being kept by the map.
+    """
+    data = np.array(amap._data[rows], dtype=np.float64)
+    if amap.mask is not None:
+        data[np.broadcast_to(amap.mask, amap._data.shape)[rows]] = np.nan
+    return data
+
+
+def _render_frame(amap, cmap, dimensions=None):
+    """
+    An RGBA image of the data of a map, optionally resampled to the given
+    dimensions, with the colormap and a copy of the norm of the map.
+    """
+    if dimensions is not None:
+        data = np.asarray(amap.data)
+        if amap.mask is not None:
+            # Masked pixels are NaN, so that they are not interpolated
+            data = np.where(amap.mask, np.nan, data)
+        data = sunpy_image_resample(data.T, dimensions, 'linear', center=True).T
+    elif amap.mask is None:
+        data = np.asarray(amap.data)
+    else:
+        data = np.ma.array(np.asarray(amap.data), mask=amap.mask)
+    # As when plotting, invalid values are masked so that they are not used
+    # for the scaling and take the "bad" color
+    data = np.ma.masked_invalid(data)
+
+    norm = deepcopy(amap.plot_settings['norm'])
+    if norm is None:
+        norm = colors.Normalize()
+    # The following explicit call is for bugged versions of Astropy's
+    # ImageNormalize
+    norm.autoscale_None(data)
+
+    frame = cmap(norm(data), bytes=True)
+    frame.flags.writeable = False
+    return frame
+
+
+def _same_value(value1, value2):
+    """
+    Whether two metadata values are the same, including their type.
+    """
+    return type(value1) is type(value2) and value1 == value2
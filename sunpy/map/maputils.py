@@ -1,8 +1,6 @@
 """
 This submodule provides utility functions to act on `sunpy.map.GenericMap` instances.
 """
-from itertools import chain, product
-
 import numpy as np
 
 import astropy.units as u
@@ -14,7 +12,12 @@ __all__ = ['all_pixel_indices_from_map', 'all_coordinates_from_map',
            'map_edges', 'solar_angular_radius', 'sample_at_coords',
            'contains_full_disk', 'is_all_off_disk', 'is_all_on_disk',
            'contains_limb', 'coordinate_is_on_solar_disk',
-           'on_disk_bounding_coordinates']
+           'on_disk_bounding_coordinates', 'on_disk_mask', 'off_limb_mask']
+
+# Helioprojective coordinate grids of map geometries, with the oldest grid
+# removed when the cache is full
+_coordinate_grid_cache = {}
+_COORDINATE_GRID_CACHE_SIZE = 4
 
 
 def all_pixel_indices_from_map(smap):
@@ -73,10 +76,12 @@ def map_edges(smap):
     """
     # Calculate all the edge pixels
     nx, ny = smap.dimensions.x.value, smap.dimensions.y.value
-    top = list(product(np.arange(nx), [ny - 1])) * u.pix
-    bottom = list(product(np.arange(nx), [0])) * u.pix
-    left_hand_side = list(product([0], np.arange(ny))) * u.pix
-    right_hand_side = list(product([nx - 1], np.arange(ny))) * u.pix
+    x = np.arange(nx)
+    y = np.arange(ny)
+    top = np.column_stack((x, np.full_like(x, ny - 1))) * u.pix
+    bottom = np.column_stack((x, np.zeros_like(x))) * u.pix
+    left_hand_side = np.column_stack((np.zeros_like(y), y)) * u.pix
+    right_hand_side = np.column_stack((np.full_like(y, nx - 1), y)) * u.pix
     return top, bottom, left_hand_side, right_hand_side
 
 
@@ -153,21 +158,16 @@ def contains_full_disk(smap):
     within the field of the view of the instrument (although no emission
     from the disk itself is present in the data.)
     """
-    # Calculate all the edge pixels
-    edges = map_edges(smap)
-    edge_pixels = list(chain.from_iterable([edges[0], edges[1], edges[2], edges[3]]))
-    x = [p[0] for p in edge_pixels] * u.pix
-    y = [p[1] for p in edge_pixels] * u.pix
-
-    # Calculate the edge of the world
-    edge_of_world = smap.pixel_to_world(x, y)
-
-    # Calculate the distance of the edge of the world in solar radii
-    coordinate_angles = np.sqrt(edge_of_world.Tx ** 2 + edge_of_world.Ty ** 2)
+    # Calculate the angular distance of the edge pixels from the center of the Sun
+    tx, ty = _helioprojective_grid(smap)
+    coordinate_angles = np.hypot(tx, ty)
+    edge_angles = np.concatenate([coordinate_angles[0], coordinate_angles[-1],
+                                  coordinate_angles[:, 0], coordinate_angles[:, -1]])
+    radius = np.arctan(smap.rsun_meters / smap.dsun).to_value(u.arcsec)
 
     # Test if all the edge pixels are more than one solar radius distant
     # and that the whole map is not all off disk.
-    return np.all(coordinate_angles > solar_angular_radius(edge_of_world)) and ~is_all_off_disk(smap)
+    return np.all(edge_angles > radius) and np.any(coordinate_angles < radius)
 
 
 @u.quantity_input
@@ -225,7 +225,7 @@ def is_all_off_disk(smap):
     within the field of view of the instrument, but the solar disk itself is not imaged.
     For such images this function will return `False`.
     """
-    return np.all(~coordinate_is_on_solar_disk(all_coordinates_from_map(smap)))
+    return np.all(off_limb_mask(smap))
 
 
 def is_all_on_disk(smap):
@@ -248,7 +248,7 @@ def is_all_on_disk(smap):
         Returns `True` if all map coordinates have an angular radius less than
         the angular radius of the Sun.
     """
-    return np.all(coordinate_is_on_solar_disk(all_coordinates_from_map(smap)))
+    return np.all(on_disk_mask(smap))
 
 
 def contains_limb(smap):
@@ -279,7 +279,7 @@ def contains_limb(smap):
     within the field of view of the instrument, but the solar disk itself is not imaged.
     For such images this function will return `True`.
     """
-    on_disk = coordinate_is_on_solar_disk(all_coordinates_from_map(smap))
+    on_disk = on_disk_mask(smap)
     return np.logical_and(np.any(on_disk), np.any(~on_disk))
 
 
@@ -301,21 +301,123 @@ def on_disk_bounding_coordinates(smap):
         top right coordinate of the smallest rectangular region that contains
         all the on-disk pixels in the input map.
     """
-    # Check that the input map is not all off disk.
-    if is_all_off_disk(smap):
+    # Find which pixels are on the disk
+    on_disk = on_disk_mask(smap)
+    if not np.any(on_disk):
         raise ValueError("The entire map is off disk.")
 
-    # Get all the coordinates from the input map
-    coordinates = all_coordinates_from_map(smap)
-
-    # Find which coordinates are on the disk
-    on_disk = coordinate_is_on_solar_disk(coordinates)
-    on_disk_coordinates = coordinates[on_disk]
+    # The on disk pixels with the smallest and largest coordinates, which are
+    # then transformed exactly
+    tx, ty = _helioprojective_grid(smap)
+    y, x = np.nonzero(on_disk)
+    tx = tx[on_disk]
+    ty = ty[on_disk]
+    ix = [np.argmin(tx), np.argmax(tx)]
+    iy = [np.argmin(ty), np.argmax(ty)]
+    corners = smap.pixel_to_world(x[ix + iy] * u.pix, y[ix + iy] * u.pix)
 
     # The bottom left and top right coordinates that contain
     # the on disk coordinates.
-    tx = on_disk_coordinates.Tx.value
-    ty = on_disk_coordinates.Ty.value
-    return SkyCoord([np.nanmin(tx), np.nanmax(tx)] * u.arcsec,
-                    [np.nanmin(ty), np.nanmax(ty)] * u.arcsec,
+    return SkyCoord(corners.Tx[:2].to(u.arcsec), corners.Ty[2:].to(u.arcsec),
                     frame=smap.coordinate_frame)
+
+
+def on_disk_mask(smap):
+    """
+    Returns a mask of the pixels of a map which are on the solar disk.
+
+    A pixel is on the disk if its angular distance from the center of the Sun
+    is less than the solar angular radius, as for
+    `~sunpy.map.maputils.coordinate_is_on_solar_disk`, with the radius
+    calculated from the solar radius and the distance of the observer in the
+    header of the map.
+
+    Parameters
+    ----------
+    smap : `~sunpy.map.GenericMap`
+        A map in helioprojective Cartesian coordinates.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        A boolean array of the shape of the map data which is `True` for the
+        pixels on the disk.
+
+    Notes
+    -----
+    The coordinates of the pixels are computed once for each map geometry, as
+    float32 arrays, and are shared by all the maps with the same shape and
+    WCS. A few pixels within a ten-thousandth of an arcsecond of the limb may
+    therefore be classified differently than with the coordinates from
+    `~sunpy.map.maputils.all_coordinates_from_map`.
+    """
+    tx, ty = _helioprojective_grid(smap)
+    radius = np.arctan(smap.rsun_meters / smap.dsun).to_value(u.arcsec)
+    return np.hypot(tx, ty) < radius
+
+
+def off_limb_mask(smap):
+    """
+    Returns a mask of the pixels of a map which are off the solar disk.
+
+    This is the inverse of `~sunpy.map.maputils.on_disk_mask`.
+
+    Parameters
+    ----------
+    smap : `~sunpy.map.GenericMap`
+        A map in helioprojective Cartesian coordinates.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        A boolean array of the shape of the map data which is `True` for the
+        pixels off the disk.
+    """
+    return ~on_disk_mask(smap)
+
+
+def _helioprojective_grid(smap):
+    """
+    The helioprojective longitude and latitude in arcseconds of every pixel in
+    a map, as read-only float32 arrays.
+
+    The grids are cached on the shape and the WCS of the map.
+    """
+    # Check the axis types rather than the coordinate frame of the map, which
+    # takes longer to build than the grid takes to look up
+    lon_type, lat_type = (ctype[:4].upper() for ctype in smap.coordinate_system)
+    if lon_type not in ('HPLN', 'SOLA') or lat_type not in ('HPLT', 'SOLA'):
+        raise ValueError('The input map must be in the Helioprojective Cartesian frame.')
+
+    key = _geometry_key(smap)
+    shape = key[0]
+    if key not in _coordinate_grid_cache:
+        wcs = smap.wcs
+        x, y = np.meshgrid(np.arange(shape[1]), np.arange(shape[0]))
+        lon, lat = wcs.pixel_to_world_values(x, y)
+        # Wrap the longitude at 180 degrees, as for Helioprojective
+        lon = (u.Quantity(lon, wcs.wcs.cunit[0]).to_value(u.deg) + 180) % 360 - 180
+        grid = ((lon * u.deg).to_value(u.arcsec).astype(np.float32),
+                u.Quantity(lat, wcs.wcs.cunit[1]).to_value(u.arcsec).astype(np.float32))
+        for values in grid:
+            values.flags.writeable = False
+
+        if len(_coordinate_grid_cache) >= _COORDINATE_GRID_CACHE_SIZE:
+            _coordinate_grid_cache.pop(next(iter(_coordinate_grid_cache)))
+        _coordinate_grid_cache[key] = grid
+    return _coordinate_grid_cache[key]
+
+
+def _geometry_key(smap):
+    """
+    A hashable key of the shape of a map and of the map properties which its
+    WCS projection is built from.
+
+    Maps with the same key have the same world coordinates at every pixel.
+    """
+    shape = (int(smap.dimensions.y.value), int(smap.dimensions.x.value))
+    return (shape, tuple(smap.coordinate_system), tuple(smap.spatial_units),
+            tuple(u.Quantity(smap.reference_pixel).to_value(u.pix)),
+            tuple(u.Quantity(smap.scale).value),
+            (smap._reference_longitude.value, smap._reference_latitude.value),
+            smap.rotation_matrix.tobytes())
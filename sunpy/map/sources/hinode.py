@@ -69,6 +69,9 @@ class XRTMap(GenericMap):
         fw2 = self.meta.get('EC_FW2_').replace("_", " ")
         return f"{fw1}-{fw2}"
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'XRT'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an XRT image"""
@@ -129,6 +132,9 @@ class SOTMap(GenericMap):
 
         self.plot_settings['cmap'] = 'hinodesot' + color[self.instrument]
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'SOT/'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an SOT image."""
@@ -45,6 +45,9 @@ class SJIMap(GenericMap):
         self.meta['waveunit'] = "Angstrom"
         self.meta['wavelnth'] = header['twave1']
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'SJI'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an IRIS SJI image"""
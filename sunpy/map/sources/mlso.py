@@ -60,6 +60,9 @@ class KCorMap(GenericMap):
         """
         return self.meta['observatory']
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'COSMO K-Coronagraph'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to a COSMO image"""
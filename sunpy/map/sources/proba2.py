@@ -38,6 +38,9 @@ class SWAPMap(GenericMap):
         self._nickname = self.detector
         self.plot_settings['cmap'] = 'sdoaia171'
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'SWAP'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an SWAP image"""
@@ -62,6 +62,9 @@ class RHESSIMap(GenericMap):
         """
         return self.meta['telescop']
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'RHESSI'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an RHESSI image"""
@@ -70,6 +70,9 @@ class AIAMap(GenericMap):
         """
         return self.meta.get('telescop', '').split('/')[0]
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'AIA'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an AIA image"""
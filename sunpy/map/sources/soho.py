@@ -71,6 +71,9 @@ class EITMap(GenericMap):
                                                'frame': HeliocentricMeanEcliptic})
                 ] + super()._supported_observer_coordinates
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'EIT'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an EIT image"""
@@ -131,6 +134,9 @@ class LASCOMap(GenericMap):
         # TODO: This needs to do more than white-light.  Should give B, pB, etc.
         return "white-light"
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'LASCO'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an LASCO image."""
@@ -207,6 +213,9 @@ class MDIMap(GenericMap):
         """
         return "magnetogram" if self.meta.get('dpc_obsr', " ").find('Mag') != -1 else "continuum"
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'MDI', 'camera': 'MDI'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an MDI image"""
@@ -236,6 +245,9 @@ class MDISynopticMap(MDIMap):
                 header.pop(f'CRDER{i}')
         super().__init__(data, header, **kwargs)
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'MDI', 'camera': 'MDI'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an MDI image"""
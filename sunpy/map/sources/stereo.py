@@ -70,6 +70,9 @@ class EUVIMap(GenericMap):
 
         return u.Quantity(rsun_arcseconds, 'arcsec')
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'detector': 'EUVI'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an EUVI image"""
@@ -117,6 +120,9 @@ class CORMap(GenericMap):
         # TODO: This needs to do more than white-light.  Should give B, pB, etc.
         return "white-light"
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'detector': 'COR'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an COR image"""
@@ -163,6 +169,9 @@ class HIMap(GenericMap):
         # TODO: This needs to do more than white-light.  Should give B, pB, etc.
         return "white-light"
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'detector': 'HI'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an COR image"""
@@ -99,6 +99,9 @@ class SUVIMap(GenericMap):
         """
         return self.meta["telescop"].split("/")[0]
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'GOES-R Series Solar Ultraviolet Imager'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an AIA image"""
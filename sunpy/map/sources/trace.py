@@ -62,6 +62,9 @@ class TRACEMap(GenericMap):
         self.plot_settings['norm'] = ImageNormalize(
             stretch=source_stretch(self.meta, LogStretch()), clip=False)
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'TRACE'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an TRACE image"""
@@ -78,6 +78,9 @@ class SXTMap(GenericMap):
             s = 'white-light'
         return s
 
+    # Header values for looking up the class in the Map factory
+    _datasource_prefixes = {'instrume': 'SXT'}
+
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an SXT image"""
@@ -10,6 +10,7 @@ import tempfile
 import numpy as np
 import pytest
 
+import astropy.units as u
 from astropy.io import fits
 from astropy.wcs import WCS
 
@@ -208,6 +209,32 @@ class TestMap:
         pair_map = sunpy.map.Map(da, amap.meta)
         assert isinstance(pair_map, sunpy.map.GenericMap)
 
+    def test_lazy(self):
+        amap = sunpy.map.Map(AIA_171_IMAGE)
+        lazy_map = sunpy.map.Map(AIA_171_IMAGE, lazy=True)
+        assert isinstance(lazy_map, sunpy.map.sources.AIAMap)
+        assert not isinstance(lazy_map._data, np.ndarray)
+        assert lazy_map.dtype == amap.dtype
+        assert lazy_map.dimensions == amap.dimensions
+        # Taking a submap only reads the part of the data needed
+        bottom_left = amap.pixel_to_world(10 * u.pix, 20 * u.pix)
+        top_right = amap.pixel_to_world(50 * u.pix, 60 * u.pix)
+        lazy_submap = lazy_map.submap(bottom_left, top_right=top_right)
+        assert not isinstance(lazy_map._data, np.ndarray)
+        np.testing.assert_array_equal(lazy_submap.data,
+                                      amap.submap(bottom_left, top_right=top_right).data)
+        np.testing.assert_array_equal(lazy_map.data, amap.data)
+        assert isinstance(lazy_map._data, np.ndarray)
+
+    def test_lazy_compressed(self, tmpdir):
+        amap = sunpy.map.Map(AIA_171_IMAGE)
+        afilename = str(tmpdir / 'compressed.fits')
+        amap.save(afilename, hdu_type=fits.CompImageHDU)
+        compressed_map = sunpy.map.Map(afilename)
+        lazy_map = sunpy.map.Map(afilename, lazy=True)
+        assert lazy_map.dtype == compressed_map.dtype
+        np.testing.assert_array_equal(lazy_map.data, compressed_map.data)
+
     # requires sqlalchemy to run properly
     def test_databaseentry(self):
         pytest.importorskip('sqlalchemy')
@@ -67,6 +67,18 @@ def aia171_test_map_with_mask(aia171_test_map):
     return sunpy.map.Map(np.ma.array(aia171_test_map.data, mask=mask), aia171_test_map.meta)
 
 
+def _map_from_data(data):
+    """
+    A helioprojective map of an array, with a fixed observation time.
+    """
+    ref_coord = SkyCoord(0.0, 0.0, frame='helioprojective', obstime='2020-01-01', unit='deg',
+                         observer=SkyCoord(0 * u.deg, 0 * u.deg, 1 * u.m,
+                                           frame='heliographic_stonyhurst'))
+    header = sunpy.map.make_fitswcs_header(data, ref_coord, reference_pixel=[1, 1] * u.pix,
+                                           scale=[2, 1] * u.arcsec / u.pix)
+    return sunpy.map.Map(data, header)
+
+
 @pytest.fixture
 def generic_map():
     data = np.ones([6, 6], dtype=np.float64)
@@ -175,6 +187,65 @@ def test_std(generic_map):
     assert generic_map.std() == 0
 
 
+def test_statistics():
+    data = np.arange(100, dtype=float).reshape(10, 10)
+    data[0, :3] = np.nan
+    data[1, 0] = np.inf
+    finite = data[np.isfinite(data)]
+    amap = _map_from_data(data)
+    stats = amap.statistics()
+    assert stats == {'min': finite.min(), 'max': finite.max(), 'mean': finite.mean(),
+                     'std': finite.std(), 'count': finite.size, 'mean_error': 0,
+                     'count_nan': 3, 'count_inf': 1}
+    # A sample which is not smaller than the data gives the exact statistics
+    assert amap.statistics(sample_size=100) == stats
+
+    sample = data[::4, ::4]
+    sample = sample[np.isfinite(sample)]
+    stats = amap.statistics(sample_size=10)
+    assert stats['count'] == sample.size == 8
+    assert stats['min'] == sample.min()
+    assert stats['max'] == sample.max()
+    assert stats['mean'] == sample.mean()
+    assert stats['mean_error'] == sample.std() / np.sqrt(8)
+    assert stats['count_nan'] == 3
+    assert stats['count_inf'] == 1
+
+    with pytest.raises(ValueError, match="sample_size"):
+        amap.statistics(sample_size=0)
+
+
+def test_statistics_not_finite():
+    stats = _map_from_data(np.full((2, 2), np.nan)).statistics()
+    assert stats['count'] == 0
+    assert stats['count_nan'] == 4
+    assert np.isnan(stats['mean'])
+    counts, bin_edges = _map_from_data(np.full((2, 2), np.nan)).histogram(bins=4)
+    assert counts.tolist() == [0] * 4
+    np.testing.assert_allclose(bin_edges, [0, 0.25, 0.5, 0.75, 1])
+
+
+def test_histogram(monkeypatch):
+    data = np.random.RandomState(0).normal(size=(50, 40))
+    data[3, 4] = np.nan
+    amap = _map_from_data(data)
+    # The histogram is accumulated over several blocks of rows
+    monkeypatch.setattr(sunpy.map.mapbase, '_HISTOGRAM_BLOCK_SIZE', 300)
+    counts, bin_edges = amap.histogram(bins=20)
+    expected = np.histogram(data[np.isfinite(data)], bins=20)
+    np.testing.assert_array_equal(counts, expected[0])
+    np.testing.assert_array_equal(bin_edges, expected[1])
+
+    counts, bin_edges = amap.histogram(bins=4, value_range=(0, 2))
+    expected = np.histogram(data[np.isfinite(data)], bins=4, range=(0, 2))
+    np.testing.assert_array_equal(counts, expected[0])
+    np.testing.assert_array_equal(bin_edges, expected[1])
+
+    counts, bin_edges = amap.histogram(bins=20, sample_size=500)
+    assert counts.sum() == amap.statistics(sample_size=500)['count'] == 25 * 20
+    assert bin_edges[0] >= np.nanmin(data)
+
+
 # ==============================================================================
 # Test the default value of a load of properties
 # TODO: Test the header keyword extraction
@@ -535,6 +606,33 @@ def test_submap_data_header(generic_map, unit):
     assert (generic_map.data[height // 2:height, width // 2:width] == submap.data).all()
 
 
+def test_submap_view(aia171_test_map_with_mask):
+    amap = aia171_test_map_with_mask
+    bl = [10, 20] * u.pix
+    tr = [50, 60] * u.pix
+    submap = amap.submap(bl, top_right=tr)
+    view = amap.submap(bl, top_right=tr, view=True)
+
+    np.testing.assert_array_equal(view.data, submap.data)
+    np.testing.assert_array_equal(view.mask, submap.mask)
+    assert dict(view.meta) == dict(submap.meta)
+    assert np.shares_memory(view.data, amap.data)
+    assert np.shares_memory(view.mask, amap.mask)
+    assert not np.shares_memory(submap.data, amap.data)
+
+    # Neither the view nor this map can be modified through the other
+    with pytest.raises(ValueError, match="read-only"):
+        view.data[0, 0] = 0
+    with pytest.raises(ValueError, match="read-only"):
+        view.mask[0, 0] = True
+    assert amap.data.flags.writeable
+
+    # A submap of a view is also a view
+    subview = view.submap([0, 0] * u.pix, top_right=[5, 5] * u.pix, view=True)
+    assert np.shares_memory(subview.data, amap.data)
+    np.testing.assert_array_equal(subview.data, submap.data[:6, :6])
+
+
 def test_reference_coordinate(simple_map):
     assert simple_map.reference_pixel.x == 1 * u.pix
     assert simple_map.reference_pixel.y == 1 * u.pix
@@ -1098,3 +1196,41 @@ def test_contour(simple_map):
     assert contour.obstime == simple_map.date
     assert u.allclose(contour.Tx, [0, -1, 0, 1, 0] * u.arcsec, atol=1e-10 * u.arcsec)
     assert u.allclose(contour.Ty, [0.5, 0, -0.5, 0, 0.5] * u.arcsec, atol=1e-10 * u.arcsec)
+
+
+def test_contours(monkeypatch):
+    from skimage import measure
+    data = np.ones((3, 3))
+    data[1, 1] = 2
+    data[0, 0] = 3
+    simple_map = _map_from_data(data)
+    levels = [1.5, 2.5, 5]
+    contours = simple_map.contours(levels)
+    assert [len(level_contours) for level_contours in contours] == [2, 1, 0]
+    for level, level_contours in zip(levels, contours):
+        for contour, expected in zip(level_contours, simple_map.contour(level)):
+            assert u.allclose(contour.Tx, expected.Tx)
+            assert u.allclose(contour.Ty, expected.Ty)
+            assert contour.obstime == expected.obstime
+
+    # The contours are only found again for new levels
+    find_contours = mock.Mock(wraps=measure.find_contours)
+    monkeypatch.setattr(measure, 'find_contours', find_contours)
+    assert len(simple_map.contours([2.5, 1.5, 1.2])) == 3
+    assert find_contours.call_count == 1
+    simple_map.contours(1.5, fully_connected='high')
+    assert find_contours.call_count == 2
+
+
+def test_contours_downsample():
+    data = np.repeat(np.arange(9.)[:, np.newaxis], 9, axis=1)
+    simple_map = _map_from_data(data)
+    contour, = simple_map.contours(3.5)[0]
+    preview, = simple_map.contours(3.5, downsample=2)[0]
+    # The downsampled contour is along the same row, from the center of the
+    # first block to the center of the last full block
+    assert u.allclose(preview.Ty, contour.Ty[0], atol=1e-10 * u.arcsec)
+    ends = simple_map.wcs.array_index_to_world([3.5, 3.5], [0.5, 6.5])
+    assert u.allclose(preview.Tx[[0, -1]], ends.Tx, atol=1e-10 * u.arcsec)
+    with pytest.raises(ValueError, match="downsample"):
+        simple_map.contours(3.5, downsample=0)
@@ -2,9 +2,14 @@
 Test mapsequence functionality
 """
 import os
+import warnings
+from copy import deepcopy
 from unittest import mock
 
+import matplotlib.cm
+import matplotlib.pyplot
 import numpy as np
+import PIL.Image
 import pytest
 
 import astropy.units as u
@@ -100,6 +105,22 @@ def test_at_least_one_map_has_mask(mapsequence_all_the_same,
     assert mapsequence_all_the_same_some_have_masks.at_least_one_map_has_mask()
 
 
+def test_submap(mapsequence_all_the_same, mapsequence_all_the_same_some_have_masks):
+    bl = [10, 20] * u.pix
+    tr = [50, 60] * u.pix
+    for sequence in [mapsequence_all_the_same, mapsequence_all_the_same_some_have_masks]:
+        subsequence = sequence.submap(bl, top_right=tr, view=True)
+        assert isinstance(subsequence, sunpy.map.MapSequence)
+        for submap, amap in zip(subsequence.maps, sequence.maps):
+            assert np.shares_memory(submap.data, amap.data)
+            np.testing.assert_array_equal(submap.data, amap.submap(bl, top_right=tr).data)
+
+        cube = subsequence.as_array()
+        assert cube.shape == (41, 41, len(sequence))
+        np.testing.assert_array_equal(np.ma.getdata(cube),
+                                      np.ma.getdata(sequence.as_array())[20:61, 10:51])
+
+
 def test_as_array(mapsequence_all_the_same,
                   mapsequence_different,
                   mapsequence_all_the_same_all_have_masks,
@@ -190,9 +211,184 @@ def test_repr(mapsequence_all_the_same, mapsequence_different_maps):
     assert expected_out1 in obtained_out or expected_out2 in obtained_out
 
 
-def test_derotate():
-    with pytest.raises(NotImplementedError):
-        mapsequence = sunpy.map.MapSequence(derotate=True)
+@pytest.fixture
+def mapsequence_varying(aia_map):
+    """ A sequence of maps with different data, dates and exposure times,
+    some with masks and NaNs."""
+    rng = np.random.default_rng(0)
+    maps = []
+    for i in range(7):
+        data = rng.normal(size=aia_map.data.shape) * (i + 1)
+        data[rng.random(data.shape) < 0.1] = np.nan
+        meta = aia_map.meta.copy()
+        meta['date-obs'] = (aia_map.date + i * u.min).isot
+        meta['exptime'] = float(i)
+        mask = rng.random(data.shape) < 0.1 if i % 2 else None
+        maps.append(aia_map._new_instance(data, meta, mask=mask))
+    return sunpy.map.MapSequence(maps, sortby=None)
+
+
+def _nan_cube(sequence):
+    return np.stack([np.where(m.mask if m.mask is not None else False, np.nan, m.data)
+                     for m in sequence.maps])
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 16])
+@pytest.mark.parametrize('method, function', [('mean', np.nanmean),
+                                              ('std', np.nanstd),
+                                              ('min', np.nanmin),
+                                              ('max', np.nanmax),
+                                              ('median', np.nanmedian)])
+def test_reductions(mapsequence_varying, method, function, chunk_size):
+    reduced = getattr(mapsequence_varying, method)(chunk_size=chunk_size)
+    assert isinstance(reduced, sunpy.map.sources.AIAMap)
+    np.testing.assert_allclose(reduced.data, function(_nan_cube(mapsequence_varying), axis=0))
+
+
+def test_reductions_options(mapsequence_varying):
+    cube = _nan_cube(mapsequence_varying)
+    with warnings.catch_warnings():
+        # Some pixels have a single valid value
+        warnings.simplefilter('ignore', RuntimeWarning)
+        expected = np.nanstd(cube, axis=0, ddof=1)
+    np.testing.assert_allclose(mapsequence_varying.std(ddof=1, chunk_size=2).data, expected)
+    np.testing.assert_allclose(mapsequence_varying.percentile(90, chunk_size=2).data,
+                               np.nanpercentile(cube, 90, axis=0))
+
+
+def test_reduction_meta(mapsequence_varying):
+    reduced = mapsequence_varying.mean()
+    first = mapsequence_varying[0]
+    assert reduced.date == first.date
+    assert reduced.meta['date-end'] == mapsequence_varying[-1].date.isot
+    assert reduced.reference_pixel == first.reference_pixel
+    assert reduced.observer_coordinate.lat == first.observer_coordinate.lat
+    # Keys which differ between the maps are dropped
+    assert 'exptime' not in reduced.meta
+    assert reduced.meta['wavelnth'] == first.meta['wavelnth']
+
+
+def test_reduction_meta_observer(aia_map):
+    maps = []
+    for i in range(3):
+        meta = aia_map.meta.copy()
+        for key in ['dsun_obs', 'hgln_obs', 'hglt_obs', 'crln_obs', 'crlt_obs',
+                    'haex_obs', 'haey_obs', 'haez_obs']:
+            meta[key] = meta[key] + i * 1e-6
+        maps.append(aia_map._new_instance(aia_map.data, meta))
+    reduced = sunpy.map.MapSequence(maps, sortby=None).mean()
+    # The observer is the one of the first map
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        observer = reduced.observer_coordinate
+    assert observer.lon == maps[0].observer_coordinate.lon
+    assert reduced.meta['haex_obs'] == maps[0].meta['haex_obs']
+    assert reduced.meta['crln_obs'] == maps[0].meta['crln_obs']
+
+
+def test_reduction_errors(mapsequence_different, mapsequence_varying):
+    with pytest.raises(ValueError, match="Not all maps have the same shape"):
+        mapsequence_different.mean()
+    with pytest.raises(ValueError, match="chunk_size"):
+        mapsequence_varying.max(chunk_size=0)
+    with pytest.raises(ValueError, match="does not contain any maps"):
+        sunpy.map.MapSequence([]).min()
+
+
+def test_running_difference(mapsequence_varying):
+    cube = _nan_cube(mapsequence_varying)
+    differences = mapsequence_varying.running_difference(lag=2)
+    assert len(differences) == len(mapsequence_varying) - 2
+    for i, difference in enumerate(differences):
+        assert difference.date == mapsequence_varying[i + 2].date
+        np.testing.assert_allclose(difference.data, cube[i + 2] - cube[i])
+    with pytest.raises(ValueError, match="lag"):
+        mapsequence_varying.running_difference(lag=0)
+
+
+def test_base_difference(mapsequence_varying):
+    cube = _nan_cube(mapsequence_varying)
+    differences = mapsequence_varying.base_difference()
+    np.testing.assert_allclose(differences[3].data, cube[3] - cube[0])
+
+    mean = mapsequence_varying.mean()
+    differences = mapsequence_varying.base_difference(mean)
+    # The difference is only calculated for the part of the data which is used
+    submap = differences[2].submap([0, 0] * u.pix, top_right=[9, 9] * u.pix)
+    np.testing.assert_allclose(submap.data, (cube[2] - mean.data)[:10, :10])
+
+
+def test_derotate(aia_map):
+    maps = []
+    for hours in [0, 1]:
+        meta = aia_map.meta.copy()
+        meta['date-obs'] = (aia_map.date + hours * u.hour).isot
+        maps.append(sunpy.map.Map(aia_map.data, meta))
+
+    sequence = sunpy.map.MapSequence(maps, derotate=True)
+    assert len(sequence) == 2
+    for amap in sequence:
+        assert amap.date == aia_map.date
+        assert amap.data.shape == aia_map.data.shape
+    # The data of the maps are in a single array
+    assert sequence[0].data.base is sequence[1].data.base
+
+
+def test_render_frames(mapsequence_varying):
+    frames = mapsequence_varying.render_frames(max_workers=2)
+    assert len(frames) == len(mapsequence_varying)
+    for amap, frame in zip(mapsequence_varying, frames):
+        assert frame.shape == amap.data.shape + (4,)
+        assert frame.dtype == np.uint8
+        assert not frame.flags.writeable
+    amap = mapsequence_varying[1]
+    data = np.ma.masked_invalid(np.ma.array(amap.data, mask=amap.mask))
+    norm = deepcopy(amap.plot_settings['norm'])
+    norm.autoscale_None(data)
+    cmap = matplotlib.cm.get_cmap(amap.plot_settings['cmap'])
+    np.testing.assert_array_equal(frames[1], cmap(norm(data), bytes=True))
+    # Only the masked and NaN pixels take the "bad" color
+    np.testing.assert_array_equal(frames[1][..., 3] == 0, data.mask)
+
+    # The frames are only rendered again for other maps or resolutions
+    again = mapsequence_varying.render_frames()
+    assert all(frame is cached for frame, cached in zip(frames, again))
+    low = mapsequence_varying.render_frames(resample=[0.5, 0.25])
+    assert low[0].shape == (amap.data.shape[0] // 4, amap.data.shape[1] // 2, 4)
+    mapsequence_varying.maps[0] = mapsequence_varying.maps[1]
+    assert mapsequence_varying.render_frames()[0] is not frames[0]
+
+
+def test_render_frames_resample_mask(mapsequence_varying):
+    amap = mapsequence_varying[1]
+    frame = mapsequence_varying.render_frames(resample=[0.5, 0.5])[1]
+    # Masked pixels are left out of the resampled frame as NaNs are
+    nan_map = amap._new_instance(np.where(amap.mask, np.nan, amap.data), amap.meta)
+    expected = sunpy.map.MapSequence([nan_map]).render_frames(resample=[0.5, 0.5])[0]
+    np.testing.assert_array_equal(frame, expected)
+
+
+def test_save_animation(mapsequence_varying, tmp_path):
+    sequence = mapsequence_varying.submap([0, 0] * u.pix, top_right=[39, 29] * u.pix)
+    filename = tmp_path / 'sequence.gif'
+    sequence.save_animation(str(filename), writer='pillow')
+    with PIL.Image.open(filename) as movie:
+        assert movie.n_frames == len(sequence)
+        assert movie.size == (40, 30)
+
+
+def test_save_animation_different(mapsequence_different, tmp_path):
+    with pytest.raises(ValueError, match='same shape'):
+        mapsequence_different.save_animation(str(tmp_path / 'sequence.gif'), writer='pillow')
+
+
+def test_peek_cached(mapsequence_varying):
+    animator = mapsequence_varying.peek(cached=True)
+    frames = mapsequence_varying.render_frames()
+    np.testing.assert_array_equal(animator.im.get_array(), frames[0])
+    animator.updatefig(2, animator.im, animator.sliders[0]._slider)
+    np.testing.assert_array_equal(animator.im.get_array(), frames[2])
+    matplotlib.pyplot.close(animator.fig)
 
 
 def test_repr_html(mapsequence_all_the_same):
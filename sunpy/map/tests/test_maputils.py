@@ -10,6 +10,7 @@ import sunpy.data.test
 import sunpy.map
 from sunpy.coordinates import HeliographicStonyhurst
 from sunpy.coordinates.utils import GreatArc
+from sunpy.map import maputils
 from sunpy.map.maputils import (
     all_coordinates_from_map,
     all_pixel_indices_from_map,
@@ -19,7 +20,9 @@ from sunpy.map.maputils import (
     is_all_off_disk,
     is_all_on_disk,
     map_edges,
+    off_limb_mask,
     on_disk_bounding_coordinates,
+    on_disk_mask,
     sample_at_coords,
     solar_angular_radius,
 )
@@ -166,6 +169,38 @@ def test_on_disk_bounding_coordinates(aia171_test_map):
     np.testing.assert_almost_equal(tr.Ty.to(u.arcsec).value, 971.63586861, decimal=1)
 
 
+def test_on_disk_mask(aia171_test_map, all_off_disk_map, all_on_disk_map, straddles_limb_map):
+    for smap in [aia171_test_map, all_off_disk_map, all_on_disk_map, straddles_limb_map]:
+        mask = on_disk_mask(smap)
+        assert mask.shape == smap.data.shape
+        np.testing.assert_array_equal(
+            mask, coordinate_is_on_solar_disk(all_coordinates_from_map(smap)))
+        np.testing.assert_array_equal(off_limb_mask(smap), ~mask)
+
+
+def test_coordinate_grid_cache(aia171_test_map, all_on_disk_map):
+    grid = maputils._helioprojective_grid(aia171_test_map)
+    assert grid[0].dtype == np.float32
+    assert not grid[0].flags.writeable
+    coordinates = all_coordinates_from_map(aia171_test_map)
+    np.testing.assert_allclose(grid[0], coordinates.Tx.to_value(u.arcsec), atol=1e-3)
+    np.testing.assert_allclose(grid[1], coordinates.Ty.to_value(u.arcsec), atol=1e-3)
+
+    # Maps with the same geometry share the grid
+    same_geometry = sunpy.map.Map(aia171_test_map.data + 1, aia171_test_map.meta)
+    assert maputils._helioprojective_grid(same_geometry)[0] is grid[0]
+    assert maputils._helioprojective_grid(all_on_disk_map)[0].shape == all_on_disk_map.data.shape
+
+
+def test_on_disk_mask_not_helioprojective():
+    header = {'ctype1': 'CRLN-CEA', 'ctype2': 'CRLT-CEA', 'cunit1': 'deg', 'cunit2': 'deg',
+              'cdelt1': 1, 'cdelt2': 1, 'crpix1': 1, 'crpix2': 1, 'crval1': 0, 'crval2': 0,
+              'date-obs': '2011-02-15T00:00:00'}
+    carrington_map = sunpy.map.Map(np.zeros((10, 10)), header)
+    with pytest.raises(ValueError, match="Helioprojective"):
+        on_disk_mask(carrington_map)
+
+
 def test_data_at_coordinates(aia171_test_map, aia_test_arc):
     data = sample_at_coords(aia171_test_map, aia_test_arc.coordinates())
     pixels = np.asarray(np.rint(
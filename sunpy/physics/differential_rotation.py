@@ -1,5 +1,7 @@
 import warnings
 from copy import deepcopy
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -371,7 +373,51 @@ def _get_bounding_coordinates(coords):
                     frame=coords[0].frame)
 
 
-def _warp_sun_coordinates(xy, smap, new_observer, **diff_rot_kwargs):
+def _output_heliographic_coordinates(xy, smap, new_observer):
+    """
+    The heliographic Stonyhurst coordinates of pixels in the warped image, as
+    seen by the new observer.
+
+    These only depend on the WCS of the map and on the new observer, so they
+    can be shared by maps with the same geometry.
+
+    Parameters
+    ----------
+    xy : `numpy.ndarray`
+        Pixel coordinates in the warped image.
+    smap : `~sunpy.map.GenericMap`
+        Original map that we want to transform.
+    new_observer : `~astropy.coordinates.SkyCoord`
+        The location of the new observer.
+
+    Returns
+    -------
+    `~astropy.coordinates.SkyCoord`
+        The heliographic Stonyhurst coordinates of the pixels.
+    """
+    # Suppress NaN warnings in coordinate transforms
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+
+        # We need to get the input pixel coordinates into the OUTPUT HPC frame.
+        # To save us having to construct a WCS etc, we do the transformation
+        # using the output map, and then replace the observer in place before
+        # transforming to HGS. This is acceptable because the pixel -> world
+        # transformation is independent of the observer.
+        input_pixels = xy.T * u.pix
+        map_coord = smap.pixel_to_world(*input_pixels)
+        output_hpc_coords = SkyCoord(map_coord.Tx,
+                                     map_coord.Ty,
+                                     map_coord.distance,
+                                     obstime=new_observer.obstime,
+                                     observer=new_observer,
+                                     frame=Helioprojective)
+
+        return output_hpc_coords.transform_to(HeliographicStonyhurst)
+
+
+def _warp_sun_coordinates(xy, smap, new_observer, heliographic_coordinate=None,
+                          **diff_rot_kwargs):
     """
     This function takes pixel coordinates in the warped image (`xy`) and
     calculates the pixel locations of those pixels in the map.
@@ -390,6 +436,9 @@ def _warp_sun_coordinates(xy, smap, new_observer, **diff_rot_kwargs):
         Pixel coordinates in the warped image.
     smap : `~sunpy.map.GenericMap`
         Original map that we want to transform.
+    heliographic_coordinate : `~astropy.coordinates.SkyCoord`, optional
+        The heliographic Stonyhurst coordinates of ``xy`` as seen by the new
+        observer, if they have already been calculated.
 
     Returns
     -------
@@ -397,6 +446,9 @@ def _warp_sun_coordinates(xy, smap, new_observer, **diff_rot_kwargs):
         Pixel coordinates in the map corresponding to the input pixels in the
         warped image.
     """
+    if heliographic_coordinate is None:
+        heliographic_coordinate = _output_heliographic_coordinates(xy, smap, new_observer)
+
     # Suppress NaN warnings in coordinate transforms
     with warnings.catch_warnings():
         warnings.simplefilter('ignore')
@@ -404,21 +456,6 @@ def _warp_sun_coordinates(xy, smap, new_observer, **diff_rot_kwargs):
         # The time interval between the new observer time and the map observation time.
         interval = (parse_time(new_observer.obstime) - parse_time(smap.date)).to(u.s)
 
-        # We need to get the input pixel coordinates into the OUTPUT HPC frame.
-        # To save us having to construct a WCS etc, we do the transformation
-        # using the output map, and then replace the observer in place before
-        # transforming to HGS. This is acceptable because the pixel -> world
-        # transformation is independent of the observer.
-        input_pixels = xy.T * u.pix
-        map_coord = smap.pixel_to_world(*input_pixels)
-        output_hpc_coords = SkyCoord(map_coord.Tx,
-                                     map_coord.Ty,
-                                     map_coord.distance,
-                                     obstime=new_observer.obstime,
-                                     observer=new_observer,
-                                     frame=Helioprojective)
-
-        heliographic_coordinate = output_hpc_coords.transform_to(HeliographicStonyhurst)
         # Now transform the HGS coordinates to the obstime of the input map (to account for movement of Earth)
         heliographic_coordinate = heliographic_coordinate.transform_to(
             HeliographicStonyhurst(obstime=smap.date))
@@ -452,6 +489,28 @@ def _warp_sun_coordinates(xy, smap, new_observer, **diff_rot_kwargs):
     return xy2
 
 
+def _rotated_meta(smap, new_observer):
+    """
+    The metadata of a map differentially rotated to the new observer, before
+    any change of the reference pixel.
+    """
+    # Update the meta information with the new date and time.
+    out_meta = deepcopy(smap.meta)
+    if out_meta.get('date_obs', False):
+        del out_meta['date_obs']
+    out_meta['date-obs'] = new_observer.obstime.strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+    # Need to update the observer location for the output map.
+    # Remove all the possible observer keys
+    all_keys = expand_list([e[0] for e in smap._supported_observer_coordinates])
+    for key in all_keys:
+        out_meta.pop(key)
+
+    # Add a new HGS observer
+    out_meta.update(get_observer_meta(new_observer, out_meta['rsun_ref']*u.m))
+    return out_meta
+
+
 def differential_rotate(smap, observer=None, time=None, **diff_rot_kwargs):
     """
     Warp a `~sunpy.map.GenericMap` to take into account both solar differential
@@ -588,20 +647,7 @@ def differential_rotate(smap, observer=None, time=None, **diff_rot_kwargs):
     out_data = transform.warp(smap_data, inverse_map=_warp_sun_coordinates,
                               map_args=warp_args, preserve_range=True, cval=np.nan)
 
-    # Update the meta information with the new date and time.
-    out_meta = deepcopy(smap.meta)
-    if out_meta.get('date_obs', False):
-        del out_meta['date_obs']
-    out_meta['date-obs'] = new_observer.obstime.strftime("%Y-%m-%dT%H:%M:%S.%f")
-
-    # Need to update the observer location for the output map.
-    # Remove all the possible observer keys
-    all_keys = expand_list([e[0] for e in smap._supported_observer_coordinates])
-    for key in all_keys:
-        out_meta.pop(key)
-
-    # Add a new HGS observer
-    out_meta.update(get_observer_meta(new_observer, out_meta['rsun_ref']*u.m))
+    out_meta = _rotated_meta(smap, new_observer)
 
     if is_sub_full_disk:
         # Define a new reference pixel and the value at the reference pixel.
@@ -618,3 +664,91 @@ def differential_rotate(smap, observer=None, time=None, **diff_rot_kwargs):
         return smap._new_instance(out_data, out_meta).submap(rotated_bl, top_right=rotated_tr)
     else:
         return smap._new_instance(out_data, out_meta)
+
+
+def _differential_rotate_maps(maps, observer=None, time=None, max_workers=None,
+                              **diff_rot_kwargs):
+    """
+    Differentially rotate maps to the same new observer, as
+    `~sunpy.physics.differential_rotation.differential_rotate` does for each
+    map.
+
+    The maps which contain the full disk are warped with coordinates planned
+    once for each map geometry: the heliographic coordinates of the output
+    pixels as seen by the new observer are shared by all the maps with the same
+    shape and WCS. When all the maps contain the full disk and have the same
+    shape, their data is written into a single array. Maps which contain only
+    part of the disk are rotated with
+    `~sunpy.physics.differential_rotation.differential_rotate`. The maps are
+    rotated in parallel threads.
+
+    Parameters
+    ----------
+    maps : `list` of `~sunpy.map.GenericMap`
+        The maps to rotate.
+    observer : `~astropy.coordinates.BaseCoordinateFrame`, `~astropy.coordinates.SkyCoord`, `None`, optional
+        The location of the new observer.
+    time : sunpy-compatible time, `~astropy.time.TimeDelta`, `~astropy.units.Quantity`, `None`, optional
+        The time of the new observer, or the time after the observation time of
+        the first map.
+    max_workers : `int`, optional
+        The maximum number of threads used to rotate the maps. Defaults to the
+        default of `concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    `list` of `~sunpy.map.GenericMap`
+        The rotated maps, in the order of ``maps``.
+    """
+    from skimage import transform
+
+    from sunpy.map.maputils import _geometry_key
+
+    if not maps:
+        return []
+    for smap in maps:
+        if is_all_off_disk(smap):
+            raise ValueError("The entire map is off disk. No data to differentially rotate.")
+
+    new_observer = _get_new_observer(maps[0].date, observer, time)
+
+    full_disk = [contains_full_disk(smap) for smap in maps]
+    out = None
+    if all(full_disk) and len({smap.data.shape for smap in maps}) == 1:
+        out = np.empty((len(maps),) + maps[0].data.shape)
+
+    # The heliographic coordinates of the output pixels of each geometry, for
+    # the pixel coordinates which skimage.transform.warp_coords maps
+    plans = {}
+    for smap, is_full_disk in zip(maps, full_disk):
+        key = _geometry_key(smap)
+        if is_full_disk and key not in plans:
+            rows, cols = smap.data.shape
+            xy = np.indices((cols, rows), dtype=np.float64).reshape(2, -1).T
+            plans[key] = _output_heliographic_coordinates(xy, smap, new_observer)
+
+    def rotate_map(i):
+        smap = maps[i]
+        if not full_disk[i]:
+            return differential_rotate(smap, observer=new_observer, **diff_rot_kwargs)
+
+        coords = transform.warp_coords(
+            partial(_warp_sun_coordinates, smap=smap, new_observer=new_observer,
+                    heliographic_coordinate=plans[_geometry_key(smap)], **diff_rot_kwargs),
+            smap.data.shape)
+
+        # Check for masked maps
+        if smap.mask is not None:
+            smap_data = np.ma.array(smap.data, mask=smap.mask)
+        else:
+            smap_data = smap.data
+
+        out_data = transform.warp(smap_data, inverse_map=coords, preserve_range=True,
+                                  cval=np.nan)
+        if out is not None:
+            out[i] = out_data
+            out_data = out[i]
+        return smap._new_instance(out_data, _rotated_meta(smap, new_observer))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(rotate_map, range(len(maps))))
@@ -14,6 +14,7 @@ from sunpy.coordinates import frames
 from sunpy.coordinates.ephemeris import get_earth
 from sunpy.map.maputils import map_edges
 from sunpy.physics.differential_rotation import (
+    _differential_rotate_maps,
     _get_bounding_coordinates,
     _get_extreme_position,
     _get_new_observer,
@@ -274,6 +275,36 @@ def test_differential_rotate_time_off_disk(all_off_disk_map):
 
 
 # Tests of the helper functions
+def test_differential_rotate_maps(aia171_test_map, all_on_disk_map):
+    maps = []
+    for hours in [0, 2]:
+        meta = aia171_test_map.meta.copy()
+        meta['date-obs'] = (aia171_test_map.date + hours * u.hr).isot
+        maps.append(sunpy.map.Map(aia171_test_map.data, meta))
+    maps.append(all_on_disk_map)
+    new_observer = get_earth(aia171_test_map.date + 6*u.hr)
+
+    rotated_maps = _differential_rotate_maps(maps, observer=new_observer, max_workers=2)
+    assert len(rotated_maps) == 3
+    for rotated_map, smap in zip(rotated_maps, maps):
+        expected = differential_rotate(smap, observer=new_observer)
+        np.testing.assert_array_equal(rotated_map.data, expected.data)
+        assert dict(rotated_map.meta) == dict(expected.meta)
+
+
+def test_differential_rotate_maps_cube(aia171_test_map):
+    maps = [aia171_test_map, aia171_test_map]
+    with pytest.warns(UserWarning, match="Using 'time' assumes an Earth-based observer"):
+        rotated_maps = _differential_rotate_maps(maps, time=3*u.hr)
+    assert rotated_maps[0].data.base is rotated_maps[1].data.base
+    assert rotated_maps[0].data.base.shape == (2,) + aia171_test_map.data.shape
+
+
+def test_differential_rotate_maps_all_off_disk(aia171_test_map, all_off_disk_map):
+    with pytest.raises(ValueError, match="The entire map is off disk"):
+        _differential_rotate_maps([aia171_test_map, all_off_disk_map], time=3*u.hr)
+
+
 def test_get_new_observer(aia171_test_map):
     initial_obstime = aia171_test_map.date
     rotation_interval = 2 * u.day
@@ -172,6 +172,8 @@ class EVESpWxTimeSeries(GenericTimeSeries):
     """
     # Class attribute used to specify the source class of the TimeSeries.
     _source = 'eve'
+    # Header values for looking up the class in the TimeSeries factory
+    _datasource_prefixes = {'source': _source}
 
     @peek_show
     def peek(self, column=None, **kwargs):
@@ -58,6 +58,8 @@ class GBMSummaryTimeSeries(GenericTimeSeries):
     """
     # Class attribute used to specify the source class of the TimeSeries.
     _source = 'gbmsummary'
+    # Header values for looking up the class in the TimeSeries factory
+    _datasource_prefixes = {'source': _source, 'INSTRUME': 'GBM'}
 
     @peek_show
     def peek(self, **kwargs):
@@ -52,6 +52,8 @@ class XRSTimeSeries(GenericTimeSeries):
     """
     # Class attribute used to specify the source class of the TimeSeries.
     _source = 'xrs'
+    # Header values for looking up the class in the TimeSeries factory
+    _datasource_prefixes = {'source': _source, 'TELESCOP': 'GOES'}
 
     @peek_show
     def peek(self, title="GOES Xray Flux", **kwargs):
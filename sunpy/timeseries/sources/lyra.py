@@ -54,6 +54,8 @@ class LYRATimeSeries(GenericTimeSeries):
     """
     # Class attribute used to specify the source class of the TimeSeries.
     _source = 'lyra'
+    # Header values for looking up the class in the TimeSeries factory
+    _datasource_prefixes = {'source': _source, 'INSTRUME': 'LYRA'}
 
     @peek_show
     def peek(self, names=3, **kwargs):
@@ -57,6 +57,8 @@ class NOAAIndicesTimeSeries(GenericTimeSeries):
     """
     # Class attribute used to specify the source class of the TimeSeries.
     _source = 'noaaindices'
+    # Header values for looking up the class in the TimeSeries factory
+    _datasource_prefixes = {'source': _source}
 
     @peek_show
     def peek(self, type='sunspot SWO', **kwargs):
@@ -250,6 +252,8 @@ class NOAAPredictIndicesTimeSeries(GenericTimeSeries):
 
     # Class attribute used to specify the source class of the TimeSeries.
     _source = 'noaapredictindices'
+    # Header values for looking up the class in the TimeSeries factory
+    _datasource_prefixes = {'source': _source}
 
     @ peek_show
     def peek(self, **plot_args):
@@ -50,6 +50,8 @@ class NoRHTimeSeries(GenericTimeSeries):
     """
     # Class attribute used to specify the source class of the TimeSeries.
     _source = 'norh'
+    # Header values for looking up the class in the TimeSeries factory
+    _datasource_prefixes = {'source': _source, 'ORIGIN': 'NOBEYAMA RADIO OBS'}
 
     def __init__(self, data, header, units, **kwargs):
         super().__init__(data, header, units, **kwargs)
@@ -60,6 +60,8 @@ class RHESSISummaryTimeSeries(GenericTimeSeries):
 
     # Class attribute used to specify the source class of the TimeSeries.
     _source = 'rhessi'
+    # Header values for looking up the class in the TimeSeries factory
+    _datasource_prefixes = {'source': _source, 'telescop': 'HESSI'}
 
     @peek_show
     def peek(self, title="RHESSI Observing Summary Count Rate", **kwargs):
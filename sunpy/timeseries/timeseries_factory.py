@@ -5,6 +5,7 @@ import os
 import copy
 import glob
 import warnings
+import functools
 from collections import OrderedDict
 from urllib.request import urlopen
 
@@ -481,12 +482,10 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         return new_timeseries
 
     def _get_matching_widget(self, **kwargs):
-        candidate_widget_types = list()
-
-        for key in self.registry:
-            # Call the registered validation function for each registered class
-            if self.registry[key](**kwargs):
-                candidate_widget_types.append(key)
+        # Call the registered validation function of each registered class
+        # whose header prefixes match
+        candidate_widget_types = self._matching_widget_types(
+            functools.partial(_source_value, kwargs), **kwargs)
 
         n_matches = len(candidate_widget_types)
 
@@ -537,6 +536,21 @@ def _apply_result(data_header_pairs, filepaths, result):
     return data_header_pairs, filepaths
 
 
+def _source_value(kwargs, key):
+    """
+    The value of a header key for the arguments of the factory.
+
+    The sources check the ``source`` keyword when it is given and the ``meta``
+    header otherwise, so only one of them is used to look the sources up.
+    """
+    source = kwargs.get('source', '')
+    if source:
+        return source.lower() if key == 'source' else None
+    if key == 'source' or 'meta' not in kwargs:
+        return None
+    return kwargs['meta'].get(key)
+
+
 def _is_url(arg):
     try:
         urlopen(arg)
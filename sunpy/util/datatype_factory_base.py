@@ -41,6 +41,13 @@ class BasicRegistrationFactory:
     -----
     * A valid validation function must be a classmethod of the registered widget
       and it must return a `bool`.
+    * A widget can declare a ``_datasource_prefixes`` class attribute, a `dict`
+      mapping header keys to a prefix (or a tuple of prefixes). It declares that
+      its validation function can only return `True` for a header in which at
+      least one of these keys has a value starting with one of its prefixes.
+      Factories which look the widgets up by header only call the validation
+      functions of the widgets whose prefixes match, and of the widgets which do
+      not declare any.
     """
 
     def __init__(self, default_widget_type=None,
@@ -55,6 +62,10 @@ class BasicRegistrationFactory:
         self.validation_functions = (['_factory_validation_function'] +
                                      additional_validation_functions)
 
+        # The index of the widgets by their header prefixes, built from a copy
+        # of the registry so that it is rebuilt when the registry changes
+        self._index = None
+
     def __call__(self, *args, **kwargs):
         """
         Method for running the factory.
@@ -95,6 +106,66 @@ class BasicRegistrationFactory:
 
         return WidgetType(*args, **kwargs)
 
+    def _matching_widget_types(self, header_value, *args, **kwargs):
+        """
+        The registered widgets whose validation function returns `True` for
+        the arguments, in the order they were registered.
+
+        Parameters
+        ----------
+        header_value : `callable`
+            Function returning the value of a header key for the arguments, or
+            `None` if there is no value. It is used to only validate the widgets
+            whose ``_datasource_prefixes`` match.
+        """
+        if self._index is None or self._index[0] != self.registry:
+            self._build_index()
+        _, order, index, unindexed = self._index
+
+        candidates = list(unindexed)
+        for key, tables in index:
+            value = header_value(key)
+            if value is None:
+                continue
+            value = str(value)
+            for length, table in tables:
+                widgets = table.get(value[:length])
+                if widgets:
+                    candidates.extend(widgets)
+        if len(candidates) > 1:
+            candidates = sorted(set(candidates), key=order.__getitem__)
+
+        registry = self.registry
+        return [WidgetType for WidgetType in candidates
+                if registry[WidgetType](*args, **kwargs)]
+
+    def _build_index(self):
+        """
+        Index the registered widgets by their header prefixes.
+
+        Only the widgets which declare ``_datasource_prefixes`` themselves and
+        are validated by their own validation function are indexed, as the
+        prefixes of a parent class say nothing about another function.
+        """
+        registry = dict(self.registry)
+        order = {WidgetType: i for i, WidgetType in enumerate(registry)}
+        # Header key to prefix length to prefix to widgets
+        index = {}
+        unindexed = []
+        for WidgetType, vfunc in registry.items():
+            prefixes = WidgetType.__dict__.get('_datasource_prefixes')
+            if prefixes is None or getattr(vfunc, '__self__', None) is not WidgetType:
+                unindexed.append(WidgetType)
+                continue
+            for key, values in prefixes.items():
+                if isinstance(values, str):
+                    values = (values,)
+                tables = index.setdefault(key, {})
+                for value in values:
+                    tables.setdefault(len(value), {}).setdefault(value, []).append(WidgetType)
+        index = tuple((key, tuple(tables.items())) for key, tables in index.items())
+        self._index = (registry, order, index, tuple(unindexed))
+
     def register(self, WidgetType, validation_function=None, is_default=False):
         """
         Register a widget with the factory.
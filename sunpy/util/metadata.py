@@ -27,6 +27,13 @@ class MetaDict(OrderedDict):
         """
         Creates a new MetaDict instance.
         """
+        if len(args) == 1 and isinstance(args[0], MetaDict):
+            # The keys of a MetaDict are already lower-case and its keycomments
+            # already pruned, so it is only copied
+            super().__init__()
+            self._copy_from(args[0])
+            return
+
         # Store all keys as lower-case to allow for case-insensitive indexing
         # OrderedDict can be instantiated from a list of lists or a tuple of tuples
         tags = dict()
@@ -47,6 +54,21 @@ class MetaDict(OrderedDict):
         # dictionary (if they provided one).
         self._prune_keycomments(copy=True)
 
+    def _copy_from(self, meta):
+        """
+        Copy the items of another `MetaDict`, bypassing the key normalization.
+        """
+        setitem = OrderedDict.__setitem__
+        for key, value in meta.items():
+            setitem(self, key, value)
+        self._prune_keycomments(copy=True)
+
+    def copy(self):
+        """
+        Override ``.copy()`` to not normalize the keys again.
+        """
+        return type(self)(self)
+
     def _prune_keycomments(self, copy=False):
         """
         Remove keycomments for keys that are not contained in the MetaDict.
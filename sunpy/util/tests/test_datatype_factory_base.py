@@ -63,6 +63,28 @@ class MissingClassMethodDifferentValidationWidget(BaseWidget):
         return kwargs.get('style') == 'missing-different'
 
 
+class PrefixedWidget(BaseWidget):
+    _datasource_prefixes = {'instrume': ('AB', 'XY')}
+
+    @classmethod
+    def _factory_validation_function(cls, *args, **kwargs):
+        return str(kwargs.get('instrume', '')).startswith(('AB', 'XY'))
+
+
+class ExactWidget(BaseWidget):
+    _datasource_prefixes = {'instrume': 'ABC', 'detector': 'ABC'}
+
+    @classmethod
+    def _factory_validation_function(cls, *args, **kwargs):
+        return kwargs.get('instrume') == 'ABC' or kwargs.get('detector') == 'ABC'
+
+
+class InheritedPrefixWidget(PrefixedWidget):
+    @classmethod
+    def _factory_validation_function(cls, *args, **kwargs):
+        return kwargs.get('style') == 'inherited'
+
+
 class TestBasicRegistrationFactory:
 
     def test_default_factory(self):
@@ -151,3 +173,33 @@ class TestBasicRegistrationFactory:
 
         with pytest.raises(ValidationFunctionError):
             ExtraValidationFactory.register(MissingClassMethodDifferentValidationWidget)
+
+    def test_matching_widget_types(self):
+        registry = {}
+        factory = BasicRegistrationFactory(registry=registry)
+        for WidgetType in [StandardWidget, PrefixedWidget, ExactWidget, InheritedPrefixWidget]:
+            factory.register(WidgetType)
+
+        def match(**kwargs):
+            indexed = factory._matching_widget_types(kwargs.get, **kwargs)
+            # The index only skips the widgets which would not match
+            assert indexed == [WidgetType for WidgetType, vfunc in registry.items()
+                               if vfunc(**kwargs)]
+            return indexed
+
+        assert match(instrume='ABC') == [PrefixedWidget, ExactWidget]
+        assert match(instrume='AB') == [PrefixedWidget]
+        assert match(instrume='XYZ', detector='ABC') == [PrefixedWidget, ExactWidget]
+        assert match(instrume='ABCD') == [PrefixedWidget]
+        assert match(instrume=1) == []
+        assert match(style='standard') == [StandardWidget]
+        # The prefixes of the parent class do not apply to the subclass
+        assert match(style='inherited') == [InheritedPrefixWidget]
+
+        # Changes to the registry are picked up
+        registry.pop(StandardWidget)
+        assert match(style='standard') == []
+        factory.register(DuplicateStandardWidget)
+        assert match(style='standard') == [DuplicateStandardWidget]
+        factory.register(ExactWidget, validation_function=external_validation_function)
+        assert match(instrume='ABC', style='external') == [PrefixedWidget, ExactWidget]
@@ -205,6 +205,24 @@ def test_init_with_keycomments(atomic_weights_keycomments, atomic_weights_pruned
     assert orig_dict['keycomments'] == orig_keycomments
 
 
+def test_copy(atomic_weights_keycomments, atomic_weights_pruned_keycomments):
+    """
+    Copy a `MetaDict`. Ensure the copies do not share their keycomments dict.
+    """
+    original = MetaDict(pairs_to_dict(atomic_weights_keycomments))
+    for new in [original.copy(), MetaDict(original)]:
+        assert type(new) is MetaDict
+        check_contents_and_insertion_order(new, atomic_weights_pruned_keycomments)
+        assert new['keycomments'] is not original['keycomments']
+
+        del new['Mercury']
+        new['Neon'] = 10
+        assert 'mercury' in original
+        assert 'neon' not in original
+        assert original['keycomments'] == {'chromium': 'Cr', 'MERCURY': 'Hg'}
+        assert new['keycomments'] == {'chromium': 'Cr'}
+
+
 def test_init_with_illegal_arg():
     """
     Ensure attempt to initialise with a nonsensical data structure is rejected.
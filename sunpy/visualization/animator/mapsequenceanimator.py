@@ -40,6 +40,10 @@ class MapSequenceAnimator(imageanimator.BaseFuncAnimator):
         axes objects of the plot and ``smap`` is the current frames `~sunpy.map.Map` object.
         Any objects returned from this function will have their ``remove()`` method
         called at the start of the next frame to clear them from the plot.
+    cached : `bool`
+        Show the frames rendered and cached by `sunpy.map.MapSequence.render_frames`
+        instead of normalizing and coloring each map when it is shown. The colorbar
+        then shows the norm of the first map.
 
     Notes
     -----
@@ -47,10 +51,11 @@ class MapSequenceAnimator(imageanimator.BaseFuncAnimator):
     the maps in the sequence.
     """
 
-    def __init__(self, mapsequence, annotate=True, **kwargs):
+    def __init__(self, mapsequence, annotate=True, cached=False, **kwargs):
 
         self.mapsequence = mapsequence
         self.annotate = annotate
+        self.frames = mapsequence.render_frames() if cached else None
         self.user_plot_function = kwargs.pop('plot_function',
                                              lambda fig, ax, smap: [])
         # List of object to remove at the start of each plot step
@@ -71,13 +76,16 @@ class MapSequenceAnimator(imageanimator.BaseFuncAnimator):
             self.remove_obj.pop(0).remove()
 
         i = int(val)
-        im.set_array(self.data[i].data)
-        im.set_cmap(self.mapsequence[i].plot_settings['cmap'])
+        if self.frames is not None:
+            im.set_array(self.frames[i])
+        else:
+            im.set_array(self.data[i].data)
+            im.set_cmap(self.mapsequence[i].plot_settings['cmap'])
 
-        norm = deepcopy(self.mapsequence[i].plot_settings['norm'])
-        # The following explicit call is for bugged versions of Astropy's ImageNormalize
-        norm.autoscale_None(self.data[i].data)
-        im.set_norm(norm)
+            norm = deepcopy(self.mapsequence[i].plot_settings['norm'])
+            # The following explicit call is for bugged versions of Astropy's ImageNormalize
+            norm.autoscale_None(self.data[i].data)
+            im.set_norm(norm)
 
         if wcsaxes_compat.is_wcsaxes(im.axes):
             im.axes.reset_wcs(self.mapsequence[i].wcs)
@@ -120,6 +128,8 @@ class MapSequenceAnimator(imageanimator.BaseFuncAnimator):
     def plot_start_image(self, ax):
         im = self.mapsequence[0].plot(
             annotate=self.annotate, axes=ax, **self.imshow_kwargs)
+        if self.frames is not None:
+            im.set_array(self.frames[0])
         self.remove_obj += list(
             self.user_plot_function(self.fig, self.axes, self.mapsequence[0]))
         return im
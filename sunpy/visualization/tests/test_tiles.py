@@ -0,0 +1,115 @@
+import os
+import json
+
+import matplotlib.cm
+import numpy as np
+import PIL.Image
+import pytest
+
+import astropy.units as u
+
+import sunpy.data.test
+import sunpy.map
+from sunpy.visualization.tiles import _pyramid_name, _reduce_level, write_tile_pyramid
+
+
+@pytest.fixture
+def aia_map():
+    return sunpy.map.Map(sunpy.data.test.get_test_filepath('aia_171_level1.fits'))
+
+
+def _read_png(path):
+    with PIL.Image.open(path) as image:
+        return np.asarray(image)
+
+
+def test_reduce_level():
+    data = np.arange(15, dtype=float).reshape(3, 5)
+    data[0, 0] = np.nan
+    reduced = _reduce_level(data)
+    expected = np.array([[(1 + 5 + 6) / 3, (2 + 3 + 7 + 8) / 4, (4 + 9) / 2],
+                         [(10 + 11) / 2, (12 + 13) / 2, 14]])
+    np.testing.assert_allclose(reduced, expected)
+    assert np.isnan(_reduce_level(np.full((2, 2), np.nan))).all()
+
+
+def test_write_tile_pyramid(aia_map, tmp_path):
+    descriptor = write_tile_pyramid(aia_map, str(tmp_path), tile_size=48, max_workers=2)
+    with open(tmp_path / 'pyramid.json') as f:
+        assert json.load(f) == descriptor
+
+    entry, = descriptor['maps']
+    assert entry['date'] == aia_map.date.isot
+    assert entry['wcs']['CRPIX1'] == aia_map.reference_pixel.x.value + 1
+    ny, nx = aia_map.data.shape
+    assert entry['levels'][0] == {'shape': [ny, nx], 'tiles': [-(-ny // 48), -(-nx // 48)]}
+    assert max(entry['levels'][-1]['shape']) <= 48
+    assert max(entry['levels'][-2]['shape']) > 48
+
+    # The full resolution level is the map as it is plotted, from the top
+    norm = aia_map.plot_settings['norm']
+    norm.autoscale_None(aia_map.data)
+    cmap = matplotlib.cm.get_cmap(aia_map.plot_settings['cmap'])
+    image = cmap(norm(aia_map.data), bytes=True)[::-1]
+    tile = _read_png(tmp_path / entry['name'] / '0' / '0_1.png')
+    np.testing.assert_array_equal(tile, image[:48, 48:96])
+    tile = _read_png(tmp_path / entry['name'] / '0' / f'0_{nx // 48}.png')
+    assert tile.shape == (48, nx % 48, 4)
+
+
+def test_write_tile_pyramid_npy(aia_map, tmp_path):
+    mask = np.zeros(aia_map.data.shape, dtype=bool)
+    mask[:2, :2] = True
+    masked_map = sunpy.map.Map(aia_map.data, aia_map.meta, mask=mask)
+    descriptor = write_tile_pyramid(masked_map, str(tmp_path), tile_size=32, tile_format='npy')
+    name = descriptor['maps'][0]['name']
+
+    ny = aia_map.data.shape[0]
+    tile = np.load(tmp_path / name / '0' / f'{(ny - 1) // 32}_0.npy')
+    assert tile.dtype == np.float32
+    bottom = aia_map.data[:ny % 32 or 32, :32].astype(np.float32)
+    bottom[:2, :2] = np.nan
+    np.testing.assert_array_equal(tile, bottom[::-1])
+
+    tile = np.load(tmp_path / name / '1' / '0_0.npy')
+    expected = _reduce_level(np.where(mask, np.nan, aia_map.data))[::-1][:32, :32]
+    np.testing.assert_allclose(tile, expected, rtol=1e-6)
+
+
+def test_write_tile_pyramid_incremental(aia_map, tmp_path):
+    maps = []
+    for minutes in [0, 1, 2]:
+        meta = aia_map.meta.copy()
+        meta['date-obs'] = (aia_map.date + minutes * u.min).isot
+        maps.append(sunpy.map.Map(aia_map.data, meta))
+
+    descriptor = write_tile_pyramid(sunpy.map.MapSequence(maps[1:]), str(tmp_path),
+                                    tile_size=64)
+    assert len(descriptor['maps']) == 2
+    written = {path: os.path.getmtime(path) for path in tmp_path.glob('*/*/*.png')}
+    descriptor = write_tile_pyramid(maps, str(tmp_path), tile_size=64)
+    assert [entry['date'] for entry in descriptor['maps']] == [amap.date.isot for amap in maps]
+    # The pyramids which were already written are left alone
+    assert written
+    for path, mtime in written.items():
+        assert os.path.getmtime(path) == mtime
+
+    with pytest.raises(ValueError, match="64 pixel png tiles"):
+        write_tile_pyramid(maps, str(tmp_path), tile_size=32)
+    with pytest.raises(ValueError, match="tile_format"):
+        write_tile_pyramid(maps, str(tmp_path), tile_format='jpg')
+
+
+def test_write_tile_pyramid_same_date(aia_map, tmp_path):
+    assert _pyramid_name(aia_map) == '20110215T000000.340_SDO_AIA-3_AIA_171Angstrom'
+    meta = aia_map.meta.copy()
+    meta['wavelnth'] = 193
+    other_map = sunpy.map.Map(aia_map.data, meta)
+    # Maps taken at the same time are told apart by their wavelength
+    descriptor = write_tile_pyramid([aia_map, other_map], str(tmp_path), tile_size=512)
+    assert [entry['name'] for entry in descriptor['maps']] == [_pyramid_name(aia_map),
+                                                               _pyramid_name(other_map)]
+    assert (tmp_path / _pyramid_name(other_map) / '0' / '0_0.png').exists()
+
+    with pytest.raises(ValueError, match="same pyramids"):
+        write_tile_pyramid([aia_map, aia_map], str(tmp_path / 'other'), tile_size=512)
@@ -0,0 +1,235 @@
+"""
+This module provides a way to write multi-resolution tile pyramids of maps for
+zoomable viewers.
+"""
+import os
+import re
+import json
+import shutil
+from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from matplotlib import cm, colors
+from matplotlib.image import imsave
+
+from sunpy.map import GenericMap
+
+__all__ = ['write_tile_pyramid']
+
+_DESCRIPTOR = 'pyramid.json'
+_TILE_FORMATS = ['png', 'npy']
+
+
+def write_tile_pyramid(maps, directory, tile_size=256, tile_format='png', overwrite=False,
+                       max_workers=None):
+    """
+    Write multi-resolution tile pyramids of maps to a directory.
+
+    The pyramid of a map has the data at full resolution as level 0, and each
+    following level at half the resolution of the previous one, down to the
+    first level which fits in a single tile. Each level is reduced from the
+    previous one by taking the mean of blocks of 2x2 pixels, as
+    `~sunpy.map.GenericMap.superpixel` does, ignoring NaN and masked pixels.
+    Each level is then cut into square tiles, the tiles along the right and
+    bottom edges being smaller when the level is not a multiple of the tile
+    size.
+
+    PNG tiles are colored with the norm and colormap of the ``plot_settings``
+    of the map. The norm is scaled to the data at full resolution, so all the
+    levels have the same colors. NPY tiles hold the data as ``float32``, with
+    NaN for the masked pixels.
+
+    The pyramids are described by a ``pyramid.json`` file in ``directory``,
+    and the tiles of a level of a map are written to
+    ``<name>/<level>/<row>_<column>.<tile_format>``, where ``name`` is made of
+    the date, observatory, instrument, detector and wavelength of the map and
+    the rows are numbered from the top of the image. Maps written to a
+    directory which already has pyramids are added to them, and maps with the
+    name of a map which is already there are skipped, so the pyramids can be
+    updated as new maps arrive.
+
+    Parameters
+    ----------
+    maps : `~sunpy.map.GenericMap`, `~sunpy.map.MapSequence` or `list`
+        The map or maps to write.
+    directory : `str`
+        The directory to write the pyramids to.
+    tile_size : `int`, optional
+        The size of the tiles in pixels. Defaults to 256.
+    tile_format : {'png', 'npy'}, optional
+        The format of the tiles. Defaults to 'png'.
+    overwrite : `bool`, optional
+        Write the pyramids of maps which are already in ``directory`` again.
+        Defaults to `False`.
+    max_workers : `int`, optional
+        The maximum number of threads used to write the tiles. Defaults to the
+        default of `concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    `dict`
+        The descriptor of the pyramids in ``directory``.
+
+    Raises
+    ------
+    ValueError
+        If several of the maps have the same name.
+
+    Examples
+    --------
+    >>> from sunpy.visualization.tiles import write_tile_pyramid
+    >>> sequence = sunpy.map.Map(files, sequence=True)   # doctest: +SKIP
+    >>> write_tile_pyramid(sequence, 'tiles')   # doctest: +SKIP
+    """
+    if tile_format not in _TILE_FORMATS:
+        raise ValueError(f"tile_format must be one of {_TILE_FORMATS}.")
+    if tile_size < 1:
+        raise ValueError("tile_size must be a positive number of pixels.")
+    if isinstance(maps, GenericMap):
+        maps = [maps]
+    maps = list(maps)
+
+    descriptor = _read_descriptor(directory, tile_size, tile_format)
+    entries = {entry['name']: entry for entry in descriptor['maps']}
+
+    names = [_pyramid_name(amap) for amap in maps]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Several maps would be written to the same pyramids: {duplicates}")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for amap, name in zip(maps, names):
+            if name in entries and not overwrite:
+                continue
+            map_directory = os.path.join(directory, name)
+            if os.path.isdir(map_directory):
+                shutil.rmtree(map_directory)
+            entries[name] = _write_map_pyramid(amap, name, map_directory, tile_size,
+                                               tile_format, executor)
+            # The descriptor is written after each map so that the maps which
+            # have been written are available
+            descriptor['maps'] = sorted(entries.values(),
+                                        key=lambda entry: (entry['date'], entry['name']))
+            _write_descriptor(directory, descriptor)
+
+    return descriptor
+
+
+def _pyramid_name(amap):
+    """
+    The name of the pyramid of a map, from its date and the observatory,
+    instrument, detector and wavelength which identify it.
+    """
+    parts = [amap.date.isot.replace('-', '').replace(':', '')]
+    wavelength = amap.wavelength
+    if wavelength is not None and wavelength.value:
+        wavelength = f"{wavelength.value:g}{wavelength.unit.to_string()}"
+    else:
+        wavelength = ''
+    for part in [amap.observatory, amap.instrument, amap.detector, wavelength]:
+        # Only keep characters which are safe in file names
+        part = re.sub(r'[^A-Za-z0-9.]+', '-', str(part)).strip('-')
+        if part and part not in parts:
+            parts.append(part)
+    return '_'.join(parts)
+
+
+def _read_descriptor(directory, tile_size, tile_format):
+    """
+    The descriptor of the pyramids in a directory, or a new one if there are
+    none, checking that they have the given tiles.
+    """
+    path = os.path.join(directory, _DESCRIPTOR)
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        return {'tile_size': tile_size, 'tile_format': tile_format, 'maps': []}
+
+    with open(path) as f:
+        descriptor = json.load(f)
+    if descriptor['tile_size'] != tile_size or descriptor['tile_format'] != tile_format:
+        raise ValueError(f"The pyramids in {directory} have {descriptor['tile_size']} pixel "
+                         f"{descriptor['tile_format']} tiles.")
+    return descriptor
+
+
+def _write_descriptor(directory, descriptor):
+    """
+    Replace the descriptor of the pyramids in a directory, so that it is never
+    read partially written.
+    """
+    path = os.path.join(directory, _DESCRIPTOR)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(descriptor, f, indent=2)
+    os.replace(path + '.tmp', path)
+
+
+def _write_map_pyramid(amap, name, map_directory, tile_size, tile_format, executor):
+    """
+    Write the tiles of the pyramid of a map and return its entry in the
+    descriptor.
+    """
+    data = np.array(amap.data, dtype=np.float64)
+    if amap.mask is not None:
+        data[amap.mask] = np.nan
+    levels = [data]
+    while max(levels[-1].shape) > tile_size:
+        levels.append(_reduce_level(levels[-1]))
+
+    if tile_format == 'png':
+        norm = deepcopy(amap.plot_settings['norm'])
+        if norm is None:
+            norm = colors.Normalize()
+        norm.autoscale_None(np.ma.masked_invalid(data))
+        cmap = cm.get_cmap(amap.plot_settings['cmap'])
+
+    entry = {'name': name, 'date': amap.date.isot, 'levels': [],
+             'wcs': dict(amap.wcs.to_header())}
+    futures = []
+    for level, level_data in enumerate(levels):
+        # The tiles are numbered from the top of the image
+        if tile_format == 'png':
+            image = cmap(norm(np.ma.masked_invalid(level_data)), bytes=True)[::-1]
+        else:
+            image = level_data.astype(np.float32)[::-1]
+        level_directory = os.path.join(map_directory, str(level))
+        os.makedirs(level_directory)
+
+        nrows = -(-image.shape[0] // tile_size)
+        ncols = -(-image.shape[1] // tile_size)
+        for row in range(nrows):
+            for col in range(ncols):
+                tile = image[row * tile_size:(row + 1) * tile_size,
+                             col * tile_size:(col + 1) * tile_size]
+                path = os.path.join(level_directory, f'{row}_{col}.{tile_format}')
+                futures.append(executor.submit(_write_tile, path, tile, tile_format))
+        entry['levels'].append({'shape': list(level_data.shape), 'tiles': [nrows, ncols]})
+
+    # Raise any exception from writing the tiles
+    for future in futures:
+        future.result()
+    return entry
+
+
+def _write_tile(path, tile, tile_format):
+    if tile_format == 'png':
+        imsave(path, np.ascontiguousarray(tile), format='png')
+    else:
+        np.save(path, tile)
+
+
+def _reduce_level(data):
+    """
+    Half the resolution of an image by taking the mean of the blocks of 2x2
+    pixels, ignoring NaNs. Odd sizes are padded with NaNs.
+    """
+    ny, nx = data.shape
+    padded = np.full((ny + ny % 2, nx + nx % 2), np.nan)
+    padded[:ny, :nx] = data
+    blocks = padded.reshape(padded.shape[0] // 2, 2, padded.shape[1] // 2, 2)
+    valid = ~np.isnan(blocks)
+    total = np.where(valid, blocks, 0).sum(axis=(1, 3))
+    count = valid.sum(axis=(1, 3))
+    # Blocks without any valid pixel are NaN
+    with np.errstate(invalid='ignore'):
+        return total / count